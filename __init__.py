@@ -1,3 +1,5 @@
+from . import operators
+
 rigify_info = {
   'name': "Extensions for Rigify by Gianluca Giampuzzo",
   'author': "Gianluca Giampuzzo",
@@ -7,3 +9,11 @@ rigify_info = {
   'doc_url': "https://github.com/gianlugiampu/gian_extensions_for_rigify/blob/main/README.md",
   'link': "https://github.com/gianlugiampu/gian_extensions_for_rigify",
 }
+
+
+def register():
+    operators.register()
+
+
+def unregister():
+    operators.unregister()
@@ -0,0 +1,58 @@
+import bpy
+
+from . import validate, preflight, draw_cost, capture, mirror, prewarm, preview, rebuild, live_input, shape_sliders, shape_bake
+
+"""
+OPERATORS AND TOOLS PANEL OF THE FEATURE SET
+"""
+
+modules = [
+    validate,
+    preflight,
+    draw_cost,
+    capture,
+    mirror,
+    prewarm,
+    preview,
+    rebuild,
+    live_input,
+    shape_sliders,
+    shape_bake,
+]
+
+
+class DATA_PT_gian_ui_tools(bpy.types.Panel):
+
+    """
+    Tools for gian.ui metarigs and generated rigs, in the Armature properties.
+    """
+
+    bl_label = "Gian UI Tools"
+    bl_space_type = 'PROPERTIES'
+    bl_region_type = 'WINDOW'
+    bl_context = 'data'
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.object is not None and context.object.type == 'ARMATURE'
+
+    def draw(self, context):
+        layout = self.layout
+
+        for module in modules:
+            module.draw_tools(layout, context)
+
+
+def register():
+    for module in modules:
+        module.register()
+
+    bpy.utils.register_class(DATA_PT_gian_ui_tools)
+
+
+def unregister():
+    bpy.utils.unregister_class(DATA_PT_gian_ui_tools)
+
+    for module in reversed(modules):
+        module.unregister()
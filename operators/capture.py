@@ -0,0 +1,82 @@
+import bpy
+import json
+
+from bpy_extras.io_utils import ImportHelper
+
+from .mirror import is_slider_rig
+
+
+class IMPORT_OT_gian_ui_capture_csv(bpy.types.Operator, ImportHelper):
+
+    """
+    Bake facial capture weights from a CSV file onto the slider controls.
+    """
+
+    bl_idname = "import_anim.gian_ui_capture_csv"
+    bl_label = "Import Capture CSV"
+    bl_description = "Bake per-frame blendshape weights from a CSV file onto the UI sliders"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    filename_ext = ".csv"
+    filter_glob: bpy.props.StringProperty(default="*.csv", options={'HIDDEN'})
+
+    mapping_path: bpy.props.StringProperty(
+        name="Mapping", subtype='FILE_PATH',
+        description="JSON file mapping columns to [slider, axis, scale]. Columns named like sliders or their shape keys are used if empty")
+    frame_column: bpy.props.StringProperty(
+        name="Frame Column", description="Column holding the frame numbers. Row order is used if empty")
+    frame_start: bpy.props.IntProperty(name="Start Frame", default=1)
+    chunk_size: bpy.props.IntProperty(name="Chunk Size", default=4096, min=1)
+
+    @classmethod
+    def poll(cls, context):
+        return is_slider_rig(context)
+
+    def execute(self, context):
+        from ..utils.capture import import_capture_csv, read_csv_header
+
+        if self.frame_column and self.frame_column not in read_csv_header(self.filepath):
+            self.report({'ERROR'}, f"No column named '{self.frame_column}' in the CSV header")
+            return {'CANCELLED'}
+
+        mapping = None
+        if self.mapping_path:
+            with open(bpy.path.abspath(self.mapping_path)) as file:
+                mapping = {column: tuple(target) for column, target in json.load(file).items()}
+
+        frames = import_capture_csv(
+            context.object, self.filepath, mapping,
+            frame_column=self.frame_column or None,
+            frame_start=self.frame_start, chunk_size=self.chunk_size)
+
+        self.report({'INFO'}, f"Imported {frames} frames")
+
+        return {'FINISHED'}
+
+
+def draw_tools(layout, context):
+
+    """
+    Draws the capture import tools.
+
+    Args:
+        layout: The UI layout of the tools panel.
+        context: The Blender context.
+    """
+
+    layout.operator(IMPORT_OT_gian_ui_capture_csv.bl_idname, icon='IMPORT')
+
+
+classes = (
+    IMPORT_OT_gian_ui_capture_csv,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
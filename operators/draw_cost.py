@@ -0,0 +1,69 @@
+import bpy
+
+from ..utils.draw_cost import draw_cost_report, DEFAULT_BUDGET
+
+
+class POSE_OT_gian_ui_draw_cost(bpy.types.Operator):
+
+    """
+    Report the viewport draw cost of the custom shapes of the rig.
+    """
+
+    bl_idname = "pose.gian_ui_draw_cost"
+    bl_label = "Widget Draw Cost"
+    bl_description = "Sum the evaluated size of every custom shape per widget kind, bone collection and frame"
+    bl_options = {'REGISTER'}
+
+    max_verts: bpy.props.IntProperty(name="Max Vertices", default=DEFAULT_BUDGET['verts'], min=0)
+    max_edges: bpy.props.IntProperty(name="Max Edges", default=DEFAULT_BUDGET['edges'], min=0)
+    max_faces: bpy.props.IntProperty(name="Max Faces", default=DEFAULT_BUDGET['faces'], min=0)
+    max_modifiers: bpy.props.IntProperty(name="Max Modifiers", default=DEFAULT_BUDGET['modifiers'], min=0)
+    worst: bpy.props.IntProperty(name="Worst Offenders", default=10, min=0)
+
+    @classmethod
+    def poll(cls, context):
+        return context.object is not None and context.object.type == 'ARMATURE'
+
+    def execute(self, context):
+        report = draw_cost_report(context.object)
+        budget = {'verts': self.max_verts, 'edges': self.max_edges,
+                  'faces': self.max_faces, 'modifiers': self.max_modifiers}
+        exceeded = report.over_budget(budget)
+
+        print(report.summary(self.worst))
+
+        if exceeded:
+            details = ", ".join(f"{key} {total}/{limit}" for key, (total, limit) in exceeded.items())
+            self.report({'WARNING'}, f"Over budget: {details}")
+        else:
+            self.report({'INFO'}, f"Within budget: {report.total}")
+
+        return {'FINISHED'}
+
+
+def draw_tools(layout, context):
+
+    """
+    Draws the draw cost tools.
+
+    Args:
+        layout: The UI layout of the tools panel.
+        context: The Blender context.
+    """
+
+    layout.operator(POSE_OT_gian_ui_draw_cost.bl_idname, icon='MOD_WIREFRAME')
+
+
+classes = (
+    POSE_OT_gian_ui_draw_cost,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,90 @@
+import bpy
+
+from .mirror import is_slider_rig
+
+LIVE_PORT = 9050  # utils.live_protocol.LIVE_PORT, repeated so registering does not import numpy and socket
+
+
+class POSE_OT_gian_ui_live_input(bpy.types.Operator):
+
+    """
+    Start or stop driving the UI sliders from a local live input stream.
+    """
+
+    bl_idname = "pose.gian_ui_live_input"
+    bl_label = "Live Input"
+    bl_description = "Drive the UI sliders of the rig from values streamed to a localhost UDP port"
+    bl_options = {'REGISTER'}
+
+    port: bpy.props.IntProperty(name="Port", default=LIVE_PORT, min=1024, max=65535)
+    smoothing: bpy.props.FloatProperty(name="Smoothing", default=0.0, min=0.0, max=0.95,
+                                       description="Ease the sliders towards the received values over several redraws")
+
+    @classmethod
+    def poll(cls, context):
+        return live_input_status() is not None or is_slider_rig(context)
+
+    def execute(self, context):
+        from ..utils.live_input import start_live_input, stop_live_input, live_input_status
+
+        if live_input_status() is not None:
+            stop_live_input()
+            return {'FINISHED'}
+
+        try:
+            start_live_input(context.object, self.port, self.smoothing)
+        except OSError as error:
+            self.report({'ERROR'}, f"Cannot listen on port {self.port}: {error}")
+            return {'CANCELLED'}
+
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        from ..utils.live_input import live_input_status
+
+        if live_input_status() is not None:
+            return self.execute(context)
+
+        return context.window_manager.invoke_props_dialog(self)
+
+
+def draw_tools(layout, context):
+
+    """
+    Draws the live input tools and counters.
+
+    Args:
+        layout: The UI layout of the tools panel.
+        context: The Blender context.
+    """
+
+    from ..utils.live_input import live_input_status
+
+    status = live_input_status()
+
+    if status is None:
+        if is_slider_rig(context):
+            layout.operator(POSE_OT_gian_ui_live_input.bl_idname, icon='PLAY')
+        return
+
+    row = layout.row()
+    row.operator(POSE_OT_gian_ui_live_input.bl_idname, text="Stop Live Input", icon='PAUSE')
+    row.label(text=f"{status['obj']}:{status['port']} {status['received']} frames, "
+                   f"{status['dropped']} dropped, {status['latency']:.1f} ms")
+
+
+classes = (
+    POSE_OT_gian_ui_live_input,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister():
+    stop_live_input()
+
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,105 @@
+import bpy
+
+from ..utils.core import SLIDERS_PROP
+
+MIRROR_MODES = (
+    ('MIRROR', "Mirror", "Swap the .L and .R slider values"),
+    ('LEFT_TO_RIGHT', "Symmetrize .L to .R", "Copy the .L slider values onto .R"),
+    ('RIGHT_TO_LEFT', "Symmetrize .R to .L", "Copy the .R slider values onto .L"),
+)
+
+FROM_LEFT = {'MIRROR': None, 'LEFT_TO_RIGHT': True, 'RIGHT_TO_LEFT': False}
+
+
+def is_slider_rig(context) -> bool:
+
+    """
+    Checks the active object is a generated rig with gian.ui sliders.
+    """
+
+    obj = context.object
+    return obj is not None and obj.type == 'ARMATURE' and SLIDERS_PROP in obj.data
+
+
+class POSE_OT_gian_ui_mirror_sliders(bpy.types.Operator):
+
+    """
+    Mirror or symmetrize the current pose of the UI sliders.
+    """
+
+    bl_idname = "pose.gian_ui_mirror_sliders"
+    bl_label = "Mirror Slider Pose"
+    bl_description = "Mirror or symmetrize the current pose of all the UI sliders at once"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    mode: bpy.props.EnumProperty(name="Mode", items=MIRROR_MODES)
+
+    @classmethod
+    def poll(cls, context):
+        return is_slider_rig(context)
+
+    def execute(self, context):
+        from ..utils.sliders import mirror_slider_pose
+
+        mirror_slider_pose(context.object, FROM_LEFT[self.mode])
+
+        return {'FINISHED'}
+
+
+class POSE_OT_gian_ui_mirror_action(bpy.types.Operator):
+
+    """
+    Mirror or symmetrize the slider animation of the active action.
+    """
+
+    bl_idname = "pose.gian_ui_mirror_action"
+    bl_label = "Mirror Slider Action"
+    bl_description = "Mirror or symmetrize the slider F-Curves of the whole active action"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    mode: bpy.props.EnumProperty(name="Mode", items=MIRROR_MODES)
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.object
+        return (is_slider_rig(context) and obj.animation_data is not None
+                and obj.animation_data.action is not None)
+
+    def execute(self, context):
+        from ..utils.sliders import get_slider_set
+
+        obj = context.object
+        get_slider_set(obj).mirror_action(obj.animation_data.action, FROM_LEFT[self.mode])
+
+        return {'FINISHED'}
+
+
+def draw_tools(layout, context):
+
+    """
+    Draws the mirror tools.
+
+    Args:
+        layout: The UI layout of the tools panel.
+        context: The Blender context.
+    """
+
+    row = layout.row(align=True)
+    row.operator_menu_enum(POSE_OT_gian_ui_mirror_sliders.bl_idname, "mode", icon='MOD_MIRROR')
+    row.operator_menu_enum(POSE_OT_gian_ui_mirror_action.bl_idname, "mode", icon='ACTION')
+
+
+classes = (
+    POSE_OT_gian_ui_mirror_sliders,
+    POSE_OT_gian_ui_mirror_action,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,60 @@
+import bpy
+
+from ..utils.preflight import preflight
+
+
+class POSE_OT_gian_ui_preflight(bpy.types.Operator):
+
+    """
+    Validate the gian.ui bones of the metarig and plan the generation.
+    """
+
+    bl_idname = "pose.gian_ui_preflight"
+    bl_label = "Preflight UI Metarig"
+    bl_description = "Validate the gian.ui parameters and print a dry-run plan of the generation"
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.object is not None and context.object.type == 'ARMATURE'
+
+    def execute(self, context):
+        plan = preflight(context.object)
+        print(plan.summary())
+
+        if not plan.ok:
+            self.report({'ERROR'}, f"{len(plan.errors)} errors, see the console: {plan.errors[0]}")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, f"Preflight OK: {len(plan.bones)} bones, "
+                              f"{plan.library_loads} library loads, see the console")
+
+        return {'FINISHED'}
+
+
+def draw_tools(layout, context):
+
+    """
+    Draws the preflight tools.
+
+    Args:
+        layout: The UI layout of the tools panel.
+        context: The Blender context.
+    """
+
+    layout.operator(POSE_OT_gian_ui_preflight.bl_idname, icon='CHECKMARK')
+
+
+classes = (
+    POSE_OT_gian_ui_preflight,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,98 @@
+import bpy
+
+from ..utils.preview import enable_preview, disable_preview, refresh_preview, is_previewing, stop_preview
+from ..utils.layout import get_ui_rig_kind
+
+
+def is_ui_metarig(context) -> bool:
+
+    """
+    Checks the active object is an armature with gian.ui rig types.
+    """
+
+    obj = context.object
+    return (obj is not None and obj.type == 'ARMATURE'
+            and any(get_ui_rig_kind(pbone.rigify_type) for pbone in obj.pose.bones))
+
+
+class POSE_OT_gian_ui_preview(bpy.types.Operator):
+
+    """
+    Toggle the live widget preview of the metarig.
+    """
+
+    bl_idname = "pose.gian_ui_preview"
+    bl_label = "Preview Widgets"
+    bl_description = "Show the generated widgets as custom shapes of the metarig bones, updated when the rig parameters change"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return is_ui_metarig(context)
+
+    def execute(self, context):
+        obj = context.object
+
+        if is_previewing(obj):
+            disable_preview(obj)
+        else:
+            enable_preview(obj)
+
+        return {'FINISHED'}
+
+
+class POSE_OT_gian_ui_refresh_preview(bpy.types.Operator):
+
+    """
+    Rebuild all the preview widgets of the metarig.
+    """
+
+    bl_idname = "pose.gian_ui_refresh_preview"
+    bl_label = "Refresh Preview"
+    bl_description = "Rebuild all the preview widgets, e.g. after moving bones"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return is_previewing(context.object)
+
+    def execute(self, context):
+        refresh_preview(context.object)
+
+        return {'FINISHED'}
+
+
+def draw_tools(layout, context):
+
+    """
+    Draws the preview tools.
+
+    Args:
+        layout: The UI layout of the tools panel.
+        context: The Blender context.
+    """
+
+    if not is_ui_metarig(context):
+        return
+
+    row = layout.row(align=True)
+    row.operator(POSE_OT_gian_ui_preview.bl_idname, icon='HIDE_OFF', depress=is_previewing(context.object))
+    row.operator(POSE_OT_gian_ui_refresh_preview.bl_idname, text="", icon='FILE_REFRESH')
+
+
+classes = (
+    POSE_OT_gian_ui_preview,
+    POSE_OT_gian_ui_refresh_preview,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister():
+    stop_preview()
+
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,142 @@
+import bpy
+import os
+
+from ..utils.prewarm import start_prewarm, stop_prewarm, prewarm_status, prewarm_requested
+from ..utils.widget_engine import benchmark_backends, timing_summary
+
+
+class WM_OT_gian_ui_prewarm(bpy.types.Operator):
+
+    """
+    Load and compile the widget assets in the background.
+    """
+
+    bl_idname = "wm.gian_ui_prewarm"
+    bl_label = "Prewarm Widget Assets"
+    bl_description = "Load and compile the widget node groups and font in the background, so the next generate runs at full speed"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        start_prewarm(first_interval=0.0)
+
+        return {'FINISHED'}
+
+
+class WM_OT_gian_ui_build_widget_pack(bpy.types.Operator):
+
+    """
+    Evaluate every base widget shape and store them in the widget pack.
+    """
+
+    bl_idname = "wm.gian_ui_build_widget_pack"
+    bl_label = "Build Widget Pack"
+    bl_description = "Evaluate every box and control design once and store them next to the widget library, so generation reads them instead of running Geometry Nodes"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        from ..utils.wgt import buildWidgetPack, widgetPack
+
+        try:
+            path = buildWidgetPack()
+        except OSError as error:
+            self.report({'ERROR'}, f"Cannot write the widget pack: {error}")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, f"Stored {len(widgetPack())} widget shapes in {path}")
+
+        return {'FINISHED'}
+
+
+class WM_OT_gian_ui_benchmark_widgets(bpy.types.Operator):
+
+    """
+    Time every widget backend on the same designs.
+    """
+
+    bl_idname = "wm.gian_ui_benchmark_widgets"
+    bl_label = "Benchmark Widget Backends"
+    bl_description = "Build every box and control design with each available backend and print the timings to the console"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        # Importing utils.wgt registers the bundled backends
+        from ..utils import wgt  # noqa: F401
+        from ..utils.widget_pack import BOX_VARIANTS, CTRL_VARIANTS
+
+        inputs = [('BOX', variant) for variant in BOX_VARIANTS]
+        inputs += [('CTRL', variant) for variant in CTRL_VARIANTS]
+        inputs.append(('TEXT', ("Benchmark",)))
+
+        totals = {}
+        for kind, args in inputs:
+            for backend, seconds in benchmark_backends(kind, *args).items():
+                if seconds is not None:
+                    total = totals.setdefault((kind, backend), [0, 0.0])
+                    total[0] += 1
+                    total[1] += seconds
+
+        print("gian.ui widget backends (best of 3 per design):")
+        for (kind, backend), (count, seconds) in sorted(totals.items()):
+            print(f"  {kind:<6} {backend:<11} {count:3d} designs {seconds / count * 1000:8.2f} ms each")
+        print("gian.ui widget builds this session:")
+        print(timing_summary())
+
+        self.report({'INFO'}, "Widget backend timings printed to the console")
+
+        return {'FINISHED'}
+
+
+def draw_tools(layout, context):
+
+    """
+    Draws the prewarm tools and status.
+
+    Args:
+        layout: The UI layout of the tools panel.
+        context: The Blender context.
+    """
+
+    status = prewarm_status()
+    row = layout.row()
+    row.operator(WM_OT_gian_ui_prewarm.bl_idname, icon='TIME')
+
+    if status['state'] == 'RUNNING':
+        row.label(text=f"{status['step']}/{status['total']} {status['current']}")
+    elif status['state'] == 'DONE':
+        row.label(text=f"Ready ({status['seconds']:.2f}s)", icon='CHECKMARK')
+    elif status['state'] == 'FAILED':
+        row.label(text=status['error'], icon='ERROR')
+
+    row = layout.row()
+    row.operator(WM_OT_gian_ui_build_widget_pack.bl_idname, icon='PACKAGE')
+    # Redraws only look at the file: mapping the pack here would keep it open
+    from ..utils.widget_pack import widget_pack_path
+
+    path = widget_pack_path()
+    if os.path.exists(path):
+        row.label(text=f"Packed ({os.stat(path).st_size / 1024:.0f} KB)", icon='CHECKMARK')
+    else:
+        row.label(text="Not packed")
+    layout.operator(WM_OT_gian_ui_benchmark_widgets.bl_idname, icon='TIME')
+
+
+classes = (
+    WM_OT_gian_ui_prewarm,
+    WM_OT_gian_ui_build_widget_pack,
+    WM_OT_gian_ui_benchmark_widgets,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+    if prewarm_requested():
+        start_prewarm()
+
+
+def unregister():
+    stop_prewarm()
+
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
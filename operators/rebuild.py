@@ -0,0 +1,58 @@
+import bpy
+
+from ..utils.rebuild import find_target_rig, rebuild_widgets
+from .preview import is_ui_metarig
+
+
+class POSE_OT_gian_ui_rebuild_widgets(bpy.types.Operator):
+
+    """
+    Rebuild the widgets of the generated rig from the metarig parameters.
+    """
+
+    bl_idname = "pose.gian_ui_rebuild_widgets"
+    bl_label = "Rebuild Widgets Only"
+    bl_description = "Rewrite the widgets of the generated rig from the gian.ui parameters of the metarig, without generating again"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return is_ui_metarig(context) and find_target_rig(context.object) is not None
+
+    def execute(self, context):
+        report = rebuild_widgets(context.object, find_target_rig(context.object))
+        self.report({'WARNING'} if report.skipped else {'INFO'}, report.summary())
+
+        for name, reason in report.skipped:
+            print(f"gian.ui rebuild: {name}: {reason}")
+
+        return {'FINISHED'}
+
+
+def draw_tools(layout, context):
+
+    """
+    Draws the rebuild tools.
+
+    Args:
+        layout: The UI layout of the tools panel.
+        context: The Blender context.
+    """
+
+    if is_ui_metarig(context):
+        layout.operator(POSE_OT_gian_ui_rebuild_widgets.bl_idname, icon='MOD_BUILD')
+
+
+classes = (
+    POSE_OT_gian_ui_rebuild_widgets,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,102 @@
+import bpy
+import time
+
+from .mirror import is_slider_rig
+from .shape_sliders import shape_key_names
+
+
+class POSE_OT_gian_ui_bake_shape_keys(bpy.types.Operator):
+
+    """
+    Bake the slider animation onto the shape keys of a mesh.
+    """
+
+    bl_idname = "pose.gian_ui_bake_shape_keys"
+    bl_label = "Bake Sliders to Shape Keys"
+    bl_description = "Key the shape keys driven by or named like the UI sliders from the slider animation, for export"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    mesh: bpy.props.StringProperty(name="Mesh", description="The mesh whose shape keys get keyed")
+    frame_start: bpy.props.IntProperty(name="Start Frame", default=1)
+    frame_end: bpy.props.IntProperty(name="End Frame", default=250)
+    step: bpy.props.IntProperty(name="Frame Step", default=1, min=1)
+    clear_drivers: bpy.props.BoolProperty(
+        name="Remove Drivers", default=False,
+        description="Remove the drivers of the baked shape keys, which would override the baked keys")
+
+    @classmethod
+    def poll(cls, context):
+        return is_slider_rig(context)
+
+    def invoke(self, context, event):
+        if not self.mesh:
+            meshes = [obj for obj in context.selected_objects if shape_key_names(obj)]
+            self.mesh = meshes[0].name if meshes else ''
+
+        self.frame_start = context.scene.frame_start
+        self.frame_end = context.scene.frame_end
+
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop_search(self, "mesh", bpy.data, "objects")
+        row = layout.row(align=True)
+        row.prop(self, "frame_start")
+        row.prop(self, "frame_end")
+        layout.prop(self, "step")
+        layout.prop(self, "clear_drivers")
+
+    def execute(self, context):
+        from ..utils.shape_bake import bake_shape_keys
+
+        mesh_obj = bpy.data.objects.get(self.mesh)
+
+        if mesh_obj is None or not shape_key_names(mesh_obj):
+            self.report({'ERROR'}, "Pick a mesh with shape keys")
+            return {'CANCELLED'}
+
+        if self.frame_end < self.frame_start:
+            self.report({'ERROR'}, "The end frame is before the start frame")
+            return {'CANCELLED'}
+
+        start = time.perf_counter()
+        report = bake_shape_keys(context.object, mesh_obj, self.frame_start, self.frame_end, self.step,
+                                 clear_drivers=self.clear_drivers, scene=context.scene)
+
+        if not report.frames:
+            self.report({'WARNING'}, "No shape key matches a slider")
+            return {'CANCELLED'}
+
+        self.report({'WARNING'} if report.driven else {'INFO'},
+                    f"{report.summary()} in {time.perf_counter() - start:.2f}s")
+
+        return {'FINISHED'}
+
+
+def draw_tools(layout, context):
+
+    """
+    Draws the shape key bake tools.
+
+    Args:
+        layout: The UI layout of the tools panel.
+        context: The Blender context.
+    """
+
+    layout.operator(POSE_OT_gian_ui_bake_shape_keys.bl_idname, icon='KEY_HLT')
+
+
+classes = (
+    POSE_OT_gian_ui_bake_shape_keys,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
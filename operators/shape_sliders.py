@@ -0,0 +1,196 @@
+import bpy
+import time
+
+from ..utils.layout import get_ui_rig_kind, collect_footprints, union_bounds
+from ..utils.shape_sliders import plan_shape_sliders, FRAME_GAP
+
+
+def shape_key_names(mesh_obj) -> list[str]:
+
+    """
+    Returns the shape key names of a mesh object, without its reference key.
+    """
+
+    keys = mesh_obj.data.shape_keys if mesh_obj.type == 'MESH' else None
+    if keys is None:
+        return []
+
+    return [block.name for block in keys.key_blocks if block != keys.reference_key]
+
+
+def driven_shape_keys(obj) -> set[str]:
+
+    """
+    Returns the shape keys already driven by a slider of a metarig.
+    """
+
+    return {pbone.rigify_parameters.shape_key for pbone in obj.pose.bones
+            if get_ui_rig_kind(pbone.rigify_type) == 'SLIDER' and pbone.rigify_parameters.shape_key}
+
+
+def free_corner(obj, gap: float) -> tuple[float, float]:
+
+    """
+    Returns a top left corner right of every bone and control of a metarig, top aligned.
+    """
+
+    extents = None
+    for bone in obj.data.bones:
+        head, tail = bone.head_local, bone.tail_local
+        extents = union_bounds(extents, (min(head.x, tail.x), min(head.z, tail.z),
+                                         max(head.x, tail.x), max(head.z, tail.z)))
+    for footprint in collect_footprints(obj)[0]:
+        extents = union_bounds(extents, footprint.bounds)
+
+    if extents is None:
+        return (0.0, 0.0)
+
+    return (extents[2] + gap, extents[3])
+
+
+def emit_shape_sliders(obj, frames, sliders, length: float, title: bool):
+
+    """
+    Creates the planned frame and slider bones in a metarig.
+
+    The plan must be made with the metarig bone names as used names, so no planned
+    bone replaces or gets renamed by an existing one.
+
+    Args:
+        obj: The metarig armature object, in object mode.
+        frames: The planned frames, parents first.
+        sliders: The planned sliders.
+        length: The slider bone length.
+        title: Whether sliders show their shape key as title, and frames their group.
+    """
+
+    bpy.ops.object.mode_set(mode='EDIT')
+    edit_bones = obj.data.edit_bones
+
+    for item in (*frames, *sliders):
+        bone = edit_bones.new(item.name)
+        bone.head = (item.x, 0.0, item.z)
+        bone.tail = (item.x, 0.0, item.z + length)
+        bone.roll = 0.0
+
+    for frame in frames:
+        if frame.parent:
+            edit_bones[frame.name].parent = edit_bones[frame.parent]
+    for slider in sliders:
+        edit_bones[slider.name].parent = edit_bones[slider.frame]
+
+    bpy.ops.object.mode_set(mode='OBJECT')
+    pose_bones = obj.pose.bones
+
+    for frame in frames:
+        pbone = pose_bones[frame.name]
+        pbone.rigify_type = "ui.frame"
+        pbone.rigify_parameters.title = title
+        pbone.rigify_parameters.custom_title = frame.title
+
+    for slider in sliders:
+        pbone = pose_bones[slider.name]
+        pbone.rigify_type = "ui.slider"
+        pbone.rigify_parameters.slider_type = slider.slider_type
+        pbone.rigify_parameters.shape_key = slider.shape_key
+        pbone.rigify_parameters.custom_title = slider.shape_key if title else ''
+
+
+class POSE_OT_gian_ui_sliders_from_shape_keys(bpy.types.Operator):
+
+    """
+    Add a frame of sliders per group of shape keys of a mesh.
+    """
+
+    bl_idname = "pose.gian_ui_sliders_from_shape_keys"
+    bl_label = "Sliders from Shape Keys"
+    bl_description = "Add one gian.ui slider per shape key of a mesh, grouped in packed frames by name and side"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    mesh: bpy.props.StringProperty(name="Mesh", description="The mesh whose shape keys get sliders")
+    length: bpy.props.FloatProperty(name="Slider Length", default=0.2, min=0.001)
+    title: bpy.props.BoolProperty(name="Titles", default=True, description="Show the shape key name on each slider and the group on each frame")
+    large_pattern: bpy.props.StringProperty(name="Large Pattern", default='',
+                                            description="Regular expression of the shape keys getting LARGE sliders")
+
+    @classmethod
+    def poll(cls, context):
+        return context.object is not None and context.object.type == 'ARMATURE' and context.mode in {'OBJECT', 'POSE'}
+
+    def invoke(self, context, event):
+        if not self.mesh:
+            meshes = [obj for obj in context.selected_objects if shape_key_names(obj)]
+            self.mesh = meshes[0].name if meshes else ''
+
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop_search(self, "mesh", bpy.data, "objects")
+        layout.prop(self, "length")
+        layout.prop(self, "title")
+        layout.prop(self, "large_pattern")
+
+    def execute(self, context):
+        mesh_obj = bpy.data.objects.get(self.mesh)
+        names = shape_key_names(mesh_obj) if mesh_obj else []
+
+        if not names:
+            self.report({'ERROR'}, "Pick a mesh with shape keys")
+            return {'CANCELLED'}
+
+        obj = context.object
+        driven = driven_shape_keys(obj)
+        skipped = sum(name in driven for name in names)
+        names = [name for name in names if name not in driven]
+
+        if not names:
+            self.report({'INFO'}, "Every shape key already has a slider")
+            return {'CANCELLED'}
+
+        start = time.perf_counter()
+        mode = context.mode
+        frames, sliders = plan_shape_sliders(names, self.length, self.title, self.large_pattern or None,
+                                             used=obj.data.bones.keys(),
+                                             corner=free_corner(obj, self.length * FRAME_GAP))
+
+        if mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+        emit_shape_sliders(obj, frames, sliders, self.length, self.title)
+        if mode == 'POSE':
+            bpy.ops.object.mode_set(mode='POSE')
+
+        message = f"Added {len(sliders)} sliders in {len(frames)} frames in {time.perf_counter() - start:.2f}s"
+        if skipped:
+            message += f", {skipped} shape keys already having a slider skipped"
+        self.report({'INFO'}, message)
+
+        return {'FINISHED'}
+
+
+def draw_tools(layout, context):
+
+    """
+    Draws the shape key tools.
+
+    Args:
+        layout: The UI layout of the tools panel.
+        context: The Blender context.
+    """
+
+    layout.operator(POSE_OT_gian_ui_sliders_from_shape_keys.bl_idname, icon='SHAPEKEY_DATA')
+
+
+classes = (
+    POSE_OT_gian_ui_sliders_from_shape_keys,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,111 @@
+import bpy
+
+from ..utils.layout import collect_footprints, find_overlaps
+
+# Overlapping pairs found by the last validation, per metarig name
+overlap_results: dict[str, list[tuple[str, str]]] = {}
+
+
+class POSE_OT_gian_ui_validate_overlaps(bpy.types.Operator):
+
+    """
+    Find overlapping gian.ui sliders, texts and frames before generating.
+    """
+
+    bl_idname = "pose.gian_ui_validate_overlaps"
+    bl_label = "Validate UI Overlaps"
+    bl_description = "Find overlapping gian.ui sliders, texts and frames on the metarig"
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.object is not None and context.object.type == 'ARMATURE'
+
+    def execute(self, context):
+        obj = context.object
+
+        footprints, ancestors = collect_footprints(obj)
+        pairs = find_overlaps(footprints, ancestors)
+        overlap_results[obj.name] = pairs
+
+        if pairs:
+            self.report({'WARNING'}, f"{len(pairs)} overlapping pairs in {len(footprints)} controls")
+        else:
+            self.report({'INFO'}, f"No overlaps in {len(footprints)} controls")
+
+        return {'FINISHED'}
+
+
+class POSE_OT_gian_ui_select_bones(bpy.types.Operator):
+
+    """
+    Select a pair of bones and frame them in the viewport.
+    """
+
+    bl_idname = "pose.gian_ui_select_bones"
+    bl_label = "Select Bones"
+    bl_description = "Select the overlapping bones"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    bone_a: bpy.props.StringProperty()
+    bone_b: bpy.props.StringProperty()
+
+    @classmethod
+    def poll(cls, context):
+        return context.object is not None and context.object.type == 'ARMATURE'
+
+    def execute(self, context):
+        obj = context.object
+        bones = obj.data.bones
+
+        if obj.mode != 'POSE':
+            bpy.ops.object.mode_set(mode='POSE')
+
+        for bone in bones:
+            bone.select = False
+
+        for name in (self.bone_a, self.bone_b):
+            bone = bones.get(name)
+            if bone:
+                bone.select = True
+                bones.active = bone
+
+        if context.area and context.area.type == 'VIEW_3D':
+            bpy.ops.view3d.view_selected()
+
+        return {'FINISHED'}
+
+
+def draw_tools(layout, context):
+
+    """
+    Draws the overlap validation tools and the last results.
+
+    Args:
+        layout: The UI layout of the tools panel.
+        context: The Blender context.
+    """
+
+    col = layout.column()
+    col.operator(POSE_OT_gian_ui_validate_overlaps.bl_idname, icon='SELECT_INTERSECT')
+
+    for bone_a, bone_b in overlap_results.get(context.object.name, []):
+        op = col.operator(POSE_OT_gian_ui_select_bones.bl_idname, text=f"{bone_a} / {bone_b}", icon='RESTRICT_SELECT_OFF')
+        op.bone_a = bone_a
+        op.bone_b = bone_b
+
+
+classes = (
+    POSE_OT_gian_ui_validate_overlaps,
+    POSE_OT_gian_ui_select_bones,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
@@ -1,11 +1,13 @@
 import bpy
-from mathutils import Matrix
 
 from rigify.base_rig import BaseRig
 from rigify.utils.naming import strip_org
 from rigify.utils.layers import ControlLayersOption
+from rigify.base_generate import GeneratorPlugin
 
-from ...utils.wgt import createTextWidget, fixTextWidget
+from ...utils.core import WGT_PREFIX, TEXT_FONT
+from ...utils.progress import GenerationProgress
+from ...utils.preview import drop_preview_shape, update_preview_text
 
 from typing import Optional
 
@@ -62,6 +64,12 @@ class Rig(BaseRig):
 
         bone = self.get_bone(self.bones.org)
         self.range = bone.length
+        drop_preview_shape(bone)
+
+        # Bones showing the same label share one mesh
+        self.text_cache = TextWidgetCache(self.generator)
+        self.progress = GenerationProgress(self.generator)
+        self.progress.add(self)
     
     def generate_bones(self):
 
@@ -110,15 +118,19 @@ class Rig(BaseRig):
         Generates the widgets for the rig.
         """
 
+        from ...utils.wgt import createTextWidget
+
         bones = self.bones
         params = self.params
         bone = self.get_bone(bones.ctrl.master)
         
         csm_text = bone.name if '@name' in self.custom_text else self.custom_text
+        self.progress.begin_widgets(self)
 
         # Create control widget:
         text_wgt = createTextWidget(rig=self.obj, bone_name=bones.ctrl.master, bone_transform_name=None)
-        fixTextWidget(text_wgt, txt=csm_text)
+        self.text_cache.assign(text_wgt, csm_text)
+        self.progress.end_widgets(self, [text_wgt])
 
         bpy.context.view_layer.objects.active = self.obj   
 
@@ -133,7 +145,7 @@ class Rig(BaseRig):
         """
 
         super().add_parameters(params)
-        params.custom_text = bpy.props.StringProperty(name="Custom Text", default='')
+        params.custom_text = bpy.props.StringProperty(name="Custom Text", default='', update=update_preview_text)
 
     @classmethod
     def parameters_ui(cls, layout, params):
@@ -154,6 +166,72 @@ class Rig(BaseRig):
         col.label(text="write @name to write the bone name.", icon='INFO')
 
 
+class TextWidgetCache(GeneratorPlugin):
+
+    """
+    Shares one text mesh between all the custom text widgets with the same label.
+
+    Text widgets use the bone size, so the geometry only depends on the resolved
+    string and the font.
+
+    Attributes:
+        meshes: The text meshes built during this generation, keyed by (text, font).
+        labels: The distinct labels seen during this generation.
+        total: The number of custom text widgets seen during this generation.
+    """
+
+    meshes: dict[tuple[str, str], bpy.types.Mesh]
+    labels: set[tuple[str, str]]
+    total: int
+
+    def __init__(self, generator):
+        super().__init__(generator)
+
+        self.meshes = {}
+        self.labels = set()
+        self.total = 0
+
+        GenerationProgress(generator).add_note(self.summary)
+
+    def assign(self, obj, text: str):
+
+        """
+        Gives a text widget its geometry, building it only for new labels.
+
+        Args:
+            obj: The widget object, or None if an existing widget was reused.
+            text: The resolved label, with @name already expanded.
+        """
+
+        key = (text, TEXT_FONT)
+        self.labels.add(key)
+        self.total += 1
+
+        if obj is None:
+            return
+
+        mesh = self.meshes.get(key)
+
+        if mesh is None:
+            from ...utils.wgt import fixTextWidget
+            fixTextWidget(obj, txt=text)
+            obj.data.name = f"{WGT_PREFIX}{self.obj.name}_text_{text}"
+            self.meshes[key] = obj.data
+        else:
+            empty_mesh = obj.data
+            obj.data = mesh
+            bpy.data.meshes.remove(empty_mesh)
+
+    def summary(self) -> str:
+
+        """
+        Returns the unique versus total labels of this generation.
+        """
+
+        return (f"{len(self.labels)} unique labels for {self.total} text widgets, "
+                f"{len(self.meshes)} text meshes built")
+
+
 def set_params(pbone, attr, value):
 
     """
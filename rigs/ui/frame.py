@@ -1,12 +1,13 @@
 import bpy
-from mathutils import Matrix
 
 from rigify.base_rig import BaseRig, RigUtility
 from rigify.utils.naming import strip_org
 from rigify.utils.layers import ControlLayersOption
 from rigify import base_generate
 
-from ...utils.wgt import createFrameWidget, fixFrameWidget
+from ...utils.layout import FrameRect, compute_frame_layout, frame_has_title
+from ...utils.progress import GenerationProgress
+from ...utils.preview import drop_preview_shape, update_preview, update_preview_text
 
 from typing import Optional
 
@@ -50,25 +51,6 @@ class Rig(BaseRig, RigUtility, base_generate.BaseGenerator):
         
         return pose_bone.name
     
-    def getChildrenList(self):
-
-        if self.obj.mode != 'EDIT':
-            bpy.ops.object.mode_set(mode='EDIT')
-
-        parent_master = self.obj.pose.bones[self.bones.org]
-        
-        children_list = []
-
-        for b in self.obj.pose.bones:
-            if b.parent == parent_master:
-                children_list.append(b)
-                print(b.name)
-
-        if self.obj.mode != 'OBJECT':
-            bpy.ops.object.mode_set(mode='OBJECT')
-        
-        return children_list
-
     def initialize(self):
 
         """
@@ -80,13 +62,15 @@ class Rig(BaseRig, RigUtility, base_generate.BaseGenerator):
 
         bone = self.get_bone(self.bones.org)
         self.range = bone.length
+        drop_preview_shape(bone)
 
         self.title = self.params.title
         self.custom_title = self.params.custom_title
 
-        parent = self.getChildrenList()
-        print(parent)
-        self.parent_list = parent.copy() 
+        # Every frame of the rig is laid out once, before any bone is moved
+        self.layout = FrameLayoutPlugin(self.generator)
+        self.progress = GenerationProgress(self.generator)
+        self.progress.add(self)
     
     def generate_bones(self):
 
@@ -135,16 +119,27 @@ class Rig(BaseRig, RigUtility, base_generate.BaseGenerator):
         Generates the widgets for the rig.
         """
 
+        from ...utils.wgt import createFrameWidget, fixFrameWidget, sharedPanelArrays, mergeWidgetArrays
+
         bones = self.bones
         params = self.params
-        par = self.parent_list
+        rect = self.layout.get_rect(bones.org)
+        self.progress.begin_widgets(self)
 
         frame_bone = self.get_bone(bones.ctrl.master)
         frame_head = frame_bone.head
 
         # Create control widget:
         frame_wgt = createFrameWidget(rig=self.obj, bone_name=bones.ctrl.master, bone_transform_name=None)
-        fixFrameWidget(frame_wgt, self.obj, par, self.title, self.custom_title, frame_head)
+        fixFrameWidget(frame_wgt, rect, self.title, self.custom_title, frame_head)
+
+        # Draw the boxes of the shared panel sliders in the frame space
+        sliders = self.layout.get_shared_panels(bones.org)
+        if frame_wgt != None and sliders:
+            panels = [(slider.bones.ctrl.master, slider.range, slider.panel_design()) for slider in sliders]
+            mergeWidgetArrays(frame_wgt, sharedPanelArrays(self.obj, bones.ctrl.master, panels))
+
+        self.progress.end_widgets(self, [frame_wgt])
 
         bpy.context.view_layer.objects.active = self.obj   
 
@@ -160,8 +155,8 @@ class Rig(BaseRig, RigUtility, base_generate.BaseGenerator):
 
         super().add_parameters(params)
         
-        params.title = bpy.props.BoolProperty(name='Title', default=True)
-        params.custom_title = bpy.props.StringProperty(name="Custom Title", default='')
+        params.title = bpy.props.BoolProperty(name='Title', default=True, update=update_preview)
+        params.custom_title = bpy.props.StringProperty(name="Custom Title", default='', update=update_preview_text)
 
     @classmethod
     def parameters_ui(cls, layout, params):
@@ -185,6 +180,70 @@ class Rig(BaseRig, RigUtility, base_generate.BaseGenerator):
             col.prop(params, "custom_title")
 
 
+class FrameLayoutPlugin(base_generate.GeneratorPlugin):
+
+    """
+    Computes the rectangles of all the frames of the generated rig in one pass.
+
+    Attributes:
+        rects: The frame rectangles keyed by ORG bone name.
+        shared_panels: The shared panel slider rigs of each frame, keyed by ORG bone name.
+    """
+
+    rects: dict[str, FrameRect]
+    shared_panels: dict[str, list[BaseRig]]
+
+    def __init__(self, generator):
+
+        """
+        Lays out the frame hierarchy from the ORG bones, before any rig moves them.
+
+        Args:
+            generator: The running Rigify generator.
+        """
+
+        super().__init__(generator)
+
+        frames = {rig.base_bone: frame_has_title(rig.params)
+                  for rig in generator.rig_list if isinstance(rig, Rig)}
+        self.rects = compute_frame_layout(self.obj, frames)
+        self.shared_panels = {}
+
+    def get_rect(self, org_name: str) -> FrameRect:
+
+        """
+        Returns the rectangle of a frame.
+
+        Args:
+            org_name: The ORG bone name of the frame rig.
+
+        Returns:
+            The frame rectangle in armature space.
+        """
+
+        return self.rects[org_name]
+
+    def add_shared_panel(self, org_name: str, slider: BaseRig):
+
+        """
+        Registers a slider whose box is drawn by the frame widget.
+
+        Args:
+            org_name: The ORG bone name of the frame rig.
+            slider: The slider rig.
+        """
+
+        self.shared_panels.setdefault(org_name, []).append(slider)
+
+    def get_shared_panels(self, org_name: str) -> list[BaseRig]:
+
+        """
+        Returns the shared panel sliders of a frame.
+        """
+
+        return self.shared_panels.get(org_name, [])
+
+
 def set_params(pbone, attr, value):
 
     """
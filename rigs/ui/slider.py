@@ -1,14 +1,20 @@
 import bpy
+import time
 from mathutils import Matrix
 
 from rigify.base_rig import BaseRig
-from rigify.utils.naming import strip_org
+from rigify.base_generate import GeneratorPlugin
+from rigify.utils.naming import strip_org, change_name_side, get_name_side, Side
 from rigify.utils.bones import set_bone_orientation
 from rigify.rigs.basic.raw_copy import RelinkConstraintsMixin
 from rigify.utils.layers import ControlLayersOption
 
-from ...utils.wgt import createBoxWidget, createControlWidget, fixBoxWidget, fixControlWidget
 from ...utils.mech import make_constraint
+from ...utils.progress import GenerationProgress
+from ...utils.preview import drop_preview_shape, update_preview, update_preview_text
+from ...utils.core import CLAMP_CODES, SLIDERS_PROP, LARGE_ORIENTATION, slider_limits, box_key, ctrl_key
+
+from .frame import Rig as FrameRig, FrameLayoutPlugin
 
 class Rig(BaseRig, RelinkConstraintsMixin):
 
@@ -65,9 +71,21 @@ class Rig(BaseRig, RelinkConstraintsMixin):
         self.fill_slider = self.params.fill_slider
         self.minimal_design = self.params.minimal_design
         self.fill_pan = self.params.fill_pan
+        self.shape_key = self.params.shape_key
 
         bone = self.get_bone(self.bones.org)
         self.range = bone.length
+        drop_preview_shape(bone)
+        self.title = self.org_name if '@name' in self.custom_title else self.custom_title
+
+        self.registry = SliderRegistry(self.generator)
+        self.progress = GenerationProgress(self.generator)
+        self.progress.add(self)
+
+        # Shared panel: the frame widget draws the box, no PAN bone is created
+        self.shared_panel = self.params.shared_panel and isinstance(self.rigify_parent, FrameRig)
+        if self.shared_panel:
+            FrameLayoutPlugin(self.generator).add_shared_panel(self.rigify_parent.base_bone, self)
     
     def generate_bones(self):
 
@@ -79,16 +97,17 @@ class Rig(BaseRig, RelinkConstraintsMixin):
         
         # Make a control bone (copy of original).
         self.bones.ctrl.master = self.copy_bone(bones.org, self.org_name, parent=True, length=self.range)
-        self.bones.ctrl.panel = self.copy_bone(bones.org, f"PAN_{self.org_name}", length=self.range)                
+        if not self.shared_panel:
+            self.bones.ctrl.panel = self.copy_bone(bones.org, f"PAN_{self.org_name}", length=self.range)                
 
         if 'LARGE' in self.slider_type:
           # Change the bone orientation to default if it is LARGE
-          m = Matrix(((1.0, 0.0, 0.0, 0.0),
-                      (0.0, 0.0, -1.0, 0.0),
-                      (0.0, 1.0, 0.0, 0.0),
-                      (0.0, 0.0, 0.0, 1.0))) # Y up bone
+          m = Matrix(LARGE_ORIENTATION) # Y up bone
           set_bone_orientation(self.obj, self.bones.ctrl.master, m)
-          set_bone_orientation(self.obj, self.bones.ctrl.panel, m)
+          if not self.shared_panel:
+            set_bone_orientation(self.obj, self.bones.ctrl.panel, m)
+
+        self.registry.add(self)
 
     def parent_bones(self):
         
@@ -98,6 +117,11 @@ class Rig(BaseRig, RelinkConstraintsMixin):
 
         bones = self.bones
         new_parent = self.relink_bone_parent(bones.org)
+        if self.shared_panel:
+            if new_parent:
+                self.set_bone_parent(bones.ctrl.master, new_parent)
+            return
+
         self.set_bone_parent(bones.ctrl.master, bones.ctrl.panel)
         if new_parent:
             self.set_bone_parent(bones.ctrl.panel, new_parent)
@@ -111,7 +135,8 @@ class Rig(BaseRig, RelinkConstraintsMixin):
         bones = self.bones
         self.copy_bone_properties(bones.org, bones.ctrl.master)
         self.get_bone(bones.ctrl.master).use_custom_shape_bone_size = True
-        self.get_bone(bones.ctrl.panel).use_custom_shape_bone_size = True
+        if not self.shared_panel:
+            self.get_bone(bones.ctrl.panel).use_custom_shape_bone_size = True
 
         ctrl_list = [self.bones.ctrl.master]
         ControlLayersOption.SLIDER.assign_rig(self, ctrl_list)
@@ -126,27 +151,15 @@ class Rig(BaseRig, RelinkConstraintsMixin):
         # Constrain the original bone.
         self.make_constraint(bones.org, 'COPY_TRANSFORMS', bones.ctrl.master, insert_index=0)
         # Constraints for the slider
-        x = 1 * self.range
-        y = 1 * self.range
-        x_neg = -1 * self.range
-        y_neg = -1 * self.range
-        if self.clamp_up_down == 'DOWN':
-            y = 0
-        elif self.clamp_up_down == 'UP':
-            y_neg = 0
-        if not self.is_large():
-            # clamp to 0 if not negative
-            min_limit = (0, y_neg, 0, 0)
-            max_limit = (0, y, 0)
-        else:
-            min_limit = (x_neg, y_neg, 0)
-            max_limit = (x, y, 0)
+        limits = slider_limits(self.slider_type, self.clamp_up_down, self.range)
         make_constraint(
             self.get_bone(bones.ctrl.master), 'LIMIT_LOCATION', 
             space='LOCAL', use_transform_limit=True, 
-            min_xyz=min_limit,
-            max_xyz=max_limit
+            min_xyz=limits.min_xyz,
+            max_xyz=limits.max_xyz
         )
+        if self.shared_panel:
+            return
         make_constraint(
             self.get_bone(bones.ctrl.panel), 'LIMIT_LOCATION', 
             space='LOCAL', use_transform_limit=True, 
@@ -164,6 +177,18 @@ class Rig(BaseRig, RelinkConstraintsMixin):
       """
 
       return 'LARGE' in self.slider_type
+
+    def panel_design(self) -> dict:
+
+      """
+      Returns the design parameters of the box widget of the slider.
+
+      Returns:
+          The keyword arguments of fixBoxWidget, without the object.
+      """
+
+      return dict(design=self.slider_type, clp=self.clamp_up_down, txt=self.title,
+                  minimal=self.minimal_design, fill=self.fill_pan)
     
     def generate_widgets(self):
 
@@ -171,19 +196,27 @@ class Rig(BaseRig, RelinkConstraintsMixin):
         Generates the widgets for the rig.
         """
 
+        # utils.wgt loads Rigify's widget and feature set modules, only needed from here
+        from ...utils.wgt import createBoxWidget, createControlWidget, fixBoxWidget, fixControlWidget
+
         bones = self.bones
-        params = self.params
-        typology = params.slider_type
-        offset = (0, 0, 0)
-        bone = self.get_bone(bones.ctrl.master)
-        title = bone.name if '@name' in self.custom_title else self.custom_title
-
-        # Create control widget:
-        box_wgt = createBoxWidget(rig=self.obj, bone_name=bones.ctrl.panel, bone_transform_name=None)
-        ctrl_wgt = createControlWidget(rig=self.obj, bone_name=bones.ctrl.master, bone_transform_name=None)
-        
-        fixBoxWidget(box_wgt, design=typology, clp=self.clamp_up_down, txt=title, minimal=self.minimal_design, fill=self.fill_pan)
+        self.progress.begin_widgets(self)
+
+        # Create control widget, shared with the opposite side slider of the same design:
+        ctrl_wgt = createControlWidget(rig=self.obj, bone_name=bones.ctrl.master, bone_transform_name=None,
+                                       mirror_key=ctrl_key(self.fill_slider, self.fill_pan))
         fixControlWidget(ctrl_wgt, fill_it=self.fill_slider, off=self.fill_pan)
+
+        # Shared panels are merged in the frame widget instead
+        if not self.shared_panel:
+            design = self.panel_design()
+            mirror_key = None if design['txt'] else box_key(design['design'], design['clp'], design['minimal'], design['fill'])
+            box_wgt = createBoxWidget(rig=self.obj, bone_name=bones.ctrl.panel, bone_transform_name=None,
+                                      mirror_key=mirror_key)
+            fixBoxWidget(box_wgt, **design)
+            self.progress.end_widgets(self, [ctrl_wgt, box_wgt])
+        else:
+            self.progress.end_widgets(self, [ctrl_wgt])
         
         bpy.context.view_layer.objects.active = self.obj   
 
@@ -200,13 +233,19 @@ class Rig(BaseRig, RelinkConstraintsMixin):
         super().add_parameters(params)
         ControlLayersOption.SLIDER = ControlLayersOption('slider', description="Layers for the Slider controls to be on")
 
-        params.slider_type = bpy.props.EnumProperty(name="Type", items=(('SMALL', "Small", "Small Slider"), ('LARGE', "Large", "Large Slider")))
+        params.slider_type = bpy.props.EnumProperty(name="Type", items=(('SMALL', "Small", "Small Slider"), ('LARGE', "Large", "Large Slider")), update=update_preview)
 
-        params.clamp_up_down = bpy.props.EnumProperty(name="Clamp", items=(('NONE', "None", ""), ('UP', "Clamp Up", "Cut the up area"), ('DOWN', "Clamp Down", "Cut the down area")))
-        params.custom_title = bpy.props.StringProperty(name="Title", default='')
-        params.fill_slider = bpy.props.BoolProperty(name='Fill Slider', default=False)
-        params.minimal_design = bpy.props.BoolProperty(name='Minimal Slider', default=False)
-        params.fill_pan = bpy.props.BoolProperty(name='Fill PAN', default=False)
+        params.clamp_up_down = bpy.props.EnumProperty(name="Clamp", items=(('NONE', "None", ""), ('UP', "Clamp Up", "Cut the up area"), ('DOWN', "Clamp Down", "Cut the down area")), update=update_preview)
+        params.custom_title = bpy.props.StringProperty(name="Title", default='', update=update_preview_text)
+        params.fill_slider = bpy.props.BoolProperty(name='Fill Slider', default=False, update=update_preview)
+        params.minimal_design = bpy.props.BoolProperty(name='Minimal Slider', default=False, update=update_preview)
+        params.fill_pan = bpy.props.BoolProperty(name='Fill PAN', default=False, update=update_preview)
+        params.shared_panel = bpy.props.BoolProperty(
+            name='Shared Panel', default=False,
+            description="When parented to a frame, draw the panel in the frame widget instead of a PAN bone")
+        params.shape_key = bpy.props.StringProperty(
+            name='Shape Key', default='',
+            description="The shape key driven by this slider, matched when baking or importing weights")
 
         ControlLayersOption.SLIDER.add_parameters(params)
 
@@ -235,6 +274,9 @@ class Rig(BaseRig, RelinkConstraintsMixin):
         if not params.minimal_design:
             col.prop(params, "fill_pan")
 
+        col.prop(params, "shared_panel")
+        col.prop(params, "shape_key")
+
         cls.add_relink_constraints_ui(layout, params)
         if params.relink_constraints:
             col = layout.column()
@@ -243,6 +285,66 @@ class Rig(BaseRig, RelinkConstraintsMixin):
         ControlLayersOption.SLIDER.parameters_ui(layout, params)
 
 
+SIDE_CODES = {Side.LEFT: 1, Side.MIDDLE: 0, Side.RIGHT: -1}
+
+
+class SliderRegistry(GeneratorPlugin):
+
+    """
+    Collects every slider of the generation and stores the slider table on the rig.
+
+    The table is read back by utils.sliders to access all the slider values at once.
+
+    Attributes:
+        sliders: The slider rigs of this generation.
+    """
+
+    sliders: list[Rig]
+
+    def __init__(self, generator):
+        super().__init__(generator)
+
+        self.sliders = []
+
+    def add(self, rig: Rig):
+
+        """
+        Registers a slider rig, once its control bone exists.
+
+        Args:
+            rig: The slider rig.
+        """
+
+        self.sliders.append(rig)
+
+    def finalize(self):
+
+        """
+        Writes the slider table, sorted by control name for a stable ordering.
+        """
+
+        sliders = sorted(self.sliders, key=lambda rig: rig.bones.ctrl.master)
+        names = [rig.bones.ctrl.master for rig in sliders]
+        index = {name: i for i, name in enumerate(names)}
+
+        # Pair .L/.R controls once, so mirroring is a single permutation at runtime
+        sides = [get_name_side(name) for name in names]
+        mirror = [index.get(change_name_side(name, Side.RIGHT if side == Side.LEFT else Side.LEFT), i)
+                  if side != Side.MIDDLE else i
+                  for i, (name, side) in enumerate(zip(names, sides))]
+
+        self.obj.data[SLIDERS_PROP] = {
+            "names": names,
+            "range": [rig.range for rig in sliders],
+            "large": [int(rig.is_large()) for rig in sliders],
+            "clamp": [CLAMP_CODES.get(rig.clamp_up_down, 0) for rig in sliders],
+            "side": [SIDE_CODES[side] for side in sides],
+            "mirror": mirror,
+            "shape_keys": [rig.shape_key for rig in sliders],
+            "stamp": int(time.time() * 1000) % 2**31,
+        }
+
+
 def set_params(pbone, attr, value):
 
     """
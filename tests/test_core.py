@@ -0,0 +1,74 @@
+import os
+import sys
+import doctest
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import core  # noqa: E402
+from utils.core import (  # noqa: E402
+    BOX_SOCKETS, CTRL_SOCKETS, CLAMP_CODES, slider_limits, box_socket_values, ctrl_socket_values
+)
+
+"""
+CORE CHECKS
+
+The examples of utils/core.py run here too, next to the cases they leave out:
+
+    python -m unittest discover -s tests
+"""
+
+
+def load_tests(loader, tests, pattern):
+    tests.addTests(doctest.DocTestSuite(core))
+    return tests
+
+
+class SliderLimitsTest(unittest.TestCase):
+
+    def test_small_sliders_only_travel_along_y(self):
+        for clamp in CLAMP_CODES:
+            limits = slider_limits('SMALL', clamp, 0.3)
+            self.assertEqual((limits.min_xyz[0], limits.max_xyz[0]), (0.0, 0.0))
+            self.assertEqual((limits.min_xyz[2], limits.max_xyz[2]), (0.0, 0.0))
+
+    def test_clamping_removes_half_of_the_y_travel(self):
+        self.assertEqual(slider_limits('SMALL', 'NONE', 0.5)[:], ((0.0, -0.5, 0.0), (0.0, 0.5, 0.0)))
+        self.assertEqual(slider_limits('SMALL', 'UP', 0.5)[:], ((0.0, 0.0, 0.0), (0.0, 0.5, 0.0)))
+        self.assertEqual(slider_limits('SMALL', 'DOWN', 0.5)[:], ((0.0, -0.5, 0.0), (0.0, 0.0, 0.0)))
+
+    def test_large_sliders_travel_along_x_whatever_the_clamp(self):
+        for clamp in CLAMP_CODES:
+            limits = slider_limits('LARGE', clamp, 2)
+            self.assertEqual((limits.min_xyz[0], limits.max_xyz[0]), (-2.0, 2.0))
+
+    def test_length_is_converted_to_float(self):
+        limits = slider_limits('LARGE', 'NONE', 1)
+        self.assertTrue(all(isinstance(value, float) for value in limits.min_xyz + limits.max_xyz))
+
+
+class SocketValuesTest(unittest.TestCase):
+
+    def test_box_sockets_are_all_written(self):
+        values = box_socket_values('LARGE', 'UP', 'Jaw', 1, 0)
+
+        self.assertEqual(set(values), set(BOX_SOCKETS.values()))
+        self.assertEqual(values[BOX_SOCKETS['design']], 1.0)
+        self.assertEqual(values[BOX_SOCKETS['clamp']], CLAMP_CODES['UP'])
+        self.assertEqual(values[BOX_SOCKETS['text']], 'Jaw')
+        self.assertIs(values[BOX_SOCKETS['minimal']], True)
+        self.assertIs(values[BOX_SOCKETS['fill']], False)
+
+    def test_unknown_clamp_falls_back_to_down(self):
+        self.assertEqual(box_socket_values('SMALL', 'SIDEWAYS', '', False, False)[BOX_SOCKETS['clamp']],
+                         CLAMP_CODES['DOWN'])
+
+    def test_ctrl_offset_follows_the_option(self):
+        # The offset input used to receive its socket name, which always read as enabled
+        self.assertIs(ctrl_socket_values(True, False)[CTRL_SOCKETS['offset']], False)
+        self.assertIs(ctrl_socket_values(False, True)[CTRL_SOCKETS['offset']], True)
+        self.assertIs(ctrl_socket_values(0, 1)[CTRL_SOCKETS['fill']], False)
+
+
+if __name__ == "__main__":
+    unittest.main()
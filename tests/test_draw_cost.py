@@ -0,0 +1,100 @@
+import os
+import sys
+import unittest
+
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.core import WGT_KIND_PROP  # noqa: E402
+from utils.draw_cost import enclosing_frame, draw_cost_report  # noqa: E402
+
+"""
+DRAW COST CHECKS
+
+Runs on a fake rig shaped like a generated one: ORG bones keep the metarig
+hierarchy, controls hang from their panel or the root.
+
+    python -m unittest discover -s tests
+"""
+
+
+class FakeShape(dict):
+
+    """
+    A widget object: custom properties plus the attributes the estimate reads.
+    """
+
+    def __init__(self, name: str, kind: str, verts: int):
+        super().__init__({WGT_KIND_PROP: kind})
+        self.name_full = name
+        self.type = 'MESH'
+        self.modifiers = []
+        self.data = SimpleNamespace(vertices=[0] * verts, edges=[0] * verts, polygons=[], loops=[])
+
+
+class FakeBones(dict):
+
+    def __iter__(self):
+        return iter(self.values())
+
+
+def generated_rig() -> SimpleNamespace:
+
+    """
+    A face frame containing an eyes frame, which contains a slider with a panel and
+    a shared panel slider.
+    """
+
+    bones = FakeBones()
+
+    def add(name, parent=None, shape=None):
+        bones[name] = SimpleNamespace(name=name, parent=bones[parent] if parent else None, custom_shape=shape,
+                                      bone=SimpleNamespace(collections=[]))
+
+    add('root')
+    add('ORG-face', 'root')
+    add('ORG-eyes', 'ORG-face')
+    add('ORG-helper', 'ORG-eyes')
+    add('ORG-blink', 'ORG-helper')
+    add('ORG-squint', 'ORG-eyes')
+    add('face', 'root', FakeShape('WGT-face', 'FRAME', 10))
+    add('eyes', 'ORG-face', FakeShape('WGT-eyes', 'FRAME', 20))
+    add('PAN_blink', 'root', FakeShape('WGT-PAN_blink', 'BOX', 4))
+    add('blink', 'PAN_blink', FakeShape('WGT-blink', 'CTRL', 8))
+    add('squint', 'ORG-eyes', FakeShape('WGT-squint', 'CTRL', 8))
+
+    return SimpleNamespace(pose=SimpleNamespace(bones=bones))
+
+
+class EnclosingFrameTest(unittest.TestCase):
+
+    def test_slider_frame_is_found_through_the_org_bones(self):
+        rig = generated_rig()
+
+        self.assertEqual(enclosing_frame(rig, 'blink'), 'eyes')
+        self.assertEqual(enclosing_frame(rig, 'PAN_blink'), 'eyes')
+        self.assertEqual(enclosing_frame(rig, 'squint'), 'eyes')
+        self.assertEqual(enclosing_frame(rig, 'eyes'), 'face')
+        self.assertIsNone(enclosing_frame(rig, 'face'))
+        self.assertIsNone(enclosing_frame(rig, 'root'))
+
+    def test_cache_gives_the_same_answers(self):
+        rig = generated_rig()
+        cache = {}
+
+        for name in ('squint', 'blink', 'PAN_blink', 'eyes', 'face'):
+            self.assertEqual(enclosing_frame(rig, name, cache), enclosing_frame(rig, name))
+
+    def test_report_breaks_the_cost_down_per_frame(self):
+        report = draw_cost_report(generated_rig())
+
+        self.assertEqual(set(report.frames), {'eyes', 'face'})
+        self.assertEqual(report.frames['eyes'].bones, 3)
+        self.assertEqual(report.frames['eyes'].verts, 4 + 8 + 8)
+        self.assertEqual(report.frames['face'].verts, 20)
+        self.assertEqual(report.total.bones, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
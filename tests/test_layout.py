@@ -0,0 +1,169 @@
+import os
+import sys
+import unittest
+
+from types import SimpleNamespace
+
+# utils/layout.py does not need Blender: import it from the repository root, like `python -m`
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.layout import (  # noqa: E402
+    FRAME_EMPTY_SIZE, FrameRect, Footprint, pad_frame, compute_frame_layout, find_overlaps
+)
+
+"""
+LAYOUT CHECKS
+
+Runs in plain CPython, on fake armatures exposing the few attributes the layout reads:
+
+    python -m unittest discover -s tests
+"""
+
+
+def make_armature(bones: list[tuple]) -> SimpleNamespace:
+
+    """
+    Builds a fake armature object.
+
+    Args:
+        bones: The (name, parent name or None, (head x, z), (tail x, z), rigify_type, title text)
+            of each bone, parents first. An empty title text leaves the title option on.
+    """
+
+    created = {}
+    pose_bones = []
+
+    for name, parent, head, tail, rigify_type, title in bones:
+        bone = SimpleNamespace(
+            name=name,
+            parent=created[parent] if parent else None,
+            head_local=SimpleNamespace(x=head[0], y=0.0, z=head[1]),
+            tail_local=SimpleNamespace(x=tail[0], y=0.0, z=tail[1]),
+        )
+        created[name] = bone
+        pose_bones.append(SimpleNamespace(bone=bone, rigify_type=rigify_type,
+                                          rigify_parameters=SimpleNamespace(title=True, custom_title=title)))
+
+    return SimpleNamespace(pose=SimpleNamespace(bones=pose_bones))
+
+
+class PadFrameTest(unittest.TestCase):
+
+    def assertRect(self, rect: FrameRect, expected: tuple):
+        self.assertEqual(len(rect), len(expected))
+        for value, wanted in zip(rect, expected):
+            self.assertAlmostEqual(value, wanted)
+
+    def test_empty_frame_is_centered_on_the_head(self):
+        size = FRAME_EMPTY_SIZE
+        self.assertRect(pad_frame(None, (1.0, 2.0), False), (1.0 - size, 2.0 - size, 1.0 + size, 2.0 + size, 0.0))
+
+    def test_padding_follows_the_content_size(self):
+        self.assertRect(pad_frame((0.0, 0.0, 10.0, 4.0), (0.0, 0.0), False), (-1.0, -0.4, 11.0, 4.4, 0.0))
+
+    def test_title_band_follows_the_padded_width(self):
+        rect = pad_frame((0.0, 0.0, 10.0, 4.0), (0.0, 0.0), True)
+        self.assertAlmostEqual(rect.title, 12.0 * 0.15)
+        self.assertAlmostEqual(rect.outer[3], 4.4 + 12.0 * 0.15)
+
+    def test_vertical_content_borrows_the_vertical_padding(self):
+        self.assertRect(pad_frame((0.0, 0.0, 0.0, 2.0), (0.0, 0.0), False), (-0.2, -0.2, 0.2, 2.2, 0.0))
+
+    def test_point_content_gets_the_minimum_padding(self):
+        self.assertRect(pad_frame((1.0, 1.0, 1.0, 1.0), (0.0, 0.0), False), (0.9, 0.9, 1.1, 1.1, 0.0))
+
+
+class FrameLayoutTest(unittest.TestCase):
+
+    def setUp(self):
+        self.armature = make_armature([
+            ('outer', None, (0.0, 0.0), (0.0, 1.0), 'gian.ui.frame', ''),
+            ('inner', 'outer', (0.0, 0.0), (0.0, 1.0), 'gian.ui.frame', 'Inner'),
+            ('slider', 'inner', (0.0, 0.0), (0.0, 2.0), 'gian.ui.slider', ''),
+            ('label', 'outer', (4.0, 0.0), (4.0, 1.0), 'gian.ui.custom_text', ''),
+            ('empty', None, (10.0, 10.0), (10.0, 11.0), 'ui.frame', ''),
+        ])
+
+    def test_frames_are_detected_from_the_rig_types(self):
+        self.assertEqual(set(compute_frame_layout(self.armature)), {'outer', 'inner', 'empty'})
+
+    def test_inner_frame_pads_its_bones(self):
+        rect = compute_frame_layout(self.armature)['inner']
+        for value, wanted in zip(rect, (-0.2, -0.2, 0.2, 2.2, 0.4 * 0.15)):
+            self.assertAlmostEqual(value, wanted)
+
+    def test_outer_frame_pads_the_inner_frame_with_its_title(self):
+        rects = compute_frame_layout(self.armature)
+        inner_top = 2.2 + 0.4 * 0.15
+
+        # Children extents: the inner frame with its title band, and the label bone
+        width, height = 4.0 + 0.2, inner_top + 0.2
+        expected = (-0.2 - width * 0.1, -0.2 - height * 0.1, 4.0 + width * 0.1, inner_top + height * 0.1, 0.0)
+        for value, wanted in zip(rects['outer'], expected):
+            self.assertAlmostEqual(value, wanted)
+
+        outer, inner = rects['outer'].outer, rects['inner'].outer
+        self.assertTrue(outer[0] < inner[0] and outer[1] < inner[1] and outer[2] > inner[2] and outer[3] > inner[3])
+
+    def test_title_without_text_reserves_no_band(self):
+        rects = compute_frame_layout(self.armature)
+        self.assertEqual(rects['outer'].title, 0.0)
+        self.assertEqual(rects['empty'].title, 0.0)
+
+    def test_frame_without_children_uses_the_empty_size(self):
+        rect = compute_frame_layout(self.armature)['empty']
+        self.assertEqual(rect, pad_frame(None, (10.0, 10.0), False))
+
+    def test_given_frames_replace_the_detection(self):
+        rects = compute_frame_layout(self.armature, {'inner': False})
+        self.assertEqual(set(rects), {'inner'})
+        self.assertEqual(rects['inner'].title, 0.0)
+
+    def test_frame_under_a_plain_bone(self):
+        armature = make_armature([
+            ('root', None, (0.0, 0.0), (0.0, 1.0), '', ''),
+            ('frame', 'root', (5.0, 5.0), (5.0, 6.0), 'gian.ui.frame', ''),
+            ('slider', 'frame', (5.0, 5.0), (5.0, 7.0), 'gian.ui.slider', ''),
+        ])
+        self.assertEqual(set(compute_frame_layout(armature)), {'frame'})
+
+
+class OverlapTest(unittest.TestCase):
+
+    def test_overlapping_and_touching_controls(self):
+        footprints = [
+            Footprint('b', 'SLIDER', (0.5, 0.5, 1.5, 1.5)),
+            Footprint('a', 'SLIDER', (0.0, 0.0, 1.0, 1.0)),
+            Footprint('c', 'SLIDER', (1.5, 0.0, 2.5, 1.0)),
+            Footprint('d', 'TEXT', (5.0, 5.0, 6.0, 6.0)),
+        ]
+        # b and c share an edge only, which is not an overlap
+        self.assertEqual(find_overlaps(footprints), [('a', 'b')])
+
+    def test_pairs_spanning_many_cells_are_reported_once(self):
+        footprints = [Footprint(f's{i}', 'SLIDER', (20.0 + i * 2, 0.0, 21.0 + i * 2, 1.0)) for i in range(5)]
+        footprints += [
+            Footprint('big', 'TEXT', (0.0, 0.0, 10.0, 10.0)),
+            Footprint('wide', 'TEXT', (5.0, 5.0, 15.0, 15.0)),
+        ]
+        self.assertEqual(find_overlaps(footprints), [('big', 'wide')])
+
+    def test_frames_do_not_overlap_their_content(self):
+        footprints = [
+            Footprint('frame', 'FRAME', (-1.0, -1.0, 3.0, 3.0)),
+            Footprint('a', 'SLIDER', (0.0, 0.0, 1.0, 1.0)),
+            Footprint('b', 'SLIDER', (0.5, 0.5, 1.5, 1.5)),
+            Footprint('stray', 'SLIDER', (2.5, 2.5, 3.5, 3.5)),
+        ]
+        ancestors = {'a': {'frame'}, 'b': {'frame'}, 'stray': set()}
+
+        self.assertEqual(find_overlaps(footprints, ancestors), [('a', 'b'), ('frame', 'stray')])
+        self.assertEqual(find_overlaps(footprints),
+                         [('a', 'b'), ('a', 'frame'), ('b', 'frame'), ('frame', 'stray')])
+
+    def test_no_footprints(self):
+        self.assertEqual(find_overlaps([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.live_protocol import (  # noqa: E402
+    LIVE_VALUES, LIVE_SEQ_MASK, decode_header, decode_values, encode_values, sequence_step
+)
+
+"""
+LIVE PROTOCOL CHECKS
+
+    python -m unittest discover -s tests
+"""
+
+
+class SequenceStepTest(unittest.TestCase):
+
+    def test_next_datagram_and_gaps(self):
+        self.assertEqual(sequence_step(41, 42), 1)
+        self.assertEqual(sequence_step(41, 45), 4)
+
+    def test_gap_across_the_wrap(self):
+        self.assertEqual(sequence_step(LIVE_SEQ_MASK, 0), 1)
+        self.assertEqual(sequence_step(LIVE_SEQ_MASK - 1, 2), 4)
+
+    def test_late_datagrams_step_backwards(self):
+        self.assertEqual(sequence_step(45, 43), -2)
+        self.assertEqual(sequence_step(1, LIVE_SEQ_MASK), -2)
+        self.assertEqual(sequence_step(7, 7), 0)
+
+
+class ValuesDatagramTest(unittest.TestCase):
+
+    def test_values_round_trip(self):
+        packet = encode_values([0, 3], np.array([[0.5, -1.0], [0.25, 0.0]], dtype=np.float32), seq=LIVE_SEQ_MASK)
+        kind, count, seq, _ = decode_header(memoryview(packet))
+        records = decode_values(memoryview(packet), count)
+
+        self.assertEqual((kind, count, seq), (LIVE_VALUES, 2, LIVE_SEQ_MASK))
+        self.assertEqual(records['slot'].tolist(), [0, 3])
+        self.assertEqual(records['x'].tolist(), [0.5, 0.25])
+        self.assertEqual(records['y'].tolist(), [-1.0, 0.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
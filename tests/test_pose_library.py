@@ -0,0 +1,121 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.pose_library import PoseLibrary  # noqa: E402
+
+"""
+POSE LIBRARY CHECKS
+
+Saves and loads libraries in a temporary directory, without Blender:
+
+    python -m unittest discover -s tests
+"""
+
+NAMES = ['eye.L', 'eye.R', 'jaw']
+
+
+def pose_values(seed: float) -> np.ndarray:
+
+    """
+    Returns distinct (N, 2) values for a pose.
+    """
+
+    return (np.arange(len(NAMES) * 2, dtype=np.float32).reshape(-1, 2) + seed) / 10
+
+
+class PoseLibraryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'poses.bin')
+
+        self.library = PoseLibrary(NAMES)
+        for i, pose in enumerate(('rest', 'smile', 'blink')):
+            self.library.add(pose, pose_values(i))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_save_and_load_round_trip(self):
+        self.library.save(self.path)
+        loaded = PoseLibrary.load(self.path)
+
+        self.assertEqual(loaded.names, NAMES)
+        self.assertEqual(loaded.poses, ['rest', 'smile', 'blink'])
+        np.testing.assert_array_equal(loaded.data, self.library.data)
+
+    def test_load_maps_the_pose_data(self):
+        self.library.save(self.path)
+        loaded = PoseLibrary.load(self.path)
+
+        self.assertIsInstance(loaded.data, np.memmap)
+        np.testing.assert_array_equal(loaded.get('smile'), pose_values(1))
+
+    def test_empty_library_round_trip(self):
+        PoseLibrary(NAMES).save(self.path)
+        loaded = PoseLibrary.load(self.path)
+
+        self.assertEqual(len(loaded), 0)
+        self.assertEqual(loaded.data.shape, (0, len(NAMES), 2))
+
+    def test_editing_a_mapped_library_leaves_the_file_alone(self):
+        self.library.save(self.path)
+        loaded = PoseLibrary.load(self.path)
+
+        loaded.add('smile', pose_values(9))
+        loaded.add('pout', pose_values(5))
+
+        np.testing.assert_array_equal(PoseLibrary.load(self.path).get('smile'), pose_values(1))
+        np.testing.assert_array_equal(loaded.get('smile'), pose_values(9))
+        self.assertEqual(loaded.poses, ['rest', 'smile', 'blink', 'pout'])
+
+    def test_save_over_the_mapped_file(self):
+        self.library.save(self.path)
+        loaded = PoseLibrary.load(self.path)
+
+        loaded.add('pout', pose_values(5))
+        loaded.save(self.path)
+        reloaded = PoseLibrary.load(self.path)
+
+        self.assertEqual(reloaded.poses, ['rest', 'smile', 'blink', 'pout'])
+        np.testing.assert_array_equal(reloaded.get('rest'), pose_values(0))
+        np.testing.assert_array_equal(reloaded.get('pout'), pose_values(5))
+
+    def test_remove_from_mapped_data(self):
+        self.library.save(self.path)
+        loaded = PoseLibrary.load(self.path)
+
+        loaded.remove('smile')
+
+        self.assertEqual(loaded.poses, ['rest', 'blink'])
+        self.assertNotIn('smile', loaded)
+        np.testing.assert_array_equal(loaded.get('blink'), pose_values(2))
+        self.assertEqual(len(PoseLibrary.load(self.path)), 3)
+
+    def test_mix_weights_the_poses(self):
+        mixed = self.library.mix({'smile': 0.5, 'blink': 2.0})
+        np.testing.assert_allclose(mixed, pose_values(1) * 0.5 + pose_values(2) * 2.0, rtol=1e-6)
+
+        self.library.save(self.path)
+        np.testing.assert_allclose(PoseLibrary.load(self.path).mix({'smile': 0.5, 'blink': 2.0}), mixed, rtol=1e-6)
+
+    def test_interpolate_between_two_poses(self):
+        np.testing.assert_allclose(self.library.interpolate('rest', 'blink', 0.25),
+                                   pose_values(0) * 0.75 + pose_values(2) * 0.25, rtol=1e-6)
+
+    def test_not_a_library(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'not a pose library')
+
+        with self.assertRaises(ValueError):
+            PoseLibrary.load(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
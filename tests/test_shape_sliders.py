@@ -0,0 +1,99 @@
+import os
+import sys
+import unittest
+
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.layout import Footprint, compute_frame_layout, find_overlaps  # noqa: E402
+from utils.shape_sliders import plan_shape_sliders, slider_size  # noqa: E402
+
+"""
+SHAPE SLIDER PLAN CHECKS
+
+    python -m unittest discover -s tests
+"""
+
+LENGTH = 0.2
+SHAPE_KEYS = ['eyeBlinkLeft', 'eyeBlinkRight', 'eyeBlink_L', 'jawOpen', 'mouthSmileLeft', 'mouthSmileRight',
+              'browInnerUp', 'cheekPuff', 'noseSneerLeft', 'tongueOut', 'custom'] + [f'extra{i}' for i in range(20)]
+
+
+def emitted_armature(frames, sliders) -> SimpleNamespace:
+
+    """
+    Builds a fake armature with the bones emit_shape_sliders creates.
+    """
+
+    bones = {}
+    pose_bones = []
+
+    for item, parent, rigify_type in [(frame, frame.parent, 'ui.frame') for frame in frames] + \
+                                     [(slider, slider.frame, 'ui.slider') for slider in sliders]:
+        bone = SimpleNamespace(name=item.name, parent=bones[parent] if parent else None,
+                               head_local=SimpleNamespace(x=item.x, y=0.0, z=item.z),
+                               tail_local=SimpleNamespace(x=item.x, y=0.0, z=item.z + LENGTH))
+        bones[item.name] = bone
+        pose_bones.append(SimpleNamespace(bone=bone, rigify_type=rigify_type,
+                                          rigify_parameters=SimpleNamespace(title=True, custom_title=item.name)))
+
+    return SimpleNamespace(pose=SimpleNamespace(bones=pose_bones))
+
+
+class ShapeSliderPlanTest(unittest.TestCase):
+
+    def setUp(self):
+        self.frames, self.sliders = plan_shape_sliders(SHAPE_KEYS, LENGTH, True, large_pattern='jaw')
+
+    def test_bones_carry_the_side_and_the_shape_key(self):
+        names = {slider.shape_key: slider.name for slider in self.sliders}
+
+        self.assertEqual(names['eyeBlinkLeft'], 'eyeBlink.L')
+        self.assertEqual(names['eyeBlinkRight'], 'eyeBlink.R')
+        self.assertEqual(names['eyeBlink_L'], 'eyeBlink.L.001')
+        self.assertEqual(names['jawOpen'], 'jawOpen')
+        self.assertEqual(sorted(names), sorted(SHAPE_KEYS))
+
+    def test_frames_match_the_generated_layout(self):
+        rects = compute_frame_layout(emitted_armature(self.frames, self.sliders))
+
+        self.assertEqual(set(rects), {frame.name for frame in self.frames})
+        for frame in self.frames:
+            self.assertEqual(rects[frame.name], frame.rect)
+
+    def test_names_avoid_existing_bones_and_fit_blender(self):
+        long_key = 'mouth' + 'Stretch' * 10 + 'Left'
+        frames, sliders = plan_shape_sliders(['jawOpen', long_key], LENGTH, True,
+                                             used=['shapes_frame', 'jawOpen', 'jaw_frame'])
+        names = {slider.shape_key: slider.name for slider in sliders}
+
+        self.assertEqual(names['jawOpen'], 'jawOpen.001')
+        self.assertEqual(frames[0].name, 'shapes_frame.001')
+        self.assertIn('jaw_frame.001', {frame.name for frame in frames})
+        self.assertLessEqual(len(names[long_key].encode('utf-8')), 63)
+        self.assertTrue(names[long_key].endswith('.L'))
+
+    def test_frames_start_at_the_given_corner(self):
+        frames, sliders = plan_shape_sliders(SHAPE_KEYS, LENGTH, True, large_pattern='jaw', corner=(10.0, 5.0))
+        rects = compute_frame_layout(emitted_armature(frames, sliders))
+
+        root = rects[frames[0].name].outer
+        self.assertAlmostEqual(root[0], 10.0)
+        self.assertAlmostEqual(root[3], 5.0)
+        for frame in frames:
+            self.assertEqual(rects[frame.name], frame.rect)
+
+    def test_frames_and_panels_do_not_overlap(self):
+        footprints = [Footprint(frame.name, 'FRAME', frame.rect.outer) for frame in self.frames[1:]]
+        for slider in self.sliders:
+            width, height = slider_size(slider.slider_type, LENGTH, True)
+            footprints.append(Footprint(slider.name, 'SLIDER', (slider.x - width / 2, slider.z - LENGTH,
+                                                                slider.x + width / 2, slider.z - LENGTH + height)))
+
+        ancestors = {slider.name: {slider.frame} for slider in self.sliders}
+        self.assertEqual(find_overlaps(footprints, ancestors), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
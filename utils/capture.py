@@ -0,0 +1,202 @@
+import bpy
+import csv
+import tempfile
+import numpy as np
+
+from itertools import islice
+from typing import Iterator, Optional, Sequence
+
+from .sliders import get_slider_set
+
+"""
+FACIAL CAPTURE IMPORT
+
+Bakes per-frame weights from a CSV file (one column per blendshape) onto the
+gian.ui.slider controls. The file is parsed in fixed-size chunks, so the parser
+only ever holds chunk_size rows. The keyframe coordinates of each chunk are
+appended to a scratch file mapped in memory, since foreach_set only writes whole
+keyframe collections: each F-Curve is then filled from its own slice, paged in
+from disk, and memory does not grow with the length of the file.
+"""
+
+INTERPOLATION_LINEAR = 1    # Index of 'LINEAR' in the Keyframe.interpolation enum
+
+# A column maps to a slider control, a local axis (0 = X, 1 = Y) and a weight scale
+ColumnMapping = dict[str, tuple[str, int, float]]
+
+
+def iter_csv_chunks(path: str, columns: list[int], chunk_size: int = 4096,
+                    delimiter: str = ',') -> Iterator[np.ndarray]:
+
+    """
+    Streams the rows of a CSV file in chunks, skipping the header row.
+
+    Args:
+        path: The CSV file path.
+        columns: The indices of the columns to read.
+        chunk_size: The number of rows parsed at once.
+        delimiter: The CSV delimiter.
+
+    Yields:
+        (rows, len(columns)) float32 arrays.
+    """
+
+    with open(path, newline='') as file:
+        next(file, None)
+
+        while True:
+            lines = list(islice(file, chunk_size))
+            if not lines:
+                return
+
+            yield np.loadtxt(lines, delimiter=delimiter, usecols=columns,
+                             dtype=np.float32, ndmin=2)
+
+
+def read_csv_header(path: str, delimiter: str = ',') -> list[str]:
+
+    """
+    Reads the column names of a CSV file.
+
+    Args:
+        path: The CSV file path.
+        delimiter: The CSV delimiter.
+    """
+
+    with open(path, newline='') as file:
+        header = next(csv.reader(file, delimiter=delimiter), [])
+
+    return [name.strip() for name in header]
+
+
+def count_csv_rows(path: str) -> int:
+
+    """
+    Counts the data rows of a CSV file without parsing them.
+    """
+
+    with open(path, newline='') as file:
+        next(file, None)
+        return sum(1 for line in file if line.strip())
+
+
+def default_mapping(header: list[str], names: list[str], shape_keys: Sequence[str] = ()) -> ColumnMapping:
+
+    """
+    Maps every column named like a slider control, or like the shape key it drives,
+    to its Y axis with unit scale.
+    """
+
+    controls = {name: name for name in names}
+    controls.update((key, name) for name, key in zip(names, shape_keys) if key)
+
+    return {column: (controls[column], 1, 1.0) for column in header if column in controls}
+
+
+def import_capture_csv(obj, path: str, mapping: Optional[ColumnMapping] = None,
+                       frame_column: Optional[str] = None, frame_start: int = 1,
+                       chunk_size: int = 4096, delimiter: str = ',') -> int:
+
+    """
+    Bakes a facial capture CSV onto the slider controls of a generated rig.
+
+    Several columns may drive the same control axis (e.g. an Up and a Down weight
+    with scales 1 and -1): they are summed before clamping. Existing F-Curves of the
+    driven channels are replaced, each written with one keyframe_points.add and one
+    foreach_set.
+
+    Args:
+        obj: The generated armature object.
+        path: The CSV file path.
+        mapping: The column mapping; columns named like sliders or their shape keys are used when omitted.
+        frame_column: The column holding the frame numbers, or None to use row order.
+        frame_start: The first frame when frame_column is None.
+        chunk_size: The number of rows parsed at once.
+        delimiter: The CSV delimiter.
+
+    Returns:
+        The number of imported frames.
+
+    Raises:
+        ValueError: When frame_column is not a column of the file.
+    """
+
+    sliders = get_slider_set(obj)
+    header = read_csv_header(path, delimiter)
+    mapping = mapping if mapping is not None else default_mapping(header, sliders.names, sliders.shape_keys)
+
+    column_index = {name: i for i, name in enumerate(header)}
+    mapping = {column: target for column, target in mapping.items()
+               if column in column_index and target[0] in sliders.index}
+
+    # One channel per driven (slider, axis); columns only hold indices into it
+    channels = sorted({(name, axis) for name, axis, _ in mapping.values()})
+    channel_index = {channel: i for i, channel in enumerate(channels)}
+
+    if not channels:
+        return 0
+
+    columns = [column_index[column] for column in mapping]
+    targets = np.array([channel_index[(name, axis)] for name, axis, _ in mapping.values()], dtype=np.int64)
+    scales = np.array([scale for _, _, scale in mapping.values()], dtype=np.float32)
+
+    slider_rows = np.array([sliders.index[name] for name, _ in channels], dtype=np.int64)
+    axes = np.array([axis for _, axis in channels], dtype=np.int64)
+    low = sliders.low[slider_rows, axes]
+    high = sliders.high[slider_rows, axes]
+    ranges = sliders.range[slider_rows]
+
+    if frame_column is not None:
+        if frame_column not in column_index:
+            raise ValueError(f"No column named '{frame_column}' in {path}")
+        columns.append(column_index[frame_column])
+
+    rows = count_csv_rows(path)
+    if rows == 0:
+        return 0
+
+    if obj.animation_data is None:
+        obj.animation_data_create()
+    if obj.animation_data.action is None:
+        obj.animation_data.action = bpy.data.actions.new(f"{obj.name}_capture")
+
+    action = obj.animation_data.action
+
+    with tempfile.TemporaryFile() as scratch:
+        co = np.memmap(scratch, dtype=np.float32, mode='w+', shape=(len(channels), rows, 2))
+        offset = 0
+
+        for chunk in iter_csv_chunks(path, columns, chunk_size, delimiter):
+            count = len(chunk)
+
+            if frame_column is not None:
+                frames, chunk = chunk[:, -1], chunk[:, :-1]
+            else:
+                frames = np.arange(offset, offset + count, dtype=np.float32) + frame_start
+
+            weights = np.zeros((count, len(channels)), dtype=np.float32)
+            np.add.at(weights.T, targets, (chunk * scales).T)
+            np.clip(weights, low, high, out=weights)
+
+            co[:, offset:offset + count, 0] = frames
+            co[:, offset:offset + count, 1] = (weights * ranges).T
+            offset += count
+
+        interpolation = np.full(offset, INTERPOLATION_LINEAR, dtype=np.int32)
+
+        for channel, (name, axis) in enumerate(channels):
+            data_path = f'pose.bones["{bpy.utils.escape_identifier(name)}"].location'
+
+            fcurve = action.fcurves.find(data_path, index=axis)
+            if fcurve:
+                action.fcurves.remove(fcurve)
+
+            fcurve = action.fcurves.new(data_path, index=axis, action_group=name)
+            fcurve.keyframe_points.add(offset)
+            fcurve.keyframe_points.foreach_set('co', co[channel, :offset].ravel())
+            fcurve.keyframe_points.foreach_set('interpolation', interpolation)
+            fcurve.update()
+
+        del co
+
+    return offset
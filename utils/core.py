@@ -0,0 +1,277 @@
+from typing import NamedTuple
+
+"""
+CORE MATH OF GIAN.UI RIGS
+
+The decisions behind the slider constraints, the widget node inputs and the frame
+outlines, with plain Python inputs and outputs. Nothing in here imports bpy, so
+the examples run in any CPython:
+
+    python utils/core.py            # run the examples
+    python utils/core.py --bench    # and time the hot functions
+
+The Blender side (rigs/ui/*.py and utils/wgt.py) only copies these values into
+constraints, modifiers and meshes.
+"""
+
+WGT_PREFIX = "WGT-"  # Prefix for widget objects
+WGT_GROUP_PREFIX = "WGTS_"  # noqa; Prefix for the widget collection
+TEXT_FONT = "Ubuntu-Medium"  # Font used by GN-wgt_Text for texts and titles
+WGT_KIND_PROP = "gian_widget_kind"  # Custom property tagging the kind of gian widget objects
+PANEL_PREFIX = "PAN_"  # Prefix of the panel bones of the sliders
+ORG_PREFIX = "ORG-"  # Prefix of the original bones, as in rigify.utils.naming
+SLIDERS_PROP = "gian_ui_sliders"  # Custom property on the armature data holding the slider table
+
+CLAMP_CODES = {'NONE': 0, 'UP': 1, 'DOWN': 2}
+
+BOX_SOCKETS = {
+    'design': 'Socket_5',
+    'clamp': 'Socket_8',
+    'text': 'Socket_13',
+    'minimal': 'Socket_16',
+    'fill': 'Socket_7',
+}
+
+CTRL_SOCKETS = {
+    'fill': 'Socket_7',
+    'offset': 'Socket_14',
+}
+
+TEXT_SOCKETS = {
+    'text': 'Socket_3',
+}
+
+LARGE_ORIENTATION = ((1.0, 0.0, 0.0, 0.0),    # LARGE slider bones have local Y along armature Z
+                     (0.0, 0.0, -1.0, 0.0),
+                     (0.0, 1.0, 0.0, 0.0),
+                     (0.0, 0.0, 0.0, 1.0))
+
+Vec3 = tuple[float, float, float]
+
+
+class SliderLimits(NamedTuple):
+
+    """
+    The LIMIT_LOCATION range of a slider control, in local space.
+
+    Attributes:
+        min_xyz: The lower location limits.
+        max_xyz: The upper location limits.
+    """
+
+    min_xyz: Vec3
+    max_xyz: Vec3
+
+
+def slider_limits(slider_type: str, clamp_up_down: str, length: float) -> SliderLimits:
+
+    """
+    Computes the travel of a slider control.
+
+    SMALL sliders only move along Y, LARGE sliders move on X and Y. Clamping removes
+    the upper or lower half of the Y travel.
+
+    Args:
+        slider_type: 'SMALL' or 'LARGE'.
+        clamp_up_down: 'NONE', 'UP' or 'DOWN'.
+        length: The bone length, which is the slider range.
+
+    Returns:
+        The location limits of the control.
+
+    >>> slider_limits('SMALL', 'NONE', 0.5)
+    SliderLimits(min_xyz=(0.0, -0.5, 0.0), max_xyz=(0.0, 0.5, 0.0))
+    >>> slider_limits('LARGE', 'UP', 2.0)
+    SliderLimits(min_xyz=(-2.0, 0.0, 0.0), max_xyz=(2.0, 2.0, 0.0))
+    >>> slider_limits('SMALL', 'DOWN', 1.0).max_xyz
+    (0.0, 0.0, 0.0)
+    """
+
+    length = float(length)
+    x_low, x_high = (-length, length) if 'LARGE' in slider_type else (0.0, 0.0)
+    y_low = 0.0 if clamp_up_down == 'UP' else -length
+    y_high = 0.0 if clamp_up_down == 'DOWN' else length
+
+    return SliderLimits((x_low, y_low, 0.0), (x_high, y_high, 0.0))
+
+
+def box_socket_values(design: str, clp: str, txt: str, minimal: bool, fill: bool) -> dict:
+
+    """
+    Maps the design of a slider panel to the inputs of the GN-wgt_Box modifier.
+
+    Args:
+        design: 'SMALL' or 'LARGE'.
+        clp: 'NONE', 'UP' or 'DOWN'.
+        txt: The title drawn by the node group ('' for none).
+        minimal: Whether the minimal design is used.
+        fill: Whether the panel is filled.
+
+    Returns:
+        The modifier input values keyed by socket identifier.
+
+    >>> box_socket_values('LARGE', 'DOWN', '', False, True)['Socket_8']
+    2
+    >>> box_socket_values('SMALL', 'NONE', 'Eye', True, False)['Socket_5']
+    0.0
+    """
+
+    return {
+        BOX_SOCKETS['design']: 1.0 if design == 'LARGE' else 0.0,
+        BOX_SOCKETS['clamp']: CLAMP_CODES.get(clp, CLAMP_CODES['DOWN']),
+        BOX_SOCKETS['text']: txt,
+        BOX_SOCKETS['minimal']: bool(minimal),
+        BOX_SOCKETS['fill']: bool(fill),
+    }
+
+
+def ctrl_socket_values(fill: bool, offset: bool) -> dict:
+
+    """
+    Maps the design of a slider control to the inputs of the GN-wgt_Ctrl modifier.
+
+    >>> ctrl_socket_values(True, False)
+    {'Socket_7': True, 'Socket_14': False}
+    """
+
+    return {
+        CTRL_SOCKETS['fill']: bool(fill),
+        CTRL_SOCKETS['offset']: bool(offset),
+    }
+
+
+def box_key(design: str, clp: str, minimal: bool, fill: bool) -> tuple:
+
+    """
+    Returns the cache key of an untitled box shape.
+
+    >>> box_key('SMALL', 'UP', 0, 1)
+    ('BOX', 'SMALL', 'UP', False, True)
+    """
+
+    return ('BOX', design, clp, bool(minimal), bool(fill))
+
+
+def ctrl_key(fill: bool, offset: bool) -> tuple:
+
+    """
+    Returns the cache key of a control shape.
+
+    >>> ctrl_key(True, 0)
+    ('CTRL', True, False)
+    """
+
+    return ('CTRL', bool(fill), bool(offset))
+
+
+def text_socket_values(txt: str) -> dict:
+
+    """
+    Maps a label to the inputs of the GN-wgt_Text modifier.
+
+    >>> text_socket_values('Jaw')
+    {'Socket_3': 'Jaw'}
+    """
+
+    return {TEXT_SOCKETS['text']: txt}
+
+
+def frame_outline(rect, head_x: float, head_z: float) -> list[Vec3]:
+
+    """
+    Computes the corners of a frame widget, relative to the frame bone head.
+
+    Frame widgets are drawn in the XY plane of the bone, with Y along armature Z.
+
+    Args:
+        rect: The frame rectangle (see utils.layout.FrameRect).
+        head_x: The X position of the frame bone head.
+        head_z: The Z position of the frame bone head.
+
+    Returns:
+        The four corners, counter-clockwise from the bottom left.
+
+    >>> from collections import namedtuple
+    >>> Rect = namedtuple('Rect', 'min_x min_z max_x max_z title')
+    >>> frame_outline(Rect(-1.0, 0.0, 1.0, 2.0, 0.3), 0.0, 1.0)
+    [(-1.0, -1.0, 0.0), (1.0, -1.0, 0.0), (1.0, 1.0, 0.0), (-1.0, 1.0, 0.0)]
+    """
+
+    left, right = rect.min_x - head_x, rect.max_x - head_x
+    bottom, top = rect.min_z - head_z, rect.max_z - head_z
+
+    return [(left, bottom, 0.0), (right, bottom, 0.0), (right, top, 0.0), (left, top, 0.0)]
+
+
+def title_band(left: float, right: float, top: float, band: float, fill: float) -> tuple[float, float, float, float]:
+
+    """
+    Computes where a title is drawn, in a band stacked on top of a shape.
+
+    Args:
+        left: The left side of the shape.
+        right: The right side of the shape.
+        top: The top of the shape, where the band starts.
+        band: The height of the title band.
+        fill: The part of the band height covered by the text.
+
+    Returns:
+        The (left, right, bottom, height) of the text, centered in the band.
+
+    >>> title_band(-1.0, 1.0, 1.0, 0.3, 0.5)
+    (-1.0, 1.0, 1.075, 0.15)
+    """
+
+    height = band * fill
+
+    return (left, right, top + (band - height) / 2, height)
+
+
+def frame_title_band(rect, head_x: float, head_z: float, fill: float) -> tuple[float, float, float, float]:
+
+    """
+    Computes where the title of a frame is drawn, relative to the frame bone head.
+
+    Args:
+        rect: The frame rectangle (see utils.layout.FrameRect).
+        head_x: The X position of the frame bone head.
+        head_z: The Z position of the frame bone head.
+        fill: The part of the title band height covered by the text.
+
+    Returns:
+        The (left, right, bottom, height) of the text, centered in the title band.
+
+    >>> from collections import namedtuple
+    >>> Rect = namedtuple('Rect', 'min_x min_z max_x max_z title')
+    >>> frame_title_band(Rect(-1.0, 0.0, 1.0, 2.0, 0.5), 0.0, 0.0, 0.5)
+    (-1.0, 1.0, 2.125, 0.25)
+    """
+
+    return title_band(rect.min_x - head_x, rect.max_x - head_x, rect.max_z - head_z, rect.title, fill)
+
+
+if __name__ == "__main__":
+    import sys
+    import doctest
+    import timeit
+    from collections import namedtuple
+
+    failures, tests = doctest.testmod()
+    print(f"{tests - failures}/{tests} examples passed")
+
+    if '--bench' in sys.argv:
+        Rect = namedtuple('Rect', 'min_x min_z max_x max_z title')
+        rect = Rect(-1.0, 0.0, 1.0, 2.0, 0.3)
+        benches = {
+            "slider_limits": lambda: slider_limits('LARGE', 'UP', 0.2),
+            "box_socket_values": lambda: box_socket_values('SMALL', 'DOWN', 'Jaw', False, True),
+            "frame_outline": lambda: frame_outline(rect, 0.0, 1.0),
+            "title_band": lambda: title_band(-1.0, 1.0, 1.0, 0.3, 0.8),
+            "frame_title_band": lambda: frame_title_band(rect, 0.0, 1.0, 0.8),
+        }
+        for name, func in benches.items():
+            count = 100000
+            seconds = min(timeit.repeat(func, number=count, repeat=3))
+            print(f"{name:<20} {seconds / count * 1e9:8.1f} ns/call")
+
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,252 @@
+from typing import Optional
+
+from .core import WGT_KIND_PROP, PANEL_PREFIX, ORG_PREFIX
+
+"""
+VIEWPORT DRAW COST OF WIDGETS
+
+Estimates what every custom shape of a generated rig costs to draw in pose mode:
+the mesh vertices, edges and faces after its modifiers (subdivision surface levels
+are estimated from the Catmull-Clark topology rules instead of evaluating them).
+
+Controls of a generated rig are never parented under their frame control (sliders
+hang from their panel or the root), so frame membership follows the ORG bones,
+which keep the metarig hierarchy.
+"""
+
+DEFAULT_BUDGET = {'verts': 100000, 'edges': 200000, 'faces': 100000, 'modifiers': 1000}
+
+
+class DrawCost:
+
+    """
+    Accumulated drawing cost.
+
+    Attributes:
+        bones: The number of bones drawn with a custom shape.
+        verts: The evaluated vertices.
+        edges: The evaluated edges.
+        faces: The evaluated faces.
+        modifiers: The number of modifiers to evaluate.
+    """
+
+    bones: int
+    verts: int
+    edges: int
+    faces: int
+    modifiers: int
+
+    def __init__(self, verts: int = 0, edges: int = 0, faces: int = 0, modifiers: int = 0, bones: int = 0):
+        self.bones = bones
+        self.verts = verts
+        self.edges = edges
+        self.faces = faces
+        self.modifiers = modifiers
+
+    def __iadd__(self, other: 'DrawCost') -> 'DrawCost':
+        self.bones += other.bones
+        self.verts += other.verts
+        self.edges += other.edges
+        self.faces += other.faces
+        self.modifiers += other.modifiers
+        return self
+
+    def __repr__(self) -> str:
+        return (f"{self.bones} bones, {self.verts} verts, {self.edges} edges, "
+                f"{self.faces} faces, {self.modifiers} modifiers")
+
+
+def estimate_shape_cost(obj) -> DrawCost:
+
+    """
+    Estimates the evaluated size of a custom shape object.
+
+    Args:
+        obj: The custom shape object.
+
+    Returns:
+        The drawing cost of one instance of the shape.
+    """
+
+    if obj.type != 'MESH':
+        return DrawCost(modifiers=len(obj.modifiers), bones=1)
+
+    mesh = obj.data
+    verts, edges, faces, loops = len(mesh.vertices), len(mesh.edges), len(mesh.polygons), len(mesh.loops)
+
+    for mod in obj.modifiers:
+        if mod.type == 'SUBSURF' and mod.show_viewport:
+            for _ in range(mod.levels):
+                verts, edges, faces, loops = verts + edges + faces, edges * 2 + loops, loops, loops * 4
+
+    return DrawCost(verts, edges, faces, len(obj.modifiers), bones=1)
+
+
+class DrawCostReport:
+
+    """
+    Drawing cost of a rig, broken down per widget kind, bone collection and frame.
+
+    Attributes:
+        total: The cost of the whole rig.
+        kinds: The cost per widget kind ('BOX', 'CTRL', 'TEXT', 'FRAME' or 'OTHER').
+        collections: The cost per bone collection.
+        frames: The cost per enclosing gian.ui frame bone.
+        bones: The cost of every bone with a custom shape.
+    """
+
+    total: DrawCost
+    kinds: dict[str, DrawCost]
+    collections: dict[str, DrawCost]
+    frames: dict[str, DrawCost]
+    bones: dict[str, DrawCost]
+
+    def __init__(self):
+        self.total = DrawCost()
+        self.kinds = {}
+        self.collections = {}
+        self.frames = {}
+        self.bones = {}
+
+    def worst(self, count: int = 10) -> list[tuple[str, DrawCost]]:
+
+        """
+        Returns the bones with the most evaluated vertices.
+        """
+
+        return sorted(self.bones.items(), key=lambda item: item[1].verts, reverse=True)[:count]
+
+    def over_budget(self, budget: Optional[dict[str, int]] = None) -> dict[str, tuple[int, int]]:
+
+        """
+        Compares the totals with a budget.
+
+        Args:
+            budget: Maximum 'verts', 'edges', 'faces' and 'modifiers'; DEFAULT_BUDGET if omitted.
+
+        Returns:
+            The exceeded measures, mapped to (total, limit).
+        """
+
+        budget = budget or DEFAULT_BUDGET
+
+        return {key: (getattr(self.total, key), limit) for key, limit in budget.items()
+                if getattr(self.total, key) > limit}
+
+    def summary(self, worst: int = 10) -> str:
+
+        """
+        Returns a readable report.
+        """
+
+        lines = [f"Total: {self.total}"]
+        lines += [f"  kind {name}: {cost}" for name, cost in sorted(self.kinds.items())]
+        lines += [f"  collection {name}: {cost}" for name, cost in sorted(self.collections.items())]
+        lines += [f"  frame {name}: {cost}" for name, cost in sorted(self.frames.items())]
+        lines.append("Worst offenders:")
+        lines += [f"  {name}: {cost}" for name, cost in self.worst(worst)]
+
+        return "\n".join(lines)
+
+
+def _is_frame(pbone) -> bool:
+
+    """
+    Checks a pose bone displays a gian.ui frame widget.
+    """
+
+    shape = pbone.custom_shape
+    return shape is not None and shape.get(WGT_KIND_PROP) == 'FRAME'
+
+
+def enclosing_frame(rig, name: str, cache: Optional[dict[str, Optional[str]]] = None) -> Optional[str]:
+
+    """
+    Returns the frame control containing a control of a generated rig, or None.
+
+    The control is matched to its ORG bone (a PAN_ panel to the ORG bone of its
+    slider), whose ORG parents are matched back to their controls.
+
+    Args:
+        rig: The generated armature object.
+        name: The control bone name.
+        cache: The enclosing frame of the ORG bones already visited, updated.
+    """
+
+    cache = {} if cache is None else cache
+    pose_bones = rig.pose.bones
+
+    if name.startswith(PANEL_PREFIX):
+        name = name[len(PANEL_PREFIX):]
+
+    org = pose_bones.get(ORG_PREFIX + name)
+    if org is None:
+        return None
+
+    visited = []
+    parent = org.parent
+    frame = None
+
+    while parent is not None:
+        if parent.name in cache:
+            frame = cache[parent.name]
+            break
+
+        visited.append(parent.name)
+        if parent.name.startswith(ORG_PREFIX):
+            control = pose_bones.get(parent.name[len(ORG_PREFIX):])
+            if control is not None and _is_frame(control):
+                frame = control.name
+                break
+
+        parent = parent.parent
+
+    for visited_name in visited:
+        cache[visited_name] = frame
+
+    return frame
+
+
+def draw_cost_report(rig) -> DrawCostReport:
+
+    """
+    Walks every custom shape of a generated rig and sums its drawing cost.
+
+    Shapes are estimated once each, then counted for every bone displaying them.
+
+    Args:
+        rig: The generated armature object.
+
+    Returns:
+        The draw cost report.
+    """
+
+    report = DrawCostReport()
+    shape_costs: dict[str, DrawCost] = {}
+    frame_of: dict[str, Optional[str]] = {}
+
+    def add(table: dict[str, DrawCost], key: str, cost: DrawCost):
+        table.setdefault(key, DrawCost())
+        table[key] += cost
+
+    for pbone in rig.pose.bones:
+        shape = pbone.custom_shape
+        if shape is None:
+            continue
+
+        cost = shape_costs.get(shape.name_full)
+        if cost is None:
+            cost = shape_costs[shape.name_full] = estimate_shape_cost(shape)
+
+        report.bones[pbone.name] = cost
+        report.total += cost
+        add(report.kinds, shape.get(WGT_KIND_PROP, 'OTHER'), cost)
+
+        for collection in pbone.bone.collections:
+            add(report.collections, collection.name, cost)
+
+        frame = enclosing_frame(rig, pbone.name, frame_of)
+        if frame:
+            add(report.frames, frame, cost)
+
+    return report
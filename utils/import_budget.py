@@ -0,0 +1,210 @@
+import os
+import sys
+import time
+import argparse
+import importlib
+
+from importlib.abc import MetaPathFinder, Loader
+
+"""
+IMPORT-TIME BUDGET
+
+Blender imports the feature set (and so the operators) on every startup, and the
+rigs/ui modules every time Rigify lists its rig types. This script imports them
+once with every module load timed, prints the modules costing the most, and exits
+with an error when the total goes over budget or when a module that should only
+load when used (numpy and the utils built on it) was pulled in.
+
+Only modules not already loaded count, so run it in a fresh Blender:
+
+    blender -b --factory-startup --addons rigify --python utils/import_budget.py -- --budget 150
+
+Without Blender, --modules times bpy-free modules only, imported from the repository
+root like `python -m` does:
+
+    python utils/import_budget.py --modules utils.core utils.shape_sliders
+"""
+
+IMPORT_BUDGET_MS = 150.0    # Default budget of the whole import, in milliseconds
+IMPORT_REPORT_COUNT = 15    # Default number of modules listed
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = os.path.basename(REPO_DIR)
+
+STARTUP_MODULES = (
+    PACKAGE,
+    f"{PACKAGE}.rigs.ui.slider",
+    f"{PACKAGE}.rigs.ui.frame",
+    f"{PACKAGE}.rigs.ui.custom_text",
+)
+
+# Heavy modules only imported by generation, operators and previews; package modules are
+# named from the package root, like --modules
+GENERATION_ONLY_MODULES = (
+    "numpy",
+    "utils.wgt",
+    "utils.mesh_data",
+    "utils.widget_pack",
+    "utils.widget_sync",
+    "utils.sliders",
+    "utils.capture",
+    "utils.shape_bake",
+    "utils.pose_library",
+    "utils.live_input",
+    "utils.live_protocol",
+)
+
+
+class _TimedLoader(Loader):
+
+    """
+    Wraps the loader of a module to time its execution.
+    """
+
+    def __init__(self, loader, timer: 'ImportTimer'):
+        self.loader = loader
+        self.timer = timer
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        self.timer.run(module.__name__, self.loader.exec_module, module)
+
+
+class ImportTimer(MetaPathFinder):
+
+    """
+    Meta path finder timing the execution of every module imported while installed.
+
+    Attributes:
+        times: The (total, own) seconds of each imported module, own excluding the
+            modules it imported itself.
+    """
+
+    times: dict[str, tuple[float, float]]
+
+    def __init__(self):
+        self.times = {}
+        self.stack = []
+
+    def find_spec(self, name, path, target=None):
+        for finder in sys.meta_path:
+            find_spec = getattr(finder, 'find_spec', None)
+            if finder is self or find_spec is None:
+                continue
+
+            spec = find_spec(name, path, target)
+            if spec is None:
+                continue
+
+            # Namespace packages have nothing to execute
+            if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                spec.loader = _TimedLoader(spec.loader, self)
+
+            return spec
+
+        return None
+
+    def run(self, name: str, exec_module, module):
+
+        """
+        Executes a module, charging its time to itself and to the importing module.
+        """
+
+        self.stack.append(0.0)
+        start = time.perf_counter()
+
+        try:
+            exec_module(module)
+        finally:
+            total = time.perf_counter() - start
+            children = self.stack.pop()
+            if self.stack:
+                self.stack[-1] += total
+            self.times[name] = (total, total - children)
+
+    def __enter__(self):
+        sys.meta_path.insert(0, self)
+        return self
+
+    def __exit__(self, *exc):
+        sys.meta_path.remove(self)
+
+
+def measure_imports(modules) -> tuple[float, dict[str, tuple[float, float]]]:
+
+    """
+    Imports modules with every module load timed.
+
+    Args:
+        modules: The names of the modules to import, in order.
+
+    Returns:
+        The total seconds, and the (total, own) seconds of each module loaded.
+    """
+
+    with ImportTimer() as timer:
+        start = time.perf_counter()
+        for name in modules:
+            importlib.import_module(name)
+        total = time.perf_counter() - start
+
+    return total, timer.times
+
+
+def import_report(total: float, times: dict[str, tuple[float, float]], count: int = IMPORT_REPORT_COUNT) -> str:
+
+    """
+    Returns the modules costing the most to import, one per line.
+    """
+
+    lines = [f"{'own ms':>9} {'total ms':>9}  module"]
+    for name, (cumulative, own) in sorted(times.items(), key=lambda item: -item[1][1])[:count]:
+        lines.append(f"{own * 1000:9.1f} {cumulative * 1000:9.1f}  {name}")
+    lines.append(f"{len(times)} modules loaded in {total * 1000:.1f} ms")
+
+    return "\n".join(lines)
+
+
+def main(argv) -> int:
+    parser = argparse.ArgumentParser(description="Time the imports of the feature set against a budget.")
+    parser.add_argument('--budget', type=float, default=IMPORT_BUDGET_MS, help="Budget in milliseconds")
+    parser.add_argument('--modules', nargs='*', default=list(STARTUP_MODULES),
+                        help="Modules to import, relative to the feature set or absolute")
+    parser.add_argument('--count', type=int, default=IMPORT_REPORT_COUNT, help="Number of modules listed")
+    args = parser.parse_args(argv)
+
+    # The feature set package needs bpy, so bpy-free modules are imported on their own outside Blender
+    in_blender = 'bpy' in sys.modules
+    root = os.path.dirname(REPO_DIR) if in_blender else REPO_DIR
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+    def resolve(name: str) -> str:
+        return name if not in_blender or name.split('.')[0] in (PACKAGE, 'rigify', 'numpy') else f"{PACKAGE}.{name}"
+
+    total, times = measure_imports([resolve(name) for name in args.modules])
+    print(import_report(total, times, args.count))
+
+    failed = False
+    eager = [name for name in map(resolve, GENERATION_ONLY_MODULES) if name in times]
+    if eager:
+        print(f"FAIL: imported before generation: {', '.join(eager)}")
+        failed = True
+
+    if total * 1000 > args.budget:
+        print(f"FAIL: {total * 1000:.1f} ms over the {args.budget:.0f} ms budget")
+        failed = True
+    else:
+        print(f"OK: {total * 1000:.1f} ms within the {args.budget:.0f} ms budget")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    # Blender passes the script arguments after --
+    sys.exit(main(sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else sys.argv[1:]))
@@ -0,0 +1,406 @@
+"""
+LAYOUT OF GIAN.UI RIGS
+
+Pure layout math shared by the ui rig types and widget builders. Nothing in here
+touches bpy directly: functions only read the attributes of the objects passed in.
+"""
+
+from typing import NamedTuple, Optional
+
+UI_RIG_TYPES = {
+    'SLIDER': 'ui.slider',
+    'FRAME': 'ui.frame',
+    'TEXT': 'ui.custom_text',
+}
+
+FRAME_MARGIN = 0.1          # Padding around the children extents, relative to their size.
+FRAME_TITLE_HEIGHT = 0.15   # Height of the title band, relative to the padded frame width.
+TITLE_TEXT_FILL = 0.8       # Part of a frame or slider title band covered by the text.
+FRAME_EMPTY_SIZE = 1.0      # Half size of a frame without children.
+
+Bounds = tuple[float, float, float, float]  # (min_x, min_z, max_x, max_z)
+
+
+class FrameRect(NamedTuple):
+
+    """
+    The rectangle of a frame, in armature space (X right, Z up).
+
+    Attributes:
+        min_x: Left side of the padded frame.
+        min_z: Bottom side of the padded frame.
+        max_x: Right side of the padded frame.
+        max_z: Top side of the padded frame.
+        title: Height of the title band stacked above max_z (0 when untitled).
+    """
+
+    min_x: float
+    min_z: float
+    max_x: float
+    max_z: float
+    title: float = 0.0
+
+    @property
+    def outer(self) -> Bounds:
+
+        """
+        The extents of the frame including its title band.
+        """
+
+        return (self.min_x, self.min_z, self.max_x, self.max_z + self.title)
+
+
+def get_ui_rig_kind(rigify_type: str) -> Optional[str]:
+
+    """
+    Returns the kind of gian.ui rig for a rigify type.
+
+    Args:
+        rigify_type: The rigify_type of a pose bone, with or without feature set prefix.
+
+    Returns:
+        'SLIDER', 'FRAME', 'TEXT' or None if it is not a gian.ui rig type.
+    """
+
+    for kind, suffix in UI_RIG_TYPES.items():
+        if rigify_type == suffix or rigify_type.endswith('.' + suffix):
+            return kind
+
+    return None
+
+
+def rig_parent(pbone):
+
+    """
+    Returns the closest parent bone with a rig type, like BaseRig.rigify_parent, or None.
+
+    Args:
+        pbone: A metarig pose bone.
+    """
+
+    for parent in pbone.parent_recursive:
+        if parent.rigify_type:
+            return parent
+
+    return None
+
+
+def union_bounds(a: Optional[Bounds], b: Optional[Bounds]) -> Optional[Bounds]:
+
+    """
+    Returns the smallest bounds containing both a and b (either may be None).
+    """
+
+    if a is None:
+        return b
+    if b is None:
+        return a
+
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+def frame_has_title(params) -> bool:
+
+    """
+    Checks a frame draws a title, so its rectangle reserves a title band.
+
+    Args:
+        params: The rigify_parameters of the frame bone.
+    """
+
+    return bool(params.title and params.custom_title)
+
+
+def pad_frame(inner: Optional[Bounds], head: tuple[float, float], title: bool) -> FrameRect:
+
+    """
+    Builds the rectangle of a frame around the bounds of its content.
+
+    Args:
+        inner: The aggregated bounds of the frame content, or None if empty.
+        head: The (x, z) position of the frame bone head.
+        title: Whether the frame reserves a title band.
+
+    Returns:
+        The padded frame rectangle.
+    """
+
+    if inner is None:
+        min_x, min_z = head[0] - FRAME_EMPTY_SIZE, head[1] - FRAME_EMPTY_SIZE
+        max_x, max_z = head[0] + FRAME_EMPTY_SIZE, head[1] + FRAME_EMPTY_SIZE
+    else:
+        min_x, min_z, max_x, max_z = inner
+        offset_x = (max_x - min_x) * FRAME_MARGIN
+        offset_z = (max_z - min_z) * FRAME_MARGIN
+        # Degenerate content (a single vertical or horizontal bone) borrows the other axis
+        offset_x = offset_x or offset_z or FRAME_MARGIN
+        offset_z = offset_z or offset_x
+        min_x, max_x = min_x - offset_x, max_x + offset_x
+        min_z, max_z = min_z - offset_z, max_z + offset_z
+
+    title_height = (max_x - min_x) * FRAME_TITLE_HEIGHT if title else 0.0
+
+    return FrameRect(min_x, min_z, max_x, max_z, title_height)
+
+
+def compute_frame_layout(obj, frames: Optional[dict[str, bool]] = None) -> dict[str, FrameRect]:
+
+    """
+    Lays out every gian.ui frame of an armature in a single bottom-up pass.
+
+    Each bone contributes the bounds of its head and tail plus the bounds of its
+    children. A frame instead contributes its padded rectangle including the title
+    band, so nested frames grow their parents correctly. Runs in O(N) over bones.
+
+    Args:
+        obj: The armature object (metarig or rig being generated).
+        frames: The frame bones mapped to whether they draw a title. Detected from
+            the rigify_type of the pose bones when omitted.
+
+    Returns:
+        A dictionary of frame rectangles keyed by bone name.
+    """
+
+    bones = []
+    detect = frames is None
+    frames = {} if detect else frames
+
+    for pbone in obj.pose.bones:
+        bone = pbone.bone
+        head, tail = bone.head_local, bone.tail_local
+        bones.append((bone.name, bone.parent.name if bone.parent else None, (head.x, head.z), (tail.x, tail.z)))
+
+        if detect and get_ui_rig_kind(pbone.rigify_type) == 'FRAME':
+            frames[bone.name] = frame_has_title(pbone.rigify_parameters)
+
+    return frame_layout(bones, frames)
+
+
+def frame_layout(bones, frames: dict[str, bool]) -> dict[str, FrameRect]:
+
+    """
+    Lays out frames from plain bone data, see compute_frame_layout.
+
+    Used directly to plan frames before their bones exist.
+
+    Args:
+        bones: The (name, parent name or None, head (x, z), tail (x, z)) of every bone.
+        frames: The frame bones mapped to their title option.
+
+    Returns:
+        A dictionary of frame rectangles keyed by bone name.
+    """
+
+    children: dict[Optional[str], list[str]] = {}
+    points: dict[str, Bounds] = {}
+    heads: dict[str, tuple[float, float]] = {}
+
+    for name, parent, head, tail in bones:
+        children.setdefault(parent, []).append(name)
+        points[name] = (min(head[0], tail[0]), min(head[1], tail[1]),
+                        max(head[0], tail[0]), max(head[1], tail[1]))
+        heads[name] = head
+
+    # Pre-order walk from the roots; reversed, it visits children before parents
+    order = []
+    stack = list(children.get(None, ()))
+    while stack:
+        name = stack.pop()
+        order.append(name)
+        stack.extend(children.get(name, ()))
+
+    bounds: dict[str, Bounds] = {}
+    rects: dict[str, FrameRect] = {}
+
+    for name in reversed(order):
+        inner = None
+        for child in children.get(name, ()):
+            inner = union_bounds(inner, bounds[child])
+
+        if name in frames:
+            rect = pad_frame(inner, heads[name], frames[name])
+            rects[name] = rect
+            bounds[name] = rect.outer
+        else:
+            bounds[name] = union_bounds(points[name], inner)
+
+    return rects
+
+
+"""
+CONTROL FOOTPRINTS
+"""
+
+SLIDER_SMALL_WIDTH = 0.25   # Half width of a SMALL panel, relative to the bone length.
+SLIDER_TITLE_HEIGHT = 0.3   # Height of a slider title band, relative to the bone length.
+TEXT_CHAR_WIDTH = 0.6       # Average glyph advance of the bundled font, relative to its height.
+
+
+class Footprint(NamedTuple):
+
+    """
+    The 2D rectangle covered by a gian.ui control in armature space (X right, Z up).
+
+    Attributes:
+        name: The bone name of the control.
+        kind: 'SLIDER', 'FRAME' or 'TEXT'.
+        bounds: The (min_x, min_z, max_x, max_z) extents.
+    """
+
+    name: str
+    kind: str
+    bounds: Bounds
+
+
+def slider_footprint(head, tail, length: float, slider_type: str,
+                     clamp_up_down: str, title: bool = False) -> Bounds:
+
+    """
+    Computes the panel rectangle of a gian.ui.slider.
+
+    Args:
+        head: The bone head, with x and z attributes.
+        tail: The bone tail, with x and z attributes.
+        length: The bone length, which is the slider range.
+        slider_type: 'SMALL' or 'LARGE'.
+        clamp_up_down: 'NONE', 'UP' or 'DOWN'.
+        title: Whether a title band is drawn on top of the panel.
+
+    Returns:
+        The axis aligned bounds of the panel.
+    """
+
+    low = 0.0 if clamp_up_down == 'UP' else -length
+    high = 0.0 if clamp_up_down == 'DOWN' else length
+
+    if 'LARGE' in slider_type:
+        # LARGE sliders are re-oriented with local Y along world Z
+        min_x, max_x = head.x - length, head.x + length
+        min_z, max_z = head.z + low, head.z + high
+    else:
+        # SMALL sliders travel along the bone, on a thin panel around it
+        dx, dz = (tail.x - head.x) / length, (tail.z - head.z) / length
+        nx, nz = dz * length * SLIDER_SMALL_WIDTH, -dx * length * SLIDER_SMALL_WIDTH
+        xs, zs = [], []
+        for t in (low, high):
+            for side in (-1, 1):
+                xs.append(head.x + dx * t + nx * side)
+                zs.append(head.z + dz * t + nz * side)
+        min_x, max_x, min_z, max_z = min(xs), max(xs), min(zs), max(zs)
+
+    if title:
+        max_z += length * SLIDER_TITLE_HEIGHT
+
+    return (min_x, min_z, max_x, max_z)
+
+
+def text_footprint(head, length: float, text: str) -> Bounds:
+
+    """
+    Computes the rectangle of a gian.ui.custom_text label, centered on the bone head.
+
+    Args:
+        head: The bone head, with x and z attributes.
+        length: The bone length, which is the text height.
+        text: The resolved label.
+
+    Returns:
+        The axis aligned bounds of the label.
+    """
+
+    half_width = max(len(text), 1) * length * TEXT_CHAR_WIDTH / 2
+
+    return (head.x - half_width, head.z, head.x + half_width, head.z + length)
+
+
+def collect_footprints(obj) -> tuple[list[Footprint], dict[str, set[str]]]:
+
+    """
+    Computes the footprint of every gian.ui control of a metarig.
+
+    Args:
+        obj: The metarig armature object.
+
+    Returns:
+        The list of footprints, and for each control the set of frames containing it.
+    """
+
+    frames = compute_frame_layout(obj)
+    footprints = []
+    ancestors = {}
+
+    for pbone in obj.pose.bones:
+        kind = get_ui_rig_kind(pbone.rigify_type)
+        if kind is None:
+            continue
+
+        bone = pbone.bone
+        params = pbone.rigify_parameters
+
+        if kind == 'FRAME':
+            bounds = frames[bone.name].outer
+        elif kind == 'SLIDER':
+            bounds = slider_footprint(bone.head_local, bone.tail_local, bone.length,
+                                      params.slider_type, params.clamp_up_down,
+                                      bool(params.custom_title))
+        else:
+            text = bone.name if '@name' in params.custom_text else params.custom_text
+            bounds = text_footprint(bone.head_local, bone.length, text)
+
+        footprints.append(Footprint(bone.name, kind, bounds))
+        ancestors[bone.name] = {parent.name for parent in bone.parent_recursive
+                                if parent.name in frames}
+
+    return footprints, ancestors
+
+
+def find_overlaps(footprints: list[Footprint],
+                  ancestors: Optional[dict[str, set[str]]] = None) -> list[tuple[str, str]]:
+
+    """
+    Reports every pair of overlapping footprints using a uniform grid.
+
+    The cell size follows the median control size, so each footprint only lands in
+    a handful of cells and only footprints sharing a cell are compared. A pair is
+    reported once, in the cell containing the corner of its intersection.
+
+    Args:
+        footprints: The footprints to check.
+        ancestors: For each control, the frames it belongs to. A frame never
+            overlaps the controls and frames it contains.
+
+    Returns:
+        The overlapping pairs of bone names, sorted.
+    """
+
+    ancestors = ancestors or {}
+    sizes = sorted(max(b[2] - b[0], b[3] - b[1]) for _, kind, b in footprints if kind != 'FRAME')
+    cell = sizes[len(sizes) // 2] if sizes else 1.0
+    cell = cell if cell > 0 else 1.0
+
+    grid: dict[tuple[int, int], list[int]] = {}
+    for index, (_, _, b) in enumerate(footprints):
+        for i in range(int(b[0] // cell), int(b[2] // cell) + 1):
+            for j in range(int(b[1] // cell), int(b[3] // cell) + 1):
+                grid.setdefault((i, j), []).append(index)
+
+    pairs = []
+    for (i, j), items in grid.items():
+        for n, first in enumerate(items):
+            name_a, _, a = footprints[first]
+            for second in items[n + 1:]:
+                name_b, _, b = footprints[second]
+
+                if not (a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]):
+                    continue
+
+                # Report in the cell holding the lower corner of the intersection only
+                if (int(max(a[0], b[0]) // cell), int(max(a[1], b[1]) // cell)) != (i, j):
+                    continue
+
+                if name_a in ancestors.get(name_b, ()) or name_b in ancestors.get(name_a, ()):
+                    continue
+
+                pairs.append(tuple(sorted((name_a, name_b))))
+
+    return sorted(pairs)
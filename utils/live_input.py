@@ -0,0 +1,245 @@
+import bpy
+import time
+import socket
+import numpy as np
+
+from typing import Optional
+
+from .sliders import get_slider_set
+from .live_protocol import (
+    LIVE_PORT, LIVE_NAMES, LIVE_VALUES, LIVE_MAX_PACKET, LIVE_REORDER_WINDOW,
+    decode_header, decode_values, decode_names, sequence_step
+)
+
+"""
+LIVE INPUT RECEIVER
+
+Listens on a localhost UDP port for the datagrams of utils/live_protocol.py and
+drives the sliders of a generated rig. Datagrams are read into one preallocated
+buffer and decoded as NumPy views, then scattered into a target array. A
+bpy.app.timers tick drains the socket once per redraw, eases the pose towards the
+target and writes every touched slider with a single SliderSet.set_values.
+"""
+
+LIVE_INTERVAL = 1 / 60      # Seconds between two ticks
+LIVE_LATENCY_EASE = 0.1     # Weight of the last datagram in the average latency
+
+
+class LiveInputServer:
+
+    """
+    The state of a running live input receiver.
+
+    Attributes:
+        obj_name: The name of the driven rig.
+        port: The UDP port listened to.
+        smoothing: 0 applies values as received, towards 1 eases them over more ticks.
+        target: The (N, 2) last received value of every slider.
+        current: The (N, 2) values written on the last tick.
+        touched: Which sliders were ever received.
+        remap: For each slot of the last NAMES datagram, its slider row (-1 if unknown).
+        received: The number of VALUES datagrams received.
+        dropped: The number of datagrams lost, from gaps in the sequence numbers. Late
+            datagrams are skipped, not counted.
+        latency: The average send to receive delay, in milliseconds.
+    """
+
+    obj_name: str
+    port: int
+    smoothing: float
+    target: np.ndarray
+    current: np.ndarray
+    touched: np.ndarray
+    remap: Optional[np.ndarray]
+    received: int
+    dropped: int
+    latency: float
+
+    def __init__(self, obj, port: int = LIVE_PORT, smoothing: float = 0.0):
+        self.obj_name = obj.name
+        self.port = port
+        self.smoothing = smoothing
+        self.remap = None
+        self.received = 0
+        self.dropped = 0
+        self.latency = 0.0
+        self.last_seq = None
+
+        self.buffer = bytearray(LIVE_MAX_PACKET)
+        self.view = memoryview(self.buffer)
+
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(('127.0.0.1', port))
+        self.sock.setblocking(False)
+
+        self.reset(obj)
+
+    def reset(self, obj):
+
+        """
+        Sizes the value arrays for the slider set of the rig, e.g. after a regenerate.
+        """
+
+        self.sliders = get_slider_set(obj)
+        count = len(self.sliders.names)
+        self.current = self.sliders.get_values(obj)
+        self.target = self.current.copy()
+        self.touched = np.zeros(count, dtype=bool)
+        self.remap = None
+
+    def _receive_names(self, view: memoryview, count: int):
+        index = self.sliders.index
+        # The trailing -1 catches the slots past the end of the table
+        names = decode_names(view, count)
+        self.remap = np.array([index.get(name, -1) for name in names] + [-1], dtype=np.int64)
+
+    def _receive_values(self, view: memoryview, count: int):
+        records = decode_values(view, count)
+        rows = records['slot'].astype(np.int64)
+
+        if self.remap is not None:
+            rows = self.remap[np.minimum(rows, len(self.remap) - 1)]
+
+        valid = (rows >= 0) & (rows < len(self.target))
+        rows = rows[valid]
+        self.target[rows, 0] = records['x'][valid]
+        self.target[rows, 1] = records['y'][valid]
+        self.touched[rows] = True
+
+    def poll(self) -> int:
+
+        """
+        Drains the socket into the target values.
+
+        Returns:
+            The number of datagrams read.
+        """
+
+        read = 0
+        now = time.time()
+
+        while True:
+            try:
+                size = self.sock.recv_into(self.buffer)
+            except (BlockingIOError, InterruptedError):
+                break
+
+            view = self.view[:size]
+            header = decode_header(view)
+            if header is None:
+                continue
+
+            kind, count, seq, sent = header
+            read += 1
+
+            step = 1 if self.last_seq is None else sequence_step(self.last_seq, seq)
+            if step > 0:
+                self.dropped += step - 1
+            elif step > -LIVE_REORDER_WINDOW:
+                # Reordered or duplicated: older than what was applied already
+                continue
+            # A far backward step is a restarted sender, which counts from 0 again
+            self.last_seq = seq
+
+            if kind == LIVE_NAMES:
+                self._receive_names(view, count)
+            elif kind == LIVE_VALUES:
+                self._receive_values(view, count)
+                self.received += 1
+                delay = (now - sent) * 1000.0
+                self.latency += (delay - self.latency) * (LIVE_LATENCY_EASE if self.received > 1 else 1.0)
+
+        return read
+
+    def apply(self, obj):
+
+        """
+        Moves the sliders towards the target values, in one batched write.
+        """
+
+        if not self.touched.any() or np.allclose(self.current, self.target, atol=1e-5):
+            return
+
+        self.current += (self.target - self.current) * (1.0 - self.smoothing)
+        self.sliders.set_values(obj, self.current, mask=self.touched)
+
+    def close(self):
+        self.sock.close()
+
+
+_server: Optional[LiveInputServer] = None
+
+
+def _live_input_tick() -> Optional[float]:
+
+    """
+    Timer callback reading the pending datagrams and writing the pose.
+    """
+
+    if _server is None:
+        return None
+
+    obj = bpy.data.objects.get(_server.obj_name)
+    if obj is None:
+        stop_live_input()
+        return None
+
+    if get_slider_set(obj) is not _server.sliders:
+        _server.reset(obj)
+
+    if _server.poll() or _server.smoothing:
+        _server.apply(obj)
+
+    return LIVE_INTERVAL
+
+
+def start_live_input(obj, port: int = LIVE_PORT, smoothing: float = 0.0):
+
+    """
+    Starts receiving live values for the sliders of a generated rig.
+
+    Args:
+        obj: The generated armature object.
+        port: The localhost UDP port to listen to.
+        smoothing: 0 applies values as received, towards 1 eases them over more ticks.
+    """
+
+    global _server
+
+    stop_live_input()
+    _server = LiveInputServer(obj, port, smoothing)
+    bpy.app.timers.register(_live_input_tick, first_interval=0.0)
+
+
+def stop_live_input():
+
+    """
+    Stops the live input receiver, if running.
+    """
+
+    global _server
+
+    if bpy.app.timers.is_registered(_live_input_tick):
+        bpy.app.timers.unregister(_live_input_tick)
+
+    if _server is not None:
+        _server.close()
+        _server = None
+
+
+def live_input_status() -> Optional[dict]:
+
+    """
+    Returns the counters of the running receiver, or None if stopped.
+    """
+
+    if _server is None:
+        return None
+
+    return {
+        'obj': _server.obj_name,
+        'port': _server.port,
+        'received': _server.received,
+        'dropped': _server.dropped,
+        'latency': _server.latency,
+    }
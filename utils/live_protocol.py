@@ -0,0 +1,204 @@
+import time
+import socket
+import struct
+import numpy as np
+
+from typing import Optional
+
+"""
+LIVE INPUT PROTOCOL
+
+Binary UDP datagrams streaming slider values to a generated rig (see
+utils/live_input.py for the receiver). Everything is little-endian:
+
+    header  magic "GUI1" | kind uint8 | pad | count uint16 | seq uint32 | sent float64
+    NAMES   count slider names, utf-8, separated by newlines
+    VALUES  count records of slot uint16 | x float32 | y float32
+
+Values are normalized like utils.sliders (location / range). A slot is a row of the
+rig slider table, unless the sender announced a NAMES table first: slots are then
+positions in that table, so named streams cost no string work per frame.
+
+Nothing in here imports bpy. Run this file to send a test stream:
+
+    python utils/live_protocol.py --names eye.L eye.R jaw --port 9050 --rate 60
+"""
+
+LIVE_MAGIC = b'GUI1'
+LIVE_PORT = 9050
+LIVE_HEADER = struct.Struct('<4sBxHId')
+LIVE_NAMES = 1
+LIVE_VALUES = 2
+LIVE_MAX_PACKET = 65507
+LIVE_SEQ_MASK = 0xFFFFFFFF  # Sequence numbers are uint32 and wrap around
+LIVE_REORDER_WINDOW = 1024  # Backward steps up to this many datagrams are late arrivals, past it a sender restart
+
+VALUE_DTYPE = np.dtype([('slot', '<u2'), ('x', '<f4'), ('y', '<f4')])
+
+
+def encode_names(names: list[str], seq: int = 0) -> bytes:
+
+    """
+    Builds a NAMES datagram announcing the slot order of the next VALUES datagrams.
+    """
+
+    body = "\n".join(names).encode('utf-8')
+
+    return LIVE_HEADER.pack(LIVE_MAGIC, LIVE_NAMES, len(names), seq, time.time()) + body
+
+
+def encode_values(slots, values, seq: int = 0) -> bytes:
+
+    """
+    Builds a VALUES datagram.
+
+    Args:
+        slots: The slot of each value (see the module description).
+        values: The (count, 2) normalized (X, Y) values.
+        seq: The sequence number, used by the receiver to count dropped frames.
+
+    Returns:
+        The datagram.
+    """
+
+    values = np.asarray(values, dtype=np.float32).reshape(-1, 2)
+    records = np.empty(len(values), dtype=VALUE_DTYPE)
+    records['slot'] = slots
+    records['x'] = values[:, 0]
+    records['y'] = values[:, 1]
+
+    return LIVE_HEADER.pack(LIVE_MAGIC, LIVE_VALUES, len(records), seq, time.time()) + records.tobytes()
+
+
+def decode_header(view: memoryview) -> Optional[tuple[int, int, int, float]]:
+
+    """
+    Reads the header of a datagram.
+
+    Returns:
+        The (kind, count, seq, sent) of the datagram, or None if it is not one.
+    """
+
+    if len(view) < LIVE_HEADER.size:
+        return None
+
+    magic, kind, count, seq, sent = LIVE_HEADER.unpack_from(view)
+
+    return (kind, count, seq, sent) if magic == LIVE_MAGIC else None
+
+
+def sequence_step(last: int, seq: int) -> int:
+
+    """
+    Returns how far a sequence number is past the last one, across the uint32 wrap.
+
+    Negative steps are datagrams arriving after a newer one.
+
+    >>> sequence_step(10, 11), sequence_step(0xFFFFFFFF, 2), sequence_step(11, 10)
+    (1, 3, -1)
+    """
+
+    step = (seq - last) & LIVE_SEQ_MASK
+
+    return step - (LIVE_SEQ_MASK + 1) if step > LIVE_SEQ_MASK // 2 else step
+
+
+def decode_values(view: memoryview, count: int) -> np.ndarray:
+
+    """
+    Returns the records of a VALUES datagram, as a view on the receive buffer.
+    """
+
+    count = min(count, (len(view) - LIVE_HEADER.size) // VALUE_DTYPE.itemsize)
+
+    return np.frombuffer(view, dtype=VALUE_DTYPE, count=count, offset=LIVE_HEADER.size)
+
+
+def decode_names(view: memoryview, count: int) -> list[str]:
+
+    """
+    Returns the names of a NAMES datagram.
+    """
+
+    names = bytes(view[LIVE_HEADER.size:]).decode('utf-8').split("\n")
+
+    return names[:count]
+
+
+class LiveInputSender:
+
+    """
+    Sends slider values to a running live input receiver.
+
+    Attributes:
+        address: The (host, port) of the receiver.
+        seq: The sequence number of the next datagram.
+    """
+
+    address: tuple[str, int]
+    seq: int
+
+    def __init__(self, port: int = LIVE_PORT, host: str = '127.0.0.1'):
+        self.address = (host, port)
+        self.seq = 0
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def _send(self, data: bytes):
+        self.sock.sendto(data, self.address)
+        self.seq = (self.seq + 1) % 2**32
+
+    def send_names(self, names: list[str]):
+
+        """
+        Announces the slider names the next send_values slots refer to.
+        """
+
+        self._send(encode_names(names, self.seq))
+
+    def send_values(self, values, slots=None):
+
+        """
+        Sends (count, 2) normalized values, for slots 0..count-1 unless given.
+        """
+
+        values = np.asarray(values, dtype=np.float32).reshape(-1, 2)
+        slots = np.arange(len(values)) if slots is None else slots
+        self._send(encode_values(slots, values, self.seq))
+
+    def close(self):
+        self.sock.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Send a test stream to the gian.ui live input receiver.")
+    parser.add_argument('--names', nargs='*', help="Slider names; slider table rows 0..N-1 when omitted")
+    parser.add_argument('--count', type=int, default=8, help="Number of indexed sliders without --names")
+    parser.add_argument('--port', type=int, default=LIVE_PORT)
+    parser.add_argument('--rate', type=float, default=60.0, help="Frames per second")
+    parser.add_argument('--seconds', type=float, default=10.0)
+    args = parser.parse_args()
+
+    sender = LiveInputSender(args.port)
+    count = len(args.names) if args.names else args.count
+    phase = np.linspace(0.0, np.pi, count, endpoint=False, dtype=np.float32)
+    values = np.zeros((count, 2), dtype=np.float32)
+
+    start = time.perf_counter()
+    frame = 0
+    while time.perf_counter() - start < args.seconds:
+        # Re-announce the names now and then, in case the receiver started late
+        if args.names and frame % int(args.rate) == 0:
+            sender.send_names(args.names)
+
+        t = time.perf_counter() - start
+        values[:, 0] = np.sin(t * 2.0 + phase)
+        values[:, 1] = np.cos(t * 3.0 + phase)
+        sender.send_values(values)
+
+        frame += 1
+        time.sleep(max(start + frame / args.rate - time.perf_counter(), 0.0))
+
+    sender.close()
+    print(f"Sent {frame} frames to {sender.address[0]}:{sender.address[1]}")
@@ -0,0 +1,113 @@
+import numpy as np
+
+from typing import NamedTuple
+
+"""
+MESH GEOMETRY AS ARRAYS
+
+Widget geometry read into NumPy arrays with foreach_get, combined without Python
+loops over vertices, and written back with foreach_set.
+"""
+
+
+class MeshArrays(NamedTuple):
+
+    """
+    The geometry of a mesh.
+
+    Attributes:
+        verts: (V, 3) float32 vertex positions.
+        edges: (E, 2) int32 edge vertex indices.
+        loop_starts: (F,) int32 first loop of each face.
+        loop_verts: (L,) int32 vertex index of each face corner.
+    """
+
+    verts: np.ndarray
+    edges: np.ndarray
+    loop_starts: np.ndarray
+    loop_verts: np.ndarray
+
+
+def empty_arrays() -> MeshArrays:
+
+    """
+    Returns the arrays of an empty mesh.
+    """
+
+    return MeshArrays(np.zeros((0, 3), dtype=np.float32), np.zeros((0, 2), dtype=np.int32),
+                      np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int32))
+
+
+def read_mesh_arrays(mesh) -> MeshArrays:
+
+    """
+    Reads the geometry of a mesh datablock.
+    """
+
+    verts = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+
+    mesh.vertices.foreach_get('co', verts)
+    mesh.edges.foreach_get('vertices', edges)
+    mesh.polygons.foreach_get('loop_start', loop_starts)
+    mesh.loops.foreach_get('vertex_index', loop_verts)
+
+    return MeshArrays(verts.reshape(-1, 3), edges.reshape(-1, 2), loop_starts, loop_verts)
+
+
+def write_mesh_arrays(mesh, arrays: MeshArrays):
+
+    """
+    Replaces the geometry of a mesh datablock.
+
+    Face corners also need their edge, so edges are recalculated when there are faces:
+    the given edges are kept and the missing face edges added.
+    """
+
+    mesh.clear_geometry()
+
+    mesh.vertices.add(len(arrays.verts))
+    mesh.edges.add(len(arrays.edges))
+    mesh.loops.add(len(arrays.loop_verts))
+    mesh.polygons.add(len(arrays.loop_starts))
+
+    mesh.vertices.foreach_set('co', np.ascontiguousarray(arrays.verts, dtype=np.float32).ravel())
+    mesh.edges.foreach_set('vertices', np.ascontiguousarray(arrays.edges, dtype=np.int32).ravel())
+    mesh.loops.foreach_set('vertex_index', np.ascontiguousarray(arrays.loop_verts, dtype=np.int32))
+    mesh.polygons.foreach_set('loop_start', np.ascontiguousarray(arrays.loop_starts, dtype=np.int32))
+
+    mesh.update(calc_edges=bool(len(arrays.loop_starts)))
+
+
+def transform_arrays(arrays: MeshArrays, matrix) -> MeshArrays:
+
+    """
+    Transforms the vertices by a 4x4 matrix (any nested sequence, e.g. a mathutils Matrix).
+    """
+
+    matrix = np.array(matrix, dtype=np.float32).reshape(4, 4)
+    verts = arrays.verts @ matrix[:3, :3].T + matrix[:3, 3]
+
+    return arrays._replace(verts=verts.astype(np.float32))
+
+
+def concat_arrays(parts: list[MeshArrays]) -> MeshArrays:
+
+    """
+    Joins several geometries into one, offsetting their indices.
+    """
+
+    if not parts:
+        return empty_arrays()
+
+    vert_offsets = np.cumsum([0] + [len(part.verts) for part in parts[:-1]])
+    loop_offsets = np.cumsum([0] + [len(part.loop_verts) for part in parts[:-1]])
+
+    return MeshArrays(
+        np.concatenate([part.verts for part in parts]),
+        np.concatenate([part.edges + offset for part, offset in zip(parts, vert_offsets)]).astype(np.int32),
+        np.concatenate([part.loop_starts + offset for part, offset in zip(parts, loop_offsets)]).astype(np.int32),
+        np.concatenate([part.loop_verts + offset for part, offset in zip(parts, vert_offsets)]).astype(np.int32),
+    )
@@ -0,0 +1,287 @@
+import os
+import json
+import tempfile
+import numpy as np
+
+from typing import Optional
+
+from .sliders import get_slider_set
+
+"""
+POSE SNAPSHOTS OF GIAN.UI SLIDERS
+
+A pose is one float32 array of normalized slider values, shaped (N, 2) like the
+arrays of utils.sliders. A library shares one index of slider names between all of
+its poses and is saved to a single binary file:
+
+    magic (8 bytes) | header length (uint32) | JSON header | padding | float32 data
+
+The data block is a contiguous (poses, N, 2) array, memory-mapped on load so that
+opening and browsing a large library does not read it all.
+"""
+
+POSE_LIBRARY_MAGIC = b'GUIPOSE1'
+POSE_LIBRARY_ALIGN = 16
+
+
+class PoseLibrary:
+
+    """
+    A set of slider poses sharing one index of slider names.
+
+    Attributes:
+        names: The slider control names, shared by all poses.
+        poses: The pose names, in storage order.
+    """
+
+    names: list[str]
+    poses: list[str]
+
+    def __init__(self, names: list[str], poses: Optional[list[str]] = None,
+                 data: Optional[np.ndarray] = None):
+
+        """
+        Creates a library, empty or from existing pose data.
+
+        Args:
+            names: The slider control names.
+            poses: The pose names.
+            data: The (len(poses), len(names), 2) float32 pose values.
+        """
+
+        self.names = list(names)
+        self.poses = list(poses or [])
+        self._pose_index = {name: i for i, name in enumerate(self.poses)}
+        self._data = data if data is not None else np.zeros((0, len(self.names), 2), dtype=np.float32)
+        self._remaps: dict[tuple[str, ...], tuple[np.ndarray, np.ndarray]] = {}
+
+    @classmethod
+    def from_rig(cls, obj) -> 'PoseLibrary':
+
+        """
+        Creates an empty library indexed on the sliders of a generated rig.
+        """
+
+        return cls(get_slider_set(obj).names)
+
+    @property
+    def data(self) -> np.ndarray:
+
+        """
+        The (poses, N, 2) values of all the poses.
+        """
+
+        return self._data[:len(self.poses)]
+
+    def __len__(self) -> int:
+        return len(self.poses)
+
+    def __contains__(self, pose: str) -> bool:
+        return pose in self._pose_index
+
+    def get(self, pose: str) -> np.ndarray:
+
+        """
+        Returns the (N, 2) values of a pose.
+        """
+
+        return self._data[self._pose_index[pose]]
+
+    def add(self, pose: str, values: np.ndarray):
+
+        """
+        Adds or replaces a pose.
+
+        Args:
+            pose: The pose name.
+            values: The (N, 2) normalized slider values, in library order.
+        """
+
+        values = np.asarray(values, dtype=np.float32).reshape(len(self.names), 2)
+
+        if pose in self._pose_index:
+            self._writable()[self._pose_index[pose]] = values
+            return
+
+        count = len(self.poses)
+        if count == len(self._data):
+            # Grow by doubling, so adding many poses stays linear
+            grown = np.zeros((max(count * 2, 8), len(self.names), 2), dtype=np.float32)
+            grown[:count] = self._data[:count]
+            self._data = grown
+
+        self._data[count] = values
+        self._pose_index[pose] = count
+        self.poses.append(pose)
+
+    def remove(self, pose: str):
+
+        """
+        Removes a pose.
+        """
+
+        index = self._pose_index.pop(pose)
+        data = np.delete(self.data, index, axis=0)
+
+        self.poses.pop(index)
+        self._pose_index = {name: i for i, name in enumerate(self.poses)}
+        self._data = data
+
+    def _writable(self) -> np.ndarray:
+
+        """
+        Copies memory-mapped data in memory before the first modification.
+        """
+
+        if isinstance(self._data, np.memmap):
+            self._data = np.array(self._data)
+
+        return self._data
+
+    def interpolate(self, pose_a: str, pose_b: str, factor: float) -> np.ndarray:
+
+        """
+        Linearly interpolates between two poses.
+
+        Returns:
+            The (N, 2) interpolated values.
+        """
+
+        a, b = self.get(pose_a), self.get(pose_b)
+
+        return a + (b - a) * np.float32(factor)
+
+    def mix(self, weights: dict[str, float]) -> np.ndarray:
+
+        """
+        Sums several poses with weights, in one matrix product.
+
+        Args:
+            weights: The pose names mapped to their weights.
+
+        Returns:
+            The (N, 2) mixed values.
+        """
+
+        indices = [self._pose_index[pose] for pose in weights]
+        factors = np.array(list(weights.values()), dtype=np.float32)
+
+        return np.tensordot(factors, self._data[indices], axes=1)
+
+    def _remap(self, sliders) -> tuple[np.ndarray, np.ndarray]:
+
+        """
+        Returns the rows of the rig sliders found in the library, and their library rows.
+        """
+
+        key = tuple(sliders.names)
+        remap = self._remaps.get(key)
+
+        if remap is None:
+            own = {name: i for i, name in enumerate(self.names)}
+            mask = np.array([name in own for name in sliders.names], dtype=bool)
+            rows = np.array([own[name] for name in sliders.names if name in own], dtype=np.int64)
+            remap = self._remaps[key] = (mask, rows)
+
+        return remap
+
+    def capture(self, obj, pose: str):
+
+        """
+        Stores the current slider values of a rig as a pose.
+        """
+
+        sliders = get_slider_set(obj)
+        mask, rows = self._remap(sliders)
+
+        values = np.zeros((len(self.names), 2), dtype=np.float32)
+        values[rows] = sliders.get_values(obj)[mask]
+
+        self.add(pose, values)
+
+    def apply_values(self, obj, values: np.ndarray, factor: float = 1.0):
+
+        """
+        Writes (N, 2) library-ordered values to a rig, optionally blended with its current pose.
+
+        Args:
+            obj: The generated armature object.
+            values: The values in library order.
+            factor: The blend factor, 1.0 replaces the current pose.
+        """
+
+        sliders = get_slider_set(obj)
+        mask, rows = self._remap(sliders)
+
+        current = sliders.get_values(obj)
+        target = current.copy()
+        target[mask] = values[rows]
+
+        if factor != 1.0:
+            target = current + (target - current) * np.float32(factor)
+
+        sliders.set_values(obj, target, mask=mask)
+
+    def apply(self, obj, pose: str, factor: float = 1.0):
+
+        """
+        Applies a pose to a rig, optionally blended with its current pose.
+        """
+
+        self.apply_values(obj, self.get(pose), factor)
+
+    def save(self, path: str):
+
+        """
+        Saves the library to a single binary file.
+
+        The file is written next to the target and moved over it, so saving back to
+        the file the library was loaded from never truncates the mapped data.
+        """
+
+        # Windows cannot replace a mapped file, so read the mapped poses in first
+        mapped = getattr(self._data, 'filename', None)
+        if mapped and os.path.exists(path) and os.path.samefile(mapped, path):
+            self._writable()
+
+        header = json.dumps({"names": self.names, "poses": self.poses, "dtype": "<f4"}).encode()
+        start = len(POSE_LIBRARY_MAGIC) + 4 + len(header)
+        padding = -start % POSE_LIBRARY_ALIGN
+
+        handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as file:
+                file.write(POSE_LIBRARY_MAGIC)
+                file.write(np.uint32(len(header)).tobytes())
+                file.write(header)
+                file.write(b'\0' * padding)
+                file.write(np.ascontiguousarray(self.data, dtype='<f4').tobytes())
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> 'PoseLibrary':
+
+        """
+        Loads a library, memory-mapping its pose data.
+        """
+
+        with open(path, 'rb') as file:
+            if file.read(len(POSE_LIBRARY_MAGIC)) != POSE_LIBRARY_MAGIC:
+                raise ValueError(f"{path} is not a gian.ui pose library")
+
+            length = int(np.frombuffer(file.read(4), dtype=np.uint32)[0])
+            header = json.loads(file.read(length))
+
+        start = len(POSE_LIBRARY_MAGIC) + 4 + length
+        start += -start % POSE_LIBRARY_ALIGN
+        shape = (len(header["poses"]), len(header["names"]), 2)
+
+        if shape[0]:
+            data = np.memmap(path, dtype=header["dtype"], mode='r', offset=start, shape=shape)
+        else:
+            data = None
+
+        return cls(header["names"], header["poses"], data)
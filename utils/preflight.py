@@ -0,0 +1,236 @@
+import bpy
+
+from rigify.utils.errors import MetarigError
+from rigify.utils.naming import ORG_PREFIX, DEF_PREFIX, MCH_PREFIX
+
+from .layout import get_ui_rig_kind, rig_parent
+from .core import TEXT_FONT
+
+"""
+PREFLIGHT OF GIAN.UI METARIGS
+
+Validates the rigify_parameters and parent relations of the gian.ui bones of a
+metarig and plans the generation without creating any datablock, so broken
+metarigs are rejected before the expensive widget work starts.
+"""
+
+RELINK_PREFIXES = {'CTRL', 'DEF', 'MCH', 'ORG'}
+GENERATED_PREFIXES = (ORG_PREFIX, DEF_PREFIX, MCH_PREFIX)
+
+# How each widget part is built: whether identical keys share a build, and its node group.
+# Boxes and frames are assembled from an untitled base part plus a TEXT title overlay.
+WIDGET_KINDS = {
+    'BOX': {'cached': True, 'node': 'GN-wgt_Box'},
+    'CTRL': {'cached': True, 'node': 'GN-wgt_Ctrl'},
+    'TEXT': {'cached': True, 'node': 'GN-wgt_Text'},
+    'FRAME': {'cached': False, 'node': None},
+}
+
+
+class PreflightPlan:
+
+    """
+    The result of a preflight: problems found and what a generate would do.
+
+    Attributes:
+        errors: Problems that would make the generation fail.
+        warnings: Problems that would generate an unexpected rig.
+        bones: The bones the gian.ui rigs would create.
+        constraints: The (bone, constraint type) pairs the gian.ui rigs would create.
+        widgets: For each widget part kind, the design key of every part.
+    """
+
+    errors: list[str]
+    warnings: list[str]
+    bones: list[str]
+    constraints: list[tuple[str, str]]
+    widgets: dict[str, list[tuple]]
+
+    def __init__(self):
+        self.errors = []
+        self.warnings = []
+        self.bones = []
+        self.constraints = []
+        self.widgets = {kind: [] for kind in WIDGET_KINDS}
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def widget_stats(self, kind: str) -> tuple[int, int, int]:
+
+        """
+        Returns the (total, distinct designs, cache hits) of a widget kind.
+        """
+
+        designs = self.widgets[kind]
+        distinct = len(set(designs))
+        hits = len(designs) - distinct if WIDGET_KINDS[kind]['cached'] else 0
+
+        return len(designs), distinct, hits
+
+    @property
+    def node_evaluations(self) -> int:
+
+        """
+        The estimated number of node group evaluations.
+        """
+
+        evaluations = 0
+        for kind, info in WIDGET_KINDS.items():
+            total, _, hits = self.widget_stats(kind)
+            if info['node']:
+                evaluations += total - hits
+
+        return evaluations
+
+    @property
+    def library_loads(self) -> int:
+
+        """
+        The estimated number of loads of the widget library: node groups stay loaded for
+        the session, so only the needed ones not loaded yet count.
+        """
+
+        return sum(1 for kind, info in WIDGET_KINDS.items()
+                   if self.widgets[kind] and info['node'] and info['node'] not in bpy.data.node_groups)
+
+    def raise_errors(self):
+
+        """
+        Raises a MetarigError listing all the errors, if any.
+        """
+
+        if self.errors:
+            raise MetarigError("gian.ui preflight failed:\n" + "\n".join(self.errors))
+
+    def summary(self) -> str:
+
+        """
+        Returns a readable report of the plan.
+        """
+
+        lines = [f"Bones to create: {len(self.bones)}",
+                 f"Constraints: {len(self.constraints)}"]
+
+        for kind in WIDGET_KINDS:
+            total, distinct, hits = self.widget_stats(kind)
+            lines.append(f"{kind} widgets: {total} ({distinct} distinct designs, {hits} cache hits)")
+
+        lines.append(f"Estimated node group evaluations: {self.node_evaluations}")
+        lines.append(f"Estimated library loads: {self.library_loads}")
+        lines += [f"WARNING: {warning}" for warning in self.warnings]
+        lines += [f"ERROR: {error}" for error in self.errors]
+
+        return "\n".join(lines)
+
+
+def check_relink_target(plan: PreflightPlan, bone_name: str, target: str, names: set[str], what: str):
+
+    """
+    Checks a relink target names a metarig bone or a prefix replacement.
+
+    Rigify matches the prefixes case-sensitively, so a wrongly cased prefix is an
+    error. Other unknown names may be bones created by other rigs, which only exist
+    in the generated rig: they are warnings.
+    """
+
+    if not target or target in names or target in RELINK_PREFIXES:
+        return
+
+    if target.upper() in RELINK_PREFIXES:
+        plan.errors.append(f"{bone_name}: {what} '{target}' must be written '{target.upper()}'")
+    elif target.startswith(GENERATED_PREFIXES):
+        plan.warnings.append(f"{bone_name}: {what} '{target}' is not derived from this metarig")
+    else:
+        plan.warnings.append(f"{bone_name}: {what} '{target}' is not in the metarig, "
+                             f"it must be created by another rig")
+
+
+def preflight(obj) -> PreflightPlan:
+
+    """
+    Validates the gian.ui bones of a metarig and plans their generation.
+
+    Args:
+        obj: The metarig armature object.
+
+    Returns:
+        The plan, with errors and warnings.
+    """
+
+    plan = PreflightPlan()
+    names = {pbone.name for pbone in obj.pose.bones}
+    children: dict[str, int] = {}
+
+    for pbone in obj.pose.bones:
+        if pbone.parent:
+            children[pbone.parent.name] = children.get(pbone.parent.name, 0) + 1
+
+    created = set()
+
+    def create(bone_name: str, owner: str):
+        if bone_name in created or (bone_name != owner and bone_name in names):
+            plan.errors.append(f"{owner}: generated bone '{bone_name}' clashes with another bone")
+        created.add(bone_name)
+        plan.bones.append(bone_name)
+
+    for pbone in obj.pose.bones:
+        kind = get_ui_rig_kind(pbone.rigify_type)
+        if kind is None:
+            continue
+
+        name = pbone.name
+        params = pbone.rigify_parameters
+
+        if pbone.bone.length <= 0:
+            plan.errors.append(f"{name}: zero length bone")
+
+        if kind == 'SLIDER':
+            # Like slider.Rig, the frame is the closest parent with a rig type
+            parent = rig_parent(pbone)
+            shared_panel = params.shared_panel and parent is not None and get_ui_rig_kind(parent.rigify_type) == 'FRAME'
+
+            create(name, name)
+            plan.constraints += [(f"ORG-{name}", 'COPY_TRANSFORMS'),
+                                 (name, 'LIMIT_LOCATION')]
+
+            # Shared panels are drawn by the frame widget, without a PAN bone
+            if not shared_panel:
+                create(f"PAN_{name}", name)
+                plan.constraints.append((f"PAN_{name}", 'LIMIT_LOCATION'))
+
+            if params.relink_constraints:
+                check_relink_target(plan, name, params.parent_bone, names, "parent bone")
+
+                for con in pbone.constraints:
+                    for target in con.name.split('@')[1:]:
+                        check_relink_target(plan, name, target, names, f"constraint '{con.name}' target")
+
+            title = name if '@name' in params.custom_title else params.custom_title
+            plan.widgets['BOX'].append((params.slider_type, params.clamp_up_down,
+                                        params.minimal_design, params.fill_pan))
+            plan.widgets['CTRL'].append((params.fill_slider, params.fill_pan))
+            if title:
+                plan.widgets['TEXT'].append((title, TEXT_FONT))
+
+        elif kind == 'FRAME':
+            create(name, name)
+
+            if not children.get(name):
+                plan.errors.append(f"{name}: empty frame, parent some bones to it")
+            if params.title and not params.custom_title:
+                plan.warnings.append(f"{name}: frame title is enabled but empty")
+            plan.widgets['FRAME'].append((name,))
+            if params.title and params.custom_title:
+                plan.widgets['TEXT'].append((params.custom_title, TEXT_FONT))
+
+        else:
+            create(name, name)
+
+            text = name if '@name' in params.custom_text else params.custom_text
+            if not text:
+                plan.errors.append(f"{name}: empty custom text")
+            plan.widgets['TEXT'].append((text, TEXT_FONT))
+
+    return plan
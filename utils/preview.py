@@ -0,0 +1,316 @@
+import bpy
+import time
+
+from mathutils import Matrix
+from typing import Optional, TYPE_CHECKING
+
+from rigify.utils.collections import ensure_collection
+
+from .layout import get_ui_rig_kind, compute_frame_layout
+from .core import WGT_PREFIX, WGT_GROUP_PREFIX, LARGE_ORIENTATION
+from .prewarm import run_with_window
+
+if TYPE_CHECKING:
+    from .mesh_data import MeshArrays
+
+"""
+LIVE WIDGET PREVIEW ON METARIGS
+
+While preview is enabled on a metarig, every gian.ui bone shows the widget it will
+get once generated, as the custom shape of the metarig bone itself. Shapes come from
+the same caches as the generator (base shapes, title overlays), so editing a rig
+parameter only rewrites one mesh and the frames around it.
+
+Parameter updates are applied from a bpy.app.timers tick on the next event loop
+iteration. Text edits are debounced, so a label is only evaluated once typing stops.
+Slider panels are always drawn on the slider bone, shared panel or not.
+"""
+
+PREVIEW_PROP = "gian_ui_preview"                        # Custom property on the metarig object
+PREVIEW_SHAPE_PROP = "gian_ui_preview_shape"            # Custom property keeping the own shape of a bone
+PREVIEW_PREFIX = WGT_PREFIX + "preview_"                # Prefix of the preview widget objects
+PREVIEW_COLLECTION = WGT_GROUP_PREFIX + "gian_preview"  # Hidden collection of the scene, saved with the file
+PREVIEW_TEXT_DELAY = 0.4                                # Seconds without edits before a text rebuild
+
+_pending: dict[tuple[str, str], float] = {}     # (metarig, bone) -> time the refresh is due
+
+
+def is_preview_shape(shape) -> bool:
+
+    """
+    Checks a custom shape is a preview widget.
+    """
+
+    return shape is not None and shape.name.startswith(PREVIEW_PREFIX)
+
+
+def _keep_shape(pbone):
+
+    """
+    Stores the custom shape of a bone before a preview replaces it.
+    """
+
+    # The preview object was deleted by hand: the stored shape is still the own one
+    if pbone.custom_shape is None and PREVIEW_SHAPE_PROP in pbone:
+        return
+
+    saved = {'bone_size': pbone.use_custom_shape_bone_size}
+    if pbone.custom_shape is not None:
+        saved['shape'] = pbone.custom_shape
+
+    pbone[PREVIEW_SHAPE_PROP] = saved
+
+
+def _restore_shape(pbone):
+
+    """
+    Gives a bone back the custom shape it had before the preview.
+    """
+
+    saved = pbone.get(PREVIEW_SHAPE_PROP)
+    pbone.custom_shape = saved.get('shape') if saved else None
+    pbone.use_custom_shape_bone_size = bool(saved.get('bone_size', True)) if saved else True
+
+    if saved is not None:
+        del pbone[PREVIEW_SHAPE_PROP]
+
+
+def drop_preview_shape(pbone):
+
+    """
+    Replaces a preview custom shape by the own shape of the bone, keeping any other shape.
+
+    Used by the ui rigs, so a metarig generated while previewing never copies them.
+    """
+
+    if is_preview_shape(pbone.custom_shape):
+        _restore_shape(pbone)
+
+
+def preview_arrays(pbone, rects: dict) -> Optional['MeshArrays']:
+
+    """
+    Computes the widget of a gian.ui metarig bone, in the space of that bone.
+
+    Args:
+        pbone: The metarig pose bone.
+        rects: The frame layout of the metarig (see utils.layout.compute_frame_layout).
+
+    Returns:
+        The widget arrays, or None if the bone is not a gian.ui rig.
+    """
+
+    from .mesh_data import transform_arrays, concat_arrays
+    from .wgt import boxArrays, ctrlArrays, textOverlayArrays, frameArrays
+
+    kind = get_ui_rig_kind(pbone.rigify_type)
+    params = pbone.rigify_parameters
+    bone = pbone.bone
+
+    if kind == 'SLIDER':
+        title = bone.name if '@name' in params.custom_title else params.custom_title
+        arrays = concat_arrays([
+            boxArrays(params.slider_type, params.clamp_up_down, title, params.minimal_design, params.fill_pan),
+            ctrlArrays(params.fill_slider, params.fill_pan),
+        ])
+
+        if 'LARGE' not in params.slider_type:
+            return arrays
+
+        # The generated bone is re-oriented, express its shape in the metarig bone space
+        rotation = bone.matrix_local.to_3x3().normalized().inverted() @ Matrix(LARGE_ORIENTATION).to_3x3()
+        return transform_arrays(arrays, rotation.to_4x4())
+
+    if kind == 'FRAME':
+        return frameArrays(rects[bone.name], params.title, params.custom_title, bone.head_local)
+
+    if kind == 'TEXT':
+        text = bone.name if '@name' in params.custom_text else params.custom_text
+        return textOverlayArrays(text)
+
+    return None
+
+
+def _preview_collection():
+
+    """
+    Returns the collection holding the preview widgets, creating it if needed.
+
+    It is linked hidden under the scene like the widget collections of generated rigs,
+    so the preview widgets the metarig bones point to are saved with the file.
+    """
+
+    return ensure_collection(bpy.context, PREVIEW_COLLECTION, hidden=True)
+
+
+def _assign_preview(obj, pbone, arrays: 'MeshArrays'):
+
+    """
+    Writes the preview widget of a bone, reusing its preview object if any.
+    """
+
+    from .mesh_data import write_mesh_arrays
+
+    wgt = pbone.custom_shape
+
+    if not is_preview_shape(wgt):
+        _keep_shape(pbone)
+        name = f"{PREVIEW_PREFIX}{obj.name}_{pbone.name}"
+        wgt = bpy.data.objects.new(name, bpy.data.meshes.new(name))
+        _preview_collection().objects.link(wgt)
+
+    write_mesh_arrays(wgt.data, arrays)
+
+    pbone.custom_shape = wgt
+    pbone.use_custom_shape_bone_size = get_ui_rig_kind(pbone.rigify_type) != 'FRAME'
+
+
+def refresh_preview(obj, bone_names: Optional[set[str]] = None):
+
+    """
+    Rebuilds the preview widgets of a metarig.
+
+    Args:
+        obj: The metarig armature object.
+        bone_names: The bones whose parameters changed. The frames containing them
+            are refreshed too. All the gian.ui bones when omitted.
+    """
+
+    rects = compute_frame_layout(obj)
+    bones = obj.pose.bones
+
+    if bone_names is None:
+        names = {pbone.name for pbone in bones if get_ui_rig_kind(pbone.rigify_type)}
+    else:
+        names = set()
+        for name in bone_names:
+            if name in bones:
+                names.add(name)
+                names.update(parent.name for parent in bones[name].bone.parent_recursive if parent.name in rects)
+
+    def build():
+        for name in names:
+            arrays = preview_arrays(bones[name], rects)
+            if arrays is not None:
+                _assign_preview(obj, bones[name], arrays)
+
+    # Uncached titles and shapes are evaluated with the GN builders, which need a window
+    run_with_window(build)
+
+
+def enable_preview(obj):
+
+    """
+    Turns the preview on for a metarig and builds all its widgets.
+    """
+
+    obj[PREVIEW_PROP] = True
+    refresh_preview(obj)
+
+
+def disable_preview(obj):
+
+    """
+    Turns the preview off for a metarig and removes all its preview widgets.
+
+    The bones get their own custom shape back.
+    """
+
+    for pbone in obj.pose.bones:
+        wgt = pbone.custom_shape
+        if is_preview_shape(wgt):
+            _restore_shape(pbone)
+            mesh = wgt.data
+            bpy.data.objects.remove(wgt)
+            bpy.data.meshes.remove(mesh)
+
+    if PREVIEW_PROP in obj:
+        del obj[PREVIEW_PROP]
+
+    # Once no metarig previews, the empty collection is not left in the scene
+    collection = bpy.data.collections.get(PREVIEW_COLLECTION)
+    if collection is not None and not collection.all_objects:
+        bpy.data.collections.remove(collection)
+
+
+def is_previewing(obj) -> bool:
+
+    """
+    Checks the preview is enabled on an object.
+    """
+
+    return obj is not None and bool(obj.get(PREVIEW_PROP))
+
+
+def _preview_tick() -> Optional[float]:
+
+    """
+    Timer callback refreshing the bones whose refresh is due.
+    """
+
+    now = time.perf_counter()
+    due: dict[str, set[str]] = {}
+
+    for key, when in list(_pending.items()):
+        if when <= now:
+            del _pending[key]
+            due.setdefault(key[0], set()).add(key[1])
+
+    for obj_name, bone_names in due.items():
+        obj = bpy.data.objects.get(obj_name)
+        if is_previewing(obj):
+            refresh_preview(obj, bone_names)
+
+    if not _pending:
+        return None
+
+    return max(min(_pending.values()) - now, 0.0)
+
+
+def _schedule(params, delay: float):
+
+    """
+    Queues the refresh of the bone owning a rigify_parameters group.
+    """
+
+    obj = params.id_data
+    if not is_previewing(obj):
+        return
+
+    # 'pose.bones["Name"].rigify_parameters' -> the pose bone
+    pbone = obj.path_resolve(params.path_from_id().rsplit('.', 1)[0])
+    _pending[(obj.name, pbone.name)] = time.perf_counter() + delay
+
+    if bpy.app.timers.is_registered(_preview_tick):
+        bpy.app.timers.unregister(_preview_tick)
+    bpy.app.timers.register(_preview_tick, first_interval=max(min(_pending.values()) - time.perf_counter(), 0.0))
+
+
+def update_preview(params, context):
+
+    """
+    Update callback of the rig parameters changing the widget shape.
+    """
+
+    _schedule(params, 0.0)
+
+
+def update_preview_text(params, context):
+
+    """
+    Update callback of the rig parameters changing a label, debounced.
+    """
+
+    _schedule(params, PREVIEW_TEXT_DELAY)
+
+
+def stop_preview():
+
+    """
+    Drops the pending refreshes, e.g. when the feature set is unregistered.
+    """
+
+    _pending.clear()
+
+    if bpy.app.timers.is_registered(_preview_tick):
+        bpy.app.timers.unregister(_preview_tick)
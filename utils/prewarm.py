@@ -0,0 +1,187 @@
+import bpy
+import os
+import time
+
+from typing import Callable, Optional
+
+
+"""
+BACKGROUND PREWARM OF WIDGET ASSETS
+
+The first generate of a session resolves the install path, loads the GN-wgt_* node
+groups from custom_wgts.blend, evaluates the base shapes of every box and control
+design, and prepares the glyphs of the bundled font. Prewarming does the same work
+ahead of time in small bpy.app.timers slices, one step per tick, so the UI never
+blocks for more than a single step. Steps wait while the user is not in object mode,
+and leave the active object as it was.
+
+Opt in by setting the GIAN_UI_PREWARM environment variable, or run it from the tools panel.
+"""
+
+PREWARM_ENV = "GIAN_UI_PREWARM"
+PREWARM_INTERVAL = 0.05     # Seconds between two slices
+PREWARM_GLYPHS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.@-"
+
+_status = {'state': 'IDLE', 'step': 0, 'total': 0, 'current': '', 'error': '', 'seconds': 0.0}
+
+
+def _discard(obj):
+
+    """
+    Removes a throwaway widget object and its mesh.
+    """
+
+    mesh = obj.data
+    bpy.data.objects.remove(obj)
+    bpy.data.meshes.remove(mesh)
+
+
+def _prewarm_steps() -> list[tuple[str, Callable[[], None]]]:
+
+    """
+    Returns the prewarm steps, each small enough to run in one timer tick.
+    """
+
+    from .widget_pack import BOX_VARIANTS, CTRL_VARIANTS
+    from .wgt import widgetBlendPath, widgetPack, importWidgetNodes, boxBaseArrays, ctrlArrays, textWidget
+
+    steps = [
+        ("Resolve widget library", widgetBlendPath),
+        ("Map widget pack", widgetPack),
+        ("Load widget node groups", importWidgetNodes),
+    ]
+
+    # One slice per base shape, filling the widget caches used at generation
+    for design, clp, minimal, fill in BOX_VARIANTS:
+        steps.append((f"Box {design} {clp}", lambda args=(design, clp, minimal, fill): boxBaseArrays(*args)))
+
+    for fill, offset in CTRL_VARIANTS:
+        steps.append(("Control", lambda args=(fill, offset): ctrlArrays(*args)))
+
+    steps.append(("Prepare font glyphs", lambda: _discard(textWidget('WGT-prewarm', PREWARM_GLYPHS))))
+
+    return steps
+
+
+_steps: list[tuple[str, Callable[[], None]]] = []
+
+
+def _keep_active(func: Callable[[], None]):
+
+    """
+    Runs a step, leaving the active object of the user as it was.
+
+    The Geometry Nodes builders link a throwaway object to the scene and make it
+    active to apply its modifier.
+    """
+
+    objects = bpy.context.view_layer.objects
+    active = objects.active
+
+    try:
+        func()
+    finally:
+        if objects.active != active:
+            objects.active = active
+
+
+def run_with_window(func: Callable[[], None]):
+
+    """
+    Runs a step with a window in the context, as the widget builders use operators.
+    """
+
+    windows = bpy.context.window_manager.windows if bpy.context.window_manager else []
+
+    if windows:
+        with bpy.context.temp_override(window=windows[0]):
+            _keep_active(func)
+    else:
+        _keep_active(func)
+
+
+def _prewarm_tick() -> Optional[float]:
+
+    """
+    Timer callback running one prewarm step.
+    """
+
+    if _status['state'] != 'RUNNING' or not _steps:
+        return None
+
+    # Wait for the user to leave edit, pose or sculpt mode, where modifiers cannot be applied
+    if bpy.context.mode != 'OBJECT':
+        return PREWARM_INTERVAL
+
+    name, func = _steps.pop(0)
+    _status['current'] = name
+    start = time.perf_counter()
+
+    try:
+        run_with_window(func)
+    except Exception as error:
+        _status['state'] = 'FAILED'
+        _status['error'] = f"{name}: {error}"
+        _steps.clear()
+        return None
+
+    _status['seconds'] += time.perf_counter() - start
+    _status['step'] += 1
+
+    if not _steps:
+        _status['state'] = 'DONE'
+        _status['current'] = ''
+        return None
+
+    return PREWARM_INTERVAL
+
+
+def start_prewarm(first_interval: float = 1.0):
+
+    """
+    Schedules the prewarm, unless it is already running or done.
+
+    Args:
+        first_interval: Delay before the first slice, in seconds.
+    """
+
+    if _status['state'] in {'RUNNING', 'DONE'}:
+        return
+
+    _steps[:] = _prewarm_steps()
+    _status.update(state='RUNNING', step=0, total=len(_steps), current='', error='', seconds=0.0)
+
+    bpy.app.timers.register(_prewarm_tick, first_interval=first_interval, persistent=True)
+
+
+def stop_prewarm():
+
+    """
+    Cancels a running prewarm.
+    """
+
+    if bpy.app.timers.is_registered(_prewarm_tick):
+        bpy.app.timers.unregister(_prewarm_tick)
+
+    _steps.clear()
+    if _status['state'] == 'RUNNING':
+        _status['state'] = 'IDLE'
+
+
+def prewarm_status() -> dict:
+
+    """
+    Returns the prewarm status: state ('IDLE', 'RUNNING', 'DONE' or 'FAILED'), the
+    step reached out of total, the current step name, the error and the time spent.
+    """
+
+    return dict(_status)
+
+
+def prewarm_requested() -> bool:
+
+    """
+    Checks whether the prewarm was opted in through the environment.
+    """
+
+    return os.environ.get(PREWARM_ENV, '').lower() not in {'', '0', 'false', 'no'}
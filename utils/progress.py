@@ -0,0 +1,296 @@
+import bpy
+import time
+import signal
+import threading
+
+from typing import Optional
+
+from rigify.base_generate import GeneratorPlugin
+from rigify.utils.errors import MetarigError
+
+from .widget_engine import add_timing_hook, remove_timing_hook
+
+"""
+GENERATION PROGRESS OF GIAN.UI RIGS
+
+The ui rigs register with GenerationProgress when they initialize and report each
+widget they build or reuse. Progress (stage, rig index out of total, widgets built
+versus reused, ETA from the observed cost per rig) goes to the window manager
+progress bar, or to the console when Blender runs in background.
+
+Generation can be cancelled cooperatively: request_cancel() makes the next ui rig
+stop before its widgets, remove every widget object created so far by this
+generation and raise a MetarigError. Generation blocks the Blender UI, so only a
+background process (Ctrl+C) or another thread can request it: an interactive
+session has no way to cancel.
+"""
+
+PROGRESS_CONSOLE_INTERVAL = 1.0     # Seconds between two console reports
+
+# Plugin stages run after the rigs of the same stage, so each one announces the next
+PROGRESS_STAGES = ('initialize', 'prepare_bones', 'generate_bones', 'rig_bones', 'generate_widgets', 'done')
+
+_cancel = threading.Event()
+_active: Optional['GenerationProgress'] = None
+
+
+def request_cancel():
+
+    """
+    Asks the running generation to stop at the next widget. Safe from any thread.
+    """
+
+    _cancel.set()
+
+
+class GenerationProgress(GeneratorPlugin):
+
+    """
+    Tracks and reports the progress of the ui rigs of a generation.
+
+    Attributes:
+        rigs: The ui rigs of this generation, in registration order.
+        stage: The current generator stage.
+        done: The number of rigs whose widgets are done.
+        built: The number of widget objects built with their own mesh.
+        mirrored: The number of widget objects created sharing the mesh of the other side.
+        reused: The number of widgets reused from a previous generation.
+        created: The widget objects created by this generation, removed on cancel.
+        builds: The widget geometry builds of each backend, from the widget engine.
+        notes: Functions returning extra lines for the summary, from other plugins.
+    """
+
+    rigs: list
+    stage: str
+    done: int
+    built: int
+    mirrored: int
+    reused: int
+    created: list
+    builds: dict[str, int]
+    notes: list
+
+    def __init__(self, generator):
+        super().__init__(generator)
+
+        self.rigs = []
+        self.stage = 'initialize'
+        self.done = 0
+        self.built = 0
+        self.mirrored = 0
+        self.reused = 0
+        self.created = []
+        self.builds = {}
+        self.notes = []
+        self.widget_seconds = 0.0
+        self.widget_start = None
+        self.created_start = 0
+        self.last_report = 0.0
+        self.headless = bpy.app.background
+        self.window_manager = None if self.headless else bpy.context.window_manager
+        self.previous_sigint = None
+
+        # A generation that failed before finalize never cleaned up
+        global _active
+        if _active is not None:
+            _active.cleanup()
+        _active = self
+
+        _cancel.clear()
+        add_timing_hook(self._count_build)
+
+        # Ctrl+C in a background process cancels cleanly instead of aborting mid-stage
+        if self.headless and threading.current_thread() is threading.main_thread():
+            self.previous_sigint = signal.signal(signal.SIGINT, lambda signum, frame: request_cancel())
+
+    def _count_build(self, kind: str, backend: str, seconds: float, built: bool):
+        if built:
+            self.builds[backend] = self.builds.get(backend, 0) + 1
+
+    def add(self, rig):
+
+        """
+        Registers a ui rig, from its initialize.
+        """
+
+        self.rigs.append(rig)
+
+    def add_note(self, note):
+
+        """
+        Registers a function returning a line to print with the summary.
+        """
+
+        self.notes.append(note)
+
+    def finish(self, stage: str):
+
+        """
+        Records the end of a generator stage, and so the start of the next one.
+        """
+
+        self.stage = PROGRESS_STAGES[PROGRESS_STAGES.index(stage) + 1]
+
+        if self.stage == 'generate_widgets' and self.window_manager:
+            self.window_manager.progress_begin(0, max(len(self.rigs), 1))
+
+        self.report(force=True)
+
+    def initialize(self):
+        self.finish('initialize')
+
+    def prepare_bones(self):
+        self.finish('prepare_bones')
+
+    def generate_bones(self):
+        self.finish('generate_bones')
+
+    def rig_bones(self):
+        self.finish('rig_bones')
+
+    def begin_widgets(self, rig):
+
+        """
+        Cancel point before the widgets of a rig.
+
+        Raises:
+            MetarigError: If a cancel was requested.
+        """
+
+        from .widget_sync import WidgetIndex
+
+        if _cancel.is_set():
+            self.cancel(rig)
+
+        self.widget_start = time.perf_counter()
+        self.created_start = len(WidgetIndex(self.generator).created)
+
+    def end_widgets(self, rig, widgets: list):
+
+        """
+        Records the widgets of a rig, once they are done.
+
+        Args:
+            rig: The ui rig.
+            widgets: The widgets returned by the widget functions, None when not built.
+        """
+
+        from .widget_sync import WidgetIndex
+
+        if self.widget_start is not None:
+            self.widget_seconds += time.perf_counter() - self.widget_start
+            self.widget_start = None
+
+        # Every object created since begin_widgets, returned or sharing the mirror mesh
+        created = WidgetIndex(self.generator).created[self.created_start:]
+        built = sum(obj is not None for obj in widgets)
+
+        self.created += created
+        self.built += built
+        self.mirrored += len(created) - built
+        self.reused += len(widgets) - len(created)
+
+        self.done += 1
+        self.report()
+
+    def eta(self) -> Optional[float]:
+
+        """
+        Returns the seconds left for the widgets, from the average cost of the done rigs.
+        """
+
+        if not self.done:
+            return None
+
+        return self.widget_seconds / self.done * (len(self.rigs) - self.done)
+
+    def status(self) -> str:
+
+        """
+        Returns a one line description of the progress.
+        """
+
+        text = (f"gian.ui {self.stage}: {self.done}/{len(self.rigs)} rigs, "
+                f"{self.built} widgets built, {self.mirrored} mirrored, {self.reused} reused")
+
+        eta = self.eta()
+        if eta is not None and self.done < len(self.rigs):
+            text += f", {eta:.1f}s left"
+
+        return text
+
+    def report(self, force: bool = False):
+
+        """
+        Updates the progress bar, or prints the progress to the console now and then.
+        """
+
+        if self.window_manager:
+            if self.stage == 'generate_widgets':
+                self.window_manager.progress_update(self.done)
+            return
+
+        now = time.perf_counter()
+        if force or now - self.last_report >= PROGRESS_CONSOLE_INTERVAL:
+            self.last_report = now
+            print(self.status())
+
+    def cleanup(self):
+
+        """
+        Ends the progress bar and restores what the generation changed.
+        """
+
+        global _active
+        if _active is self:
+            _active = None
+
+        remove_timing_hook(self._count_build)
+
+        if self.window_manager:
+            self.window_manager.progress_end()
+
+        if self.previous_sigint is not None:
+            signal.signal(signal.SIGINT, self.previous_sigint)
+            self.previous_sigint = None
+
+    def cancel(self, rig):
+
+        """
+        Removes the widget objects created by this generation and stops it.
+
+        Raises:
+            MetarigError: Always, to abort the generation.
+        """
+
+        # Meshes shared by both sides are only unused once both objects are gone
+        meshes = {obj.data for obj in self.created if obj.data is not None}
+        for obj in self.created:
+            bpy.data.objects.remove(obj)
+        for mesh in meshes:
+            if not mesh.users:
+                bpy.data.meshes.remove(mesh)
+
+        self.created.clear()
+        _cancel.clear()
+        self.cleanup()
+
+        raise MetarigError(f"Generation cancelled before the widgets of {rig.base_bone} "
+                           f"({self.done}/{len(self.rigs)} ui rigs done)")
+
+    def finalize(self):
+
+        """
+        Ends the progress bar and prints the summary of the generation.
+        """
+
+        self.stage = 'done'
+        self.cleanup()
+
+        builds = ", ".join(f"{count} {backend}" for backend, count in sorted(self.builds.items()))
+        print(f"gian.ui: {len(self.rigs)} rigs, {self.built} widgets built, {self.mirrored} mirrored, "
+              f"{self.reused} reused "
+              f"in {self.widget_seconds:.2f}s" + (f" (geometry: {builds})" if builds else ""))
+
+        for note in self.notes:
+            print(f"gian.ui: {note()}")
@@ -0,0 +1,236 @@
+import bpy
+
+from .layout import get_ui_rig_kind, compute_frame_layout, rig_parent
+from .core import WGT_PREFIX, CLAMP_CODES, SLIDERS_PROP, slider_limits, box_key, ctrl_key
+
+"""
+WIDGET-ONLY REBUILD OF GENERATED UI RIGS
+
+Reads the gian.ui parameters of a metarig and rewrites the widget meshes of the
+generated rig in place: slider controls and panels, frames (with their shared
+panels) and texts. Bones, constraints and animation are left alone, except for the
+slider limits when a clamp changes.
+
+Changes that alter the bones themselves (slider type, shared panel) are reported
+and need a full generate.
+"""
+
+
+class RebuildReport:
+
+    """
+    The outcome of a widget-only rebuild.
+
+    Attributes:
+        rebuilt: The number of widget meshes rewritten.
+        skipped: The metarig bones that need a full generate, with the reason.
+    """
+
+    rebuilt: int
+    skipped: list[tuple[str, str]]
+
+    def __init__(self):
+        self.rebuilt = 0
+        self.skipped = []
+
+    def summary(self) -> str:
+
+        """
+        Returns a one line summary of the rebuild.
+        """
+
+        text = f"Rebuilt {self.rebuilt} widgets"
+        if self.skipped:
+            text += f", {len(self.skipped)} bones need a full generate ({self.skipped[0][0]}: {self.skipped[0][1]})"
+
+        return text
+
+
+def find_target_rig(metarig):
+
+    """
+    Returns the rig generated from a metarig, or None.
+    """
+
+    return getattr(metarig.data, 'rigify_target_rig', None)
+
+
+def _write_widget(shape, arrays, written: dict[int, tuple], design: tuple) -> bool:
+
+    """
+    Writes a widget mesh in place, once per rebuild and design.
+
+    Widgets sharing a mesh (mirrored sides, same labels) keep sharing it while their
+    design matches: the first widget of a mesh rebuilds it for all of them. A widget
+    whose design now differs from the one already written gets its own mesh.
+
+    Args:
+        shape: The widget object, or None.
+        arrays: The new geometry.
+        written: The design written to each mesh so far, by mesh pointer, updated.
+        design: The key of the design of this widget.
+
+    Returns:
+        True if a mesh was written.
+    """
+
+    if shape is None:
+        return False
+
+    done = written.get(shape.data.as_pointer())
+    if done == design:
+        return False
+    if done is not None:
+        shape.data = shape.data.copy()
+
+    from .wgt import fillWidget
+
+    fillWidget(shape, arrays)
+    written[shape.data.as_pointer()] = design
+
+    return True
+
+
+def _generated_large(rig, ctrl: str) -> bool:
+
+    """
+    Checks a slider was generated as LARGE, from the slider table of the rig.
+    """
+
+    table = rig.data.get(SLIDERS_PROP)
+    if table is None or ctrl not in table["names"]:
+        return False
+
+    return bool(table["large"][list(table["names"]).index(ctrl)])
+
+
+def _set_slider_clamp(rig, ctrl: str, params):
+
+    """
+    Updates the limits and the slider table entry of a slider after a clamp change.
+    """
+
+    limits = slider_limits(params.slider_type, params.clamp_up_down, rig.data.bones[ctrl].length)
+
+    for con in rig.pose.bones[ctrl].constraints:
+        if con.type == 'LIMIT_LOCATION':
+            if (con.min_x, con.min_y, con.min_z) != tuple(limits.min_xyz):
+                con.min_x, con.min_y, con.min_z = limits.min_xyz
+            if (con.max_x, con.max_y, con.max_z) != tuple(limits.max_xyz):
+                con.max_x, con.max_y, con.max_z = limits.max_xyz
+            break
+
+    table = rig.data.get(SLIDERS_PROP)
+    if table is None or ctrl not in table["names"]:
+        return
+
+    clamp = list(table["clamp"])
+    index = list(table["names"]).index(ctrl)
+    code = CLAMP_CODES.get(params.clamp_up_down, 0)
+
+    if clamp[index] != code:
+        clamp[index] = code
+        table["clamp"] = clamp
+        # A new stamp makes utils.sliders rebuild its cached SliderSet
+        table["stamp"] = (table["stamp"] + 1) % 2**31
+
+
+def rebuild_widgets(metarig, rig) -> RebuildReport:
+
+    """
+    Rewrites the widgets of a generated rig from the current metarig parameters.
+
+    Args:
+        metarig: The metarig armature object.
+        rig: The armature object generated from it.
+
+    Returns:
+        What was rebuilt and what needs a full generate.
+    """
+
+    from .wgt import boxArrays, ctrlArrays, textOverlayArrays, frameArrays, sharedPanelArrays, mergeWidgetArrays
+
+    report = RebuildReport()
+    pose = rig.pose.bones
+    rects = compute_frame_layout(metarig)
+    shared: dict[str, list] = {}
+    frames = []
+    text_meshes = {}
+    written = {}
+
+    for pbone in metarig.pose.bones:
+        kind = get_ui_rig_kind(pbone.rigify_type)
+        if kind is None:
+            continue
+
+        name = pbone.name
+        params = pbone.rigify_parameters
+
+        if name not in pose:
+            report.skipped.append((name, "not generated"))
+            continue
+
+        if kind == 'FRAME':
+            frames.append(pbone)
+
+        elif kind == 'SLIDER':
+            parent = rig_parent(pbone)
+            is_shared = params.shared_panel and parent is not None and get_ui_rig_kind(parent.rigify_type) == 'FRAME'
+            panel = f"PAN_{name}"
+
+            if is_shared == (panel in pose):
+                report.skipped.append((name, "shared panel changed"))
+                continue
+
+            if ('LARGE' in params.slider_type) != _generated_large(rig, name):
+                report.skipped.append((name, "slider type changed"))
+                continue
+
+            _set_slider_clamp(rig, name, params)
+
+            title = name if '@name' in params.custom_title else params.custom_title
+            design = dict(design=params.slider_type, clp=params.clamp_up_down, txt=title,
+                          minimal=params.minimal_design, fill=params.fill_pan)
+
+            report.rebuilt += _write_widget(pose[name].custom_shape, ctrlArrays(params.fill_slider, params.fill_pan),
+                                            written, ctrl_key(params.fill_slider, params.fill_pan))
+
+            if is_shared:
+                shared.setdefault(parent.name, []).append((name, rig.data.bones[name].length, design))
+            else:
+                panel_key = box_key(params.slider_type, params.clamp_up_down, params.minimal_design, params.fill_pan)
+                report.rebuilt += _write_widget(pose[panel].custom_shape, boxArrays(**design), written,
+                                                panel_key + (title,))
+
+        elif kind == 'TEXT':
+            shape = pose[name].custom_shape
+            text = name if '@name' in params.custom_text else params.custom_text
+
+            # Texts with the same label keep sharing one mesh
+            if shape is None:
+                continue
+            if text in text_meshes:
+                old = shape.data
+                shape.data = text_meshes[text]
+                if not old.users:
+                    bpy.data.meshes.remove(old)
+                continue
+
+            report.rebuilt += _write_widget(shape, textOverlayArrays(text), written, ('TEXT', text))
+            shape.data.name = f"{WGT_PREFIX}{rig.name}_text_{text}"
+            text_meshes[text] = shape.data
+
+    # Frames last, once the shared panels of their sliders are known
+    for pbone in frames:
+        name = pbone.name
+        params = pbone.rigify_parameters
+        shape = pose[name].custom_shape
+        head = rig.data.bones[name].head_local
+
+        if _write_widget(shape, frameArrays(rects[name], params.title, params.custom_title, head), written,
+                         ('FRAME', name)):
+            report.rebuilt += 1
+            if name in shared:
+                mergeWidgetArrays(shape, sharedPanelArrays(rig, name, shared[name]))
+
+    return report
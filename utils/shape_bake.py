@@ -0,0 +1,286 @@
+import bpy
+import numpy as np
+
+from typing import Optional, Sequence
+
+from .sliders import get_slider_set
+from .capture import INTERPOLATION_LINEAR, ColumnMapping, default_mapping
+
+"""
+BAKE SLIDERS TO SHAPE KEYS
+
+Turns the slider animation of a generated rig into shape key weight F-Curves, for
+targets that cannot evaluate the rig. A shape key weight is the normalized slider
+value (location / range, clamped like the LIMIT_LOCATION constraint) times a scale,
+so most channels never need the depsgraph: the control F-Curves are sampled on a
+throwaway copy of the action, read with one foreach_get each, mapped for all frames
+at once and written with one foreach_set per shape key.
+
+Sliders whose value is not just their own F-Curve (drivers on the location, extra
+constraints, NLA) are sampled frame by frame from the evaluated pose instead.
+"""
+
+# A shape key maps to a slider control, a local axis (0 = X, 1 = Y) and a weight scale
+ShapeMapping = ColumnMapping
+
+
+class ShapeBakeReport:
+
+    """
+    The outcome of a shape key bake.
+
+    Attributes:
+        frames: The number of baked frames.
+        analytic: The shape keys computed from the control F-Curves.
+        sampled: The shape keys sampled from the evaluated pose.
+        driven: The baked shape keys still having a driver, which overrides the F-Curve.
+    """
+
+    frames: int
+    analytic: list[str]
+    sampled: list[str]
+    driven: list[str]
+
+    def __init__(self):
+        self.frames = 0
+        self.analytic = []
+        self.sampled = []
+        self.driven = []
+
+    def summary(self) -> str:
+
+        """
+        Returns a one line description of the bake.
+        """
+
+        text = (f"Baked {len(self.analytic) + len(self.sampled)} shape keys over {self.frames} frames "
+                f"({len(self.sampled)} sampled from the pose)")
+        if self.driven:
+            text += f", {len(self.driven)} still driven"
+
+        return text
+
+
+def default_shape_mapping(key_names: list[str], names: list[str], shape_keys: Sequence[str] = ()) -> ShapeMapping:
+
+    """
+    Maps every shape key driven by a slider control (its Shape Key parameter), or
+    named like one, to the Y axis of the control with unit scale.
+    """
+
+    return default_mapping(key_names, names, shape_keys)
+
+
+def is_analytic(obj, name: str) -> bool:
+
+    """
+    Checks the value of a slider only comes from its own location F-Curves.
+
+    The control must have no driver on its location, and no constraint besides the
+    LIMIT_LOCATION of the slider rig, which the mapping already applies.
+    """
+
+    pbone = obj.pose.bones[name]
+    constraints = [con for con in pbone.constraints if con.enabled and con.influence > 0.0]
+    if len(constraints) > 1 or any(con.type != 'LIMIT_LOCATION' or con.owner_space != 'LOCAL'
+                                   for con in constraints):
+        return False
+
+    drivers = obj.animation_data.drivers if obj.animation_data else ()
+    data_path = f'pose.bones["{bpy.utils.escape_identifier(name)}"].location'
+
+    return not any(driver.data_path == data_path for driver in drivers)
+
+
+def _uses_nla(obj) -> bool:
+
+    """
+    Checks the rig animation also comes from NLA strips, not only the active action.
+    """
+
+    anim = obj.animation_data
+    return anim is not None and anim.use_nla and any(not track.mute and track.strips for track in anim.nla_tracks)
+
+
+def sample_curves(action, channels: list[tuple[str, int]], frame_start: int, frame_end: int) -> dict:
+
+    """
+    Samples the location F-Curves of slider controls at every frame of a range.
+
+    The curves are converted to samples on a copy of the action, so the evaluation
+    (keyframes and modifiers) runs in Blender and the original action is untouched.
+
+    Args:
+        action: The action animating the rig, or None.
+        channels: The (control name, axis) channels to sample.
+        frame_start: The first frame.
+        frame_end: The last frame, included.
+
+    Returns:
+        The (frame_end - frame_start + 1) float32 values of each animated channel.
+    """
+
+    if action is None:
+        return {}
+
+    copy = action.copy()
+    count = frame_end - frame_start + 1
+    samples = {}
+
+    try:
+        for name, axis in channels:
+            fcurve = copy.fcurves.find(f'pose.bones["{bpy.utils.escape_identifier(name)}"].location', index=axis)
+            # A curve without keys does not animate the channel, and convert_to_samples fails on it
+            if fcurve is None or fcurve.mute or len(fcurve.keyframe_points) == 0:
+                continue
+
+            fcurve.convert_to_samples(frame_start, frame_end)
+            co = np.empty(len(fcurve.sampled_points) * 2, dtype=np.float32)
+            fcurve.sampled_points.foreach_get('co', co)
+            samples[(name, axis)] = co[1::2][:count]
+    finally:
+        bpy.data.actions.remove(copy)
+
+    return samples
+
+
+def sample_pose(obj, scene, names: list[str], frames: np.ndarray) -> np.ndarray:
+
+    """
+    Reads the evaluated local location of slider controls, one frame at a time.
+
+    Returns:
+        A (frames, len(names), 2) float32 array of local (X, Y) locations.
+    """
+
+    values = np.empty((len(frames), len(names), 2), dtype=np.float32)
+    pbones = [obj.pose.bones[name] for name in names]
+    current = scene.frame_current
+
+    try:
+        for i, frame in enumerate(frames):
+            scene.frame_set(int(frame))
+            for j, pbone in enumerate(pbones):
+                local = obj.convert_space(pose_bone=pbone, matrix=pbone.matrix, from_space='POSE', to_space='LOCAL')
+                values[i, j] = local.translation[:2]
+    finally:
+        scene.frame_set(current)
+
+    return values
+
+
+def bake_shape_keys(obj, mesh_obj, frame_start: int, frame_end: int, step: int = 1,
+                    mapping: Optional[ShapeMapping] = None, clear_drivers: bool = False,
+                    scene=None) -> ShapeBakeReport:
+
+    """
+    Bakes the slider animation of a generated rig onto the shape keys of a mesh.
+
+    Existing F-Curves of the baked shape keys are replaced, each written with one
+    keyframe_points.add and one foreach_set.
+
+    Args:
+        obj: The generated armature object.
+        mesh_obj: The mesh object with the shape keys.
+        frame_start: The first frame.
+        frame_end: The last frame, included.
+        step: The number of frames between two keys; frame_end is keyed in any case.
+        mapping: The shape key mapping; shape keys driven by or named like sliders are used when omitted.
+        clear_drivers: Remove the drivers of the baked shape keys, which would override the keys.
+        scene: The scene evaluated for the sampled sliders, the current one by default.
+
+    Returns:
+        What was baked, and how.
+    """
+
+    report = ShapeBakeReport()
+    key = mesh_obj.data.shape_keys
+    if key is None or frame_end < frame_start:
+        return report
+
+    sliders = get_slider_set(obj)
+    blocks = key.key_blocks
+    if mapping is None:
+        mapping = default_shape_mapping([block.name for block in blocks], sliders.names, sliders.shape_keys)
+    mapping = {shape: target for shape, target in mapping.items()
+               if shape in blocks and target[0] in sliders.index}
+
+    if not mapping:
+        return report
+
+    frames = np.arange(frame_start, frame_end + 1, step, dtype=np.int64)
+    # The last frame is always baked, even when the step does not land on it
+    if frames[-1] != frame_end:
+        frames = np.append(frames, frame_end)
+    shapes = list(mapping)
+    rows = np.array([sliders.index[mapping[shape][0]] for shape in shapes], dtype=np.int64)
+    axes = np.array([mapping[shape][1] for shape in shapes], dtype=np.int64)
+    scales = np.array([mapping[shape][2] for shape in shapes], dtype=np.float32)
+
+    # Local locations of every baked channel at every frame, the current pose where not animated
+    locations = np.repeat(sliders.read_locations(obj)[sliders.bone_index[rows], axes][None, :], len(frames), axis=0)
+
+    nla = _uses_nla(obj)
+    analytic = np.array([not nla and is_analytic(obj, mapping[shape][0]) for shape in shapes], dtype=bool)
+
+    action = obj.animation_data.action if obj.animation_data else None
+    channels = [(mapping[shape][0], mapping[shape][1]) for shape, ok in zip(shapes, analytic) if ok]
+    samples = sample_curves(action, channels, frame_start, frame_end)
+
+    for column, (shape, ok) in enumerate(zip(shapes, analytic)):
+        values = samples.get((mapping[shape][0], mapping[shape][1])) if ok else None
+        if values is not None:
+            locations[:, column] = values[frames - frame_start]
+
+    if not analytic.all():
+        columns = np.nonzero(~analytic)[0]
+        names = sorted({mapping[shapes[column]][0] for column in columns})
+        pose = sample_pose(obj, scene or bpy.context.scene, names, frames)
+        name_index = {name: i for i, name in enumerate(names)}
+        for column in columns:
+            locations[:, column] = pose[:, name_index[mapping[shapes[column]][0]], axes[column]]
+
+    # The slider mapping, for all frames at once
+    weights = locations / sliders.range[rows]
+    np.clip(weights, sliders.low[rows, axes], sliders.high[rows, axes], out=weights)
+    weights *= scales
+    low = np.array([blocks[shape].slider_min for shape in shapes], dtype=np.float32)
+    high = np.array([blocks[shape].slider_max for shape in shapes], dtype=np.float32)
+    np.clip(weights, low, high, out=weights)
+
+    if key.animation_data is None:
+        key.animation_data_create()
+    if key.animation_data.action is None:
+        key.animation_data.action = bpy.data.actions.new(f"{mesh_obj.name}_shapes")
+
+    shape_action = key.animation_data.action
+    co = np.empty((len(frames), 2), dtype=np.float32)
+    co[:, 0] = frames
+    interpolation = np.full(len(frames), INTERPOLATION_LINEAR, dtype=np.int32)
+
+    for column, shape in enumerate(shapes):
+        data_path = f'key_blocks["{bpy.utils.escape_identifier(shape)}"].value'
+
+        fcurve = shape_action.fcurves.find(data_path)
+        if fcurve:
+            shape_action.fcurves.remove(fcurve)
+
+        co[:, 1] = weights[:, column]
+        fcurve = shape_action.fcurves.new(data_path)
+        fcurve.keyframe_points.add(len(frames))
+        fcurve.keyframe_points.foreach_set('co', co.ravel())
+        fcurve.keyframe_points.foreach_set('interpolation', interpolation)
+        fcurve.update()
+
+        driver = key.animation_data.drivers.find(data_path)
+        if driver is not None:
+            if clear_drivers:
+                key.animation_data.drivers.remove(driver)
+            else:
+                report.driven.append(shape)
+
+        (report.analytic if analytic[column] else report.sampled).append(shape)
+
+    report.frames = len(frames)
+
+    return report
@@ -0,0 +1,380 @@
+import re
+import math
+
+from typing import Iterable, NamedTuple, Optional
+
+from .layout import FrameRect, frame_layout, union_bounds, SLIDER_SMALL_WIDTH, SLIDER_TITLE_HEIGHT
+
+"""
+SLIDERS FROM SHAPE KEYS
+
+Plans a gian.ui metarig driving the shape keys of a mesh: one slider per shape key,
+grouped into frames by name pattern and side. Sliders are laid out on a grid inside
+their frame, and the frames are shelf-packed so no two overlap. Everything is in
+armature space (X right, Z up), with bones pointing up along Z.
+
+Slider bones carry the side as a .L/.R suffix so Rigify pairs them, the shape key
+name goes to the shape_key parameter. Names avoid the bones already in the metarig
+and fit Blender's 63 byte limit. Frame rectangles come from the same layout
+as the generated frames (utils.layout.frame_layout), packed together with the
+panels of their sliders.
+
+Nothing in here touches bpy: the plan is emitted as bones by the operator. Check
+and time it with:
+
+    python -m utils.shape_sliders --bench
+"""
+
+# First matching pattern wins, so specific groups come before generic ones
+SHAPE_GROUP_PATTERNS = (
+    ('Brows', r'brow'),
+    ('Cheeks', r'cheek'),
+    ('Nose', r'nose|nostril|sneer'),
+    ('Jaw', r'jaw'),
+    ('Tongue', r'tongue'),
+    ('Eyes', r'eye|lid|blink|squint|look'),
+    ('Mouth', r'mouth|lip|smile|frown|pucker|funnel|dimple'),
+)
+SHAPE_OTHER_GROUP = 'Other'
+
+SIDE_RE = re.compile(r'(?:[._\-\s](?P<short>[LlRr])|(?P<long>Left|Right|left|right|LEFT|RIGHT))$')
+SIDE_SUFFIXES = {'LEFT': '.L', 'RIGHT': '.R', 'MIDDLE': ''}
+
+SLIDER_GAP = 0.5            # Space between two sliders, relative to the slider length.
+FRAME_GAP = 1.0             # Space between two frames, relative to the slider length.
+PACK_ASPECT = 1.6           # Target width / height ratio of the packed frames.
+MAX_NAME_BYTES = 63         # Longest bone name Blender stores, in UTF-8 bytes.
+
+
+class ShapeSlider(NamedTuple):
+
+    """
+    A planned gian.ui.slider bone.
+
+    Attributes:
+        name: The bone name, see slider_bone_name.
+        shape_key: The name of the shape key it drives.
+        frame: The name of the frame bone it is parented to.
+        slider_type: 'SMALL' or 'LARGE'.
+        x: The X of the bone head.
+        z: The Z of the bone head.
+    """
+
+    name: str
+    shape_key: str
+    frame: str
+    slider_type: str
+    x: float
+    z: float
+
+
+class ShapeFrame(NamedTuple):
+
+    """
+    A planned gian.ui.frame bone.
+
+    Attributes:
+        name: The bone name.
+        title: The frame title.
+        parent: The name of the parent frame, or None.
+        x: The X of the bone head.
+        z: The Z of the bone head.
+        rect: The frame rectangle the generator computes, title band included in rect.title.
+    """
+
+    name: str
+    title: str
+    parent: Optional[str]
+    x: float
+    z: float
+    rect: FrameRect
+
+
+def shape_side(name: str) -> str:
+
+    """
+    Returns 'LEFT', 'RIGHT' or 'MIDDLE' from the side suffix of a shape key name.
+
+    >>> shape_side('eyeBlinkLeft'), shape_side('brow_down.R'), shape_side('jawOpen')
+    ('LEFT', 'RIGHT', 'MIDDLE')
+    """
+
+    match = SIDE_RE.search(name)
+    if match is None:
+        return 'MIDDLE'
+
+    side = (match.group('short') or match.group('long'))[0].upper()
+
+    return 'LEFT' if side == 'L' else 'RIGHT'
+
+
+def slider_bone_name(name: str) -> str:
+
+    """
+    Returns the slider bone name of a shape key, with its side written .L or .R.
+
+    >>> slider_bone_name('eyeBlinkLeft'), slider_bone_name('brow_down_r'), slider_bone_name('jawOpen')
+    ('eyeBlink.L', 'brow_down.R', 'jawOpen')
+    """
+
+    side = shape_side(name)
+    stem = SIDE_RE.sub('', name)
+
+    return stem + SIDE_SUFFIXES[side] if stem else name
+
+
+def _truncate(text: str, size: int) -> str:
+
+    """
+    Cuts a string to at most size UTF-8 bytes, without splitting a character.
+    """
+
+    return text.encode('utf-8')[:size].decode('utf-8', 'ignore')
+
+
+def _unique(name: str, used: set[str]) -> str:
+
+    """
+    Returns a name not in used, numbered after the side like Rigify names, and records it.
+
+    Long names are cut before the side and number, so Blender does not truncate them.
+
+    >>> used = {'eye.L'}
+    >>> _unique('eye.L', used), _unique('eye.L', used), _unique('jaw', used)
+    ('eye.L.001', 'eye.L.002', 'jaw')
+    >>> long = _unique('x' * 70 + '.R', used)
+    >>> len(long), long.endswith('x.R'), _unique('x' * 70 + '.R', used).endswith('x.R.001')
+    (63, True, True)
+    """
+
+    stem, dot, side = name.rpartition('.')
+    if not (dot and side in ('L', 'R')):
+        stem, side = name, ''
+    side = dot + side if side else ''
+
+    unique = _truncate(stem, MAX_NAME_BYTES - len(side)) + side
+    number = 0
+    while unique in used:
+        number += 1
+        suffix = f"{side}.{number:03d}"
+        unique = _truncate(stem, MAX_NAME_BYTES - len(suffix)) + suffix
+
+    used.add(unique)
+
+    return unique
+
+
+def shape_group(name: str, patterns=SHAPE_GROUP_PATTERNS) -> str:
+
+    """
+    Returns the group of a shape key name, from the first matching pattern.
+
+    >>> shape_group('cheekSquintLeft'), shape_group('mouthSmileRight'), shape_group('Basis2')
+    ('Cheeks', 'Mouth', 'Other')
+    """
+
+    for group, pattern in patterns:
+        if re.search(pattern, name, re.IGNORECASE):
+            return group
+
+    return SHAPE_OTHER_GROUP
+
+
+def slider_size(slider_type: str, length: float, title: bool) -> tuple[float, float]:
+
+    """
+    Returns the (width, height) of a slider footprint, see layout.slider_footprint.
+    """
+
+    width = 2 * length if slider_type == 'LARGE' else 2 * length * SLIDER_SMALL_WIDTH
+    height = 2 * length + (length * SLIDER_TITLE_HEIGHT if title else 0.0)
+
+    return width, height
+
+
+def _slider_bounds(slider_type: str, x: float, z: float, length: float, title: bool) -> tuple:
+
+    """
+    Returns the panel bounds of a slider with its head at (x, z).
+    """
+
+    width, height = slider_size(slider_type, length, title)
+
+    return (x - width / 2, z - length, x + width / 2, z - length + height)
+
+
+def _grid(names: list[str], slider_type: str, length: float, title: bool):
+
+    """
+    Lays out sliders on a near square grid, from the top left corner at (0, 0).
+
+    Returns:
+        The head (x, z) of each slider, and the (width, height) of the grid.
+    """
+
+    width, height = slider_size(slider_type, length, title)
+    cell_w, cell_h = width + length * SLIDER_GAP, height + length * SLIDER_GAP
+    columns = max(1, math.ceil(math.sqrt(len(names) * cell_h / cell_w)))
+    rows = math.ceil(len(names) / columns)
+
+    # The head is at the middle of the travel, below the title band
+    title_band = height - 2 * length
+    heads = []
+    for i in range(len(names)):
+        row, column = divmod(i, columns)
+        heads.append((column * cell_w + cell_w / 2,
+                      -row * cell_h - cell_h / 2 - title_band / 2))
+
+    return heads, (columns * cell_w, rows * cell_h)
+
+
+def _shelf_pack(sizes: list[tuple[float, float]], gap: float) -> list[tuple[float, float]]:
+
+    """
+    Packs rectangles on shelves, tallest first, going down from (0, 0).
+
+    Returns:
+        The top left corner of each rectangle, in the input order.
+    """
+
+    area = sum((w + gap) * (h + gap) for w, h in sizes)
+    shelf_width = max(max((w for w, _ in sizes), default=0.0), math.sqrt(area * PACK_ASPECT))
+
+    corners: list[Optional[tuple[float, float]]] = [None] * len(sizes)
+    x = top = shelf_height = 0.0
+
+    for i in sorted(range(len(sizes)), key=lambda i: -sizes[i][1]):
+        w, h = sizes[i]
+        if x > 0 and x + w > shelf_width:
+            top -= shelf_height + gap
+            x = shelf_height = 0.0
+
+        corners[i] = (x, top)
+        x += w + gap
+        shelf_height = max(shelf_height, h)
+
+    return corners
+
+
+def plan_shape_sliders(shape_names: list[str], length: float = 0.2, title: bool = True,
+                       large_pattern: Optional[str] = None, root: Optional[str] = 'shapes_frame',
+                       patterns=SHAPE_GROUP_PATTERNS, used: Iterable[str] = (),
+                       corner: Optional[tuple[float, float]] = None) -> tuple[list[ShapeFrame], list[ShapeSlider]]:
+
+    """
+    Plans the frames and sliders driving a list of shape keys.
+
+    Args:
+        shape_names: The shape key names, without the reference key.
+        length: The slider bone length, which is the slider range.
+        title: Whether sliders show their name as title (and frames their group).
+        large_pattern: Shape keys matching this pattern get LARGE sliders.
+        root: The name of a frame containing all the group frames, or None.
+        patterns: The (group, pattern) list used to group the shape keys.
+        used: The bone names already taken, e.g. the bones of the metarig.
+        corner: The top left (x, z) corner of the planned frames and panels, to keep them
+            clear of an existing UI. Packed down and right from the origin when None.
+
+    Returns:
+        The frames (parents first) and the sliders.
+    """
+
+    groups: dict[tuple[str, str], dict[str, list[str]]] = {}
+    for name in shape_names:
+        slider_type = 'LARGE' if large_pattern and re.search(large_pattern, name) else 'SMALL'
+        key = (shape_group(name, patterns), shape_side(name))
+        groups.setdefault(key, {}).setdefault(slider_type, []).append(name)
+
+    used = set(used)
+    root = _unique(root, used) if root else None
+
+    # Each group: a grid of LARGE sliders stacked over a grid of SMALL ones
+    layouts = []
+    for (group, side), by_type in sorted(groups.items()):
+        frame = _unique(f"{group.lower()}_frame{SIDE_SUFFIXES[side]}", used)
+        heads = []
+        height = 0.0
+        for slider_type in ('LARGE', 'SMALL'):
+            names = by_type.get(slider_type)
+            if not names:
+                continue
+            grid, (_, grid_h) = _grid(names, slider_type, length, title)
+            heads += [(name, slider_type, x, z - height) for name, (x, z) in zip(names, grid)]
+            height += grid_h
+
+        # The generated frame pads the slider bones, while the panels may reach past it
+        bones = [(frame, None, (0.0, -height), (0.0, length - height))]
+        bones += [(name, frame, (x, z), (x, z + length)) for name, _, x, z in heads]
+        rect = frame_layout(bones, {frame: title})[frame]
+
+        extents = rect.outer
+        for _, slider_type, x, z in heads:
+            extents = union_bounds(extents, _slider_bounds(slider_type, x, z, length, title))
+
+        layouts.append((group, side, frame, heads, extents))
+
+    sizes = [(extents[2] - extents[0], extents[3] - extents[1]) for *_, extents in layouts]
+    corners = _shelf_pack(sizes, length * FRAME_GAP)
+
+    # Every bone at its packed position, to lay the frames out like the generator
+    bones = [(root, None, (0.0, 0.0), (0.0, length))] if root else []
+    titles = {root: title} if root else {}
+    sliders = []
+
+    for (group, side, frame, heads, extents), (left, top) in zip(layouts, corners):
+        # Move the top left corner of the frame and its panels to the packed corner
+        dx, dz = left - extents[0], top - extents[3]
+        titles[frame] = title
+        bones.append((frame, root, (0.0, 0.0), (0.0, length)))
+
+        for shape_key, slider_type, x, z in heads:
+            slider = ShapeSlider(_unique(slider_bone_name(shape_key), used), shape_key, frame,
+                                 slider_type, x + dx, z + dz)
+            sliders.append(slider)
+            bones.append((slider.name, frame, (slider.x, slider.z), (slider.x, slider.z + length)))
+
+    rects = frame_layout(bones, titles)
+
+    if corner is not None:
+        # The root frame pads the packed frames, and panels may reach past their frame
+        extents = None
+        for rect in rects.values():
+            extents = union_bounds(extents, rect.outer)
+        for slider in sliders:
+            extents = union_bounds(extents, _slider_bounds(slider.slider_type, slider.x, slider.z, length, title))
+
+        dx, dz = corner[0] - extents[0], corner[1] - extents[3]
+        sliders = [slider._replace(x=slider.x + dx, z=slider.z + dz) for slider in sliders]
+        bones = [(name, parent, (head[0] + dx, head[1] + dz), (tail[0] + dx, tail[1] + dz))
+                 for name, parent, head, tail in bones]
+        rects = frame_layout(bones, titles)
+
+    frames = []
+
+    if root:
+        _, _, (x, z), _ = bones[0]
+        frames.append(ShapeFrame(root, "Shapes", None, x, z, rects[root]))
+
+    for group, side, frame, *_ in layouts:
+        rect = rects[frame]
+        title_text = group + {'LEFT': " L", 'RIGHT': " R", 'MIDDLE': ""}[side]
+        frames.append(ShapeFrame(frame, title_text, root, (rect.min_x + rect.max_x) / 2, rect.min_z, rect))
+
+    return frames, sliders
+
+
+if __name__ == "__main__":
+    import sys
+    import doctest
+    import timeit
+
+    failures, tests = doctest.testmod()
+    print(f"{tests - failures}/{tests} examples passed")
+
+    if '--bench' in sys.argv:
+        words = ['eyeBlink', 'browDown', 'mouthSmile', 'cheekPuff', 'noseSneer', 'jawOpen', 'tongueOut', 'custom']
+        names = [f"{words[i % len(words)]}{i}{('Left', 'Right', '')[i % 3]}" for i in range(600)]
+        seconds = min(timeit.repeat(lambda: plan_shape_sliders(names), number=5, repeat=3)) / 5
+        print(f"plan_shape_sliders: {len(names)} shape keys in {seconds * 1000:.1f} ms")
+
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,339 @@
+import numpy as np
+
+from typing import Optional
+
+from .core import CLAMP_CODES, SLIDERS_PROP
+
+"""
+BULK ACCESS TO GENERATED GIAN.UI SLIDERS
+
+The generator stores the slider table on the armature data (see SliderRegistry in
+rigs/ui/slider.py). SliderSet turns it into index arrays once, so every read and
+write of the whole UI is a single foreach_get/foreach_set over the pose bones.
+
+Values are normalized to the bone range, as an (N, 2) array of local (X, Y):
+SMALL sliders only move on Y, so their X column is always 0.
+
+Mirroring uses the .L/.R pairing computed at generation: a permutation of the rows
+plus a sign per axis. SMALL panels follow the mirrored bone, so Y keeps its sign;
+LARGE panels are world aligned, so X flips.
+"""
+
+
+
+class SliderSet:
+
+    """
+    Cached description of the sliders of a generated rig.
+
+    Attributes:
+        names: The control bone names, in stable (sorted) order.
+        index: The position of each control name in names.
+        range: The range (bone length) of each slider.
+        large: Whether each slider is LARGE (2D).
+        clamp: The clamp code of each slider, see CLAMP_CODES.
+        side: The side of each slider: 1 left, 0 middle, -1 right.
+        mirror: The row of the opposite side slider (itself when unpaired).
+        mirror_sign: The (N, 2) sign applied to mirrored values.
+        shape_keys: The shape key driven by each slider, '' when not set.
+        low: The (N, 2) normalized lower limits.
+        high: The (N, 2) normalized upper limits.
+        bone_index: The index of each control in obj.pose.bones.
+        bone_count: The number of pose bones when the set was built.
+        stamp: The generation stamp the set was built from.
+    """
+
+    names: list[str]
+    index: dict[str, int]
+    range: np.ndarray
+    large: np.ndarray
+    clamp: np.ndarray
+    side: np.ndarray
+    mirror: np.ndarray
+    mirror_sign: np.ndarray
+    shape_keys: list[str]
+    low: np.ndarray
+    high: np.ndarray
+    bone_index: np.ndarray
+    bone_count: int
+    stamp: int
+
+    def __init__(self, obj):
+
+        """
+        Builds the index arrays from the slider table stored on the rig.
+
+        Args:
+            obj: The generated armature object.
+        """
+
+        table = obj.data[SLIDERS_PROP]
+
+        self.names = list(table["names"])
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.range = np.array(table["range"], dtype=np.float32)
+        self.large = np.array(table["large"], dtype=bool)
+        self.clamp = np.array(table["clamp"], dtype=np.int8)
+        self.stamp = table.get("stamp", 0)
+
+        count = len(self.names)
+        self.side = np.array(table.get("side", [0] * count), dtype=np.int8)
+        self.mirror = np.array(table.get("mirror", range(count)), dtype=np.int64)
+        self.mirror_sign = np.ones((count, 2), dtype=np.float32)
+        self.mirror_sign[self.large, 0] = -1.0
+        self.shape_keys = list(table.get("shape_keys", [''] * count))
+
+        # Limits match the LIMIT_LOCATION constraints of slider.Rig.rig_bones
+        self.low = np.zeros((len(self.names), 2), dtype=np.float32)
+        self.high = np.zeros((len(self.names), 2), dtype=np.float32)
+        self.low[:, 0] = np.where(self.large, -1.0, 0.0)
+        self.high[:, 0] = np.where(self.large, 1.0, 0.0)
+        self.low[:, 1] = np.where(self.clamp == CLAMP_CODES['UP'], 0.0, -1.0)
+        self.high[:, 1] = np.where(self.clamp == CLAMP_CODES['DOWN'], 0.0, 1.0)
+
+        pose_index = {pbone.name: i for i, pbone in enumerate(obj.pose.bones)}
+        self.bone_index = np.array([pose_index[name] for name in self.names], dtype=np.int64)
+        self.bone_count = len(pose_index)
+
+    def is_valid(self, obj) -> bool:
+
+        """
+        Checks the set still matches the rig (not regenerated, same bones).
+        """
+
+        table = obj.data.get(SLIDERS_PROP)
+
+        return (table is not None and table.get("stamp", 0) == self.stamp
+                and len(obj.pose.bones) == self.bone_count)
+
+    def read_locations(self, obj) -> np.ndarray:
+
+        """
+        Reads the location of every pose bone of the rig.
+
+        Returns:
+            A (bone_count, 3) float32 array.
+        """
+
+        loc = np.empty(self.bone_count * 3, dtype=np.float32)
+        obj.pose.bones.foreach_get('location', loc)
+
+        return loc.reshape(-1, 3)
+
+    def get_values(self, obj, clamp: bool = True) -> np.ndarray:
+
+        """
+        Reads the normalized value of every slider.
+
+        Args:
+            obj: The generated armature object.
+            clamp: Clamp the values to the slider limits, as the constraints do.
+
+        Returns:
+            An (N, 2) float32 array of normalized local (X, Y) values.
+        """
+
+        values = self.read_locations(obj)[self.bone_index, :2] / self.range[:, None]
+
+        if clamp:
+            np.clip(values, self.low, self.high, out=values)
+
+        return values
+
+    def set_values(self, obj, values: np.ndarray, clamp: bool = True,
+                   mask: Optional[np.ndarray] = None):
+
+        """
+        Writes the normalized value of every slider in one pass.
+
+        Args:
+            obj: The generated armature object.
+            values: An (N, 2) array of normalized local (X, Y) values.
+            clamp: Clamp the values to the slider limits before writing.
+            mask: Optional boolean array of the N sliders to write.
+        """
+
+        values = np.asarray(values, dtype=np.float32).reshape(-1, 2)
+
+        if clamp:
+            values = np.clip(values, self.low, self.high)
+
+        rows = self.bone_index if mask is None else self.bone_index[mask]
+        values = values if mask is None else values[mask]
+        scale = self.range[:, None] if mask is None else self.range[mask, None]
+
+        loc = self.read_locations(obj)
+        loc[rows, :2] = values * scale
+        obj.pose.bones.foreach_set('location', loc.ravel())
+        obj.update_tag()
+
+
+    def mirror_values(self, values: np.ndarray) -> np.ndarray:
+
+        """
+        Mirrors normalized values across the .L/.R sliders.
+
+        Args:
+            values: An (N, 2) array, or any (..., N, 2) stack of them (e.g. per frame).
+
+        Returns:
+            The mirrored values.
+        """
+
+        return np.take(values, self.mirror, axis=-2) * self.mirror_sign
+
+    def symmetrize_values(self, values: np.ndarray, from_left: bool = True) -> np.ndarray:
+
+        """
+        Copies the values of one side onto the other, mirrored.
+
+        Args:
+            values: An (N, 2) array, or any (..., N, 2) stack of them.
+            from_left: Copy .L onto .R when True, .R onto .L otherwise.
+
+        Returns:
+            The symmetrized values.
+        """
+
+        target = self.side == (-1 if from_left else 1)
+        result = np.array(values, dtype=np.float32)
+        result[..., target, :] = self.mirror_values(values)[..., target, :]
+
+        return result
+
+    def mirror_action(self, action, from_left: Optional[bool] = None):
+
+        """
+        Mirrors (or symmetrizes) the slider F-Curves of a whole action.
+
+        Each channel is read and rewritten with one foreach_get/foreach_set; keys of
+        the opposite slider are moved across, with values scaled by the range ratio
+        and the mirror sign.
+
+        Args:
+            action: The action animating the generated rig.
+            from_left: None to mirror both sides, True/False to symmetrize from .L/.R.
+        """
+
+        from bpy.utils import escape_identifier
+
+        paths = [f'pose.bones["{escape_identifier(name)}"].location' for name in self.names]
+        path_index = {path: i for i, path in enumerate(paths)}
+
+        curves = {}
+        for fcurve in action.fcurves:
+            row = path_index.get(fcurve.data_path)
+            if row is not None and fcurve.array_index < 2:
+                curves[(row, fcurve.array_index)] = fcurve
+
+        # Snapshot every source channel before rewriting any of them
+        keys = {}
+        for channel, fcurve in curves.items():
+            count = len(fcurve.keyframe_points)
+            data = {prop: np.empty(count * 2, dtype=np.float32) for prop in ('co', 'handle_left', 'handle_right')}
+            data['interpolation'] = np.empty(count, dtype=np.int32)
+            for prop, array in data.items():
+                fcurve.keyframe_points.foreach_get(prop, array)
+            keys[channel] = (fcurve.group.name if fcurve.group else None, data)
+
+        target = np.ones(len(self.names), dtype=bool)
+        if from_left is not None:
+            target = self.side == (-1 if from_left else 1)
+
+        for row in np.nonzero(target)[0]:
+            source = self.mirror[row]
+            for axis in range(2):
+                fcurve = curves.get((row, axis))
+                if fcurve is not None:
+                    action.fcurves.remove(fcurve)
+
+                mirrored = keys.get((source, axis))
+                if mirrored is None:
+                    continue
+
+                group, data = mirrored
+                scale = self.mirror_sign[row, axis] * self.range[row] / self.range[source]
+                name = self.names[row]
+
+                fcurve = action.fcurves.new(paths[row], index=axis,
+                                            action_group=name if group else '')
+                fcurve.keyframe_points.add(len(data['interpolation']))
+                for prop, array in data.items():
+                    if prop != 'interpolation':
+                        array = array.reshape(-1, 2) * (1.0, scale)
+                    fcurve.keyframe_points.foreach_set(prop, array.ravel())
+                fcurve.update()
+
+
+_slider_sets: dict[str, SliderSet] = {}
+
+
+def get_slider_set(obj) -> SliderSet:
+
+    """
+    Returns the cached SliderSet of a generated rig, rebuilding it when stale.
+
+    Args:
+        obj: The generated armature object.
+
+    Returns:
+        The slider set of the rig.
+    """
+
+    sliders = _slider_sets.get(obj.name_full)
+
+    if sliders is None or not sliders.is_valid(obj):
+        sliders = _slider_sets[obj.name_full] = SliderSet(obj)
+
+    return sliders
+
+
+def mirror_slider_pose(obj, from_left: Optional[bool] = None):
+
+    """
+    Mirrors (or symmetrizes) the current slider pose of a generated rig.
+
+    Args:
+        obj: The generated armature object.
+        from_left: None to mirror both sides, True/False to symmetrize from .L/.R.
+    """
+
+    sliders = get_slider_set(obj)
+    values = sliders.get_values(obj, clamp=False)
+
+    if from_left is None:
+        values = sliders.mirror_values(values)
+    else:
+        values = sliders.symmetrize_values(values, from_left)
+
+    sliders.set_values(obj, values)
+
+
+def get_slider_values(obj, clamp: bool = True) -> np.ndarray:
+
+    """
+    Reads the normalized value of every slider of a generated rig.
+
+    Args:
+        obj: The generated armature object.
+        clamp: Clamp the values to the slider limits.
+
+    Returns:
+        An (N, 2) float32 array, rows ordered as get_slider_set(obj).names.
+    """
+
+    return get_slider_set(obj).get_values(obj, clamp)
+
+
+def set_slider_values(obj, values: np.ndarray, clamp: bool = True):
+
+    """
+    Writes the normalized value of every slider of a generated rig.
+
+    Args:
+        obj: The generated armature object.
+        values: An (N, 2) array, rows ordered as get_slider_set(obj).names.
+        clamp: Clamp the values to the slider limits.
+    """
+
+    get_slider_set(obj).set_values(obj, values, clamp)
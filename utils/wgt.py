@@ -1,34 +1,31 @@
 import bpy
-import math
-import inspect
+import os
 import functools
-import mathutils
+import numpy as np
 
-from typing import Optional, Callable, TYPE_CHECKING
-from bpy.types import Mesh, Object, UILayout, WindowManager
+from typing import Optional
+from bpy.types import Object
 from mathutils import Matrix, Vector, Euler
-from itertools import count
 
 from rigify.base_generate import BaseGenerator
 from rigify.utils.collections import ensure_collection
 from rigify.utils.naming import change_name_side, get_name_side, Side
 from rigify.utils.errors import MetarigError
-from rigify.utils.misc import ArmatureObject, MeshObject, AnyVector, verify_mesh_obj, IdPropSequence
+from rigify.utils.misc import ArmatureObject, MeshObject, verify_mesh_obj
 
 from rigify.feature_set_list import get_install_path, get_enabled_modules_names
 
-WGT_PREFIX = "WGT-"  # Prefix for widget objects
-WGT_GROUP_PREFIX = "WGTS_"  # noqa; Prefix for the widget collection
-
-from mathutils import Matrix
-
-from rigify.utils.widgets import (
-  create_widget, widget_generator, 
-  adjust_widget_axis, adjust_widget_transform_mesh
+from .mesh_data import read_mesh_arrays, write_mesh_arrays, concat_arrays, empty_arrays, transform_arrays
+from .core import WGT_PREFIX, WGT_GROUP_PREFIX, TEXT_FONT, WGT_KIND_PROP
+from .core import box_socket_values, ctrl_socket_values, text_socket_values, frame_outline, frame_title_band, title_band
+from .layout import SLIDER_TITLE_HEIGHT, TITLE_TEXT_FILL
+from .widget_sync import WidgetPlacement, WidgetIndex
+from .widget_engine import WidgetBackend, register_backend, build_widget
+from .widget_pack import (
+  WIDGET_PACK_NAME, BOX_VARIANTS, CTRL_VARIANTS,
+  box_key, ctrl_key, pack_key, read_widget_pack, write_widget_pack
 )
 
-from rigify.utils.bones import get_bone
-
 """
 CUSTOM RIGIFY FUNCTIONS
 """
@@ -58,13 +55,26 @@ def custom_obj_to_bone(obj: Object, rig: ArmatureObject, bone_name: str,
     obj.rotation_mode = 'XYZ'
     obj.matrix_basis = rig.matrix_world @ bone.bone.matrix_local @ shape_mat
 
+def queue_obj_to_bone(obj: Object, rig: ArmatureObject, bone_name: str,
+                bone_transform_name: Optional[str] = None):
+    """ Places an object at its bone, at the end of the widget stage when generating.
+    """
+    generator = BaseGenerator.instance
+
+    if generator:
+        WidgetPlacement(generator).add(obj, bone_name, bone_transform_name)
+    else:
+        custom_obj_to_bone(obj, rig, bone_name, bone_transform_name)
+
 def custom_create_widget(rig: ArmatureObject, bone_name: str,
                   bone_transform_name: Optional[str] = None, *,
                   widget_name: Optional[str] = None, mir=False,
-                  widget_force_new=False, subsurf=0) -> Optional[MeshObject]:
+                  widget_force_new=False, subsurf=0, mirror_key=None) -> Optional[MeshObject]:
     """
     Creates an empty widget object for a bone, and returns the object.
     If the object already existed, returns None.
+    When mirroring, the optional mirror_key (e.g. the widget design) must also match
+    for the two sides to share a mesh.
     """
     assert rig.mode != 'EDIT'
 
@@ -81,6 +91,7 @@ def custom_create_widget(rig: ArmatureObject, bone_name: str,
 
     use_mirror = mir
     bone_mid_name = change_name_side(bone_name, Side.MIDDLE) if use_mirror else bone_name
+    mirror_mesh_key = bone_mid_name if mirror_key is None else (bone_mid_name, mirror_key)
 
     obj_name = widget_name or WGT_PREFIX + rig.name + '_' + bone_name
     reuse_mesh = None
@@ -99,7 +110,11 @@ def custom_create_widget(rig: ArmatureObject, bone_name: str,
             # If re-generating, check widgets used by the previous rig
             obj = generator.old_widget_table.get(bone_name)
 
-        if not obj:
+        if not obj and generator:
+            # Search the local scene objects, indexed once per generation
+            obj = WidgetIndex(generator).find(obj_name)
+
+        elif not obj:
             # Search the scene by name
             obj = scene.objects.get(obj_name)
             if obj and obj.library:
@@ -122,7 +137,7 @@ def custom_create_widget(rig: ArmatureObject, bone_name: str,
                 bone.custom_shape_scale_xyz.x *= -1
 
             # Move object to bone position, in case it changed
-            custom_obj_to_bone(obj, rig, bone_name, bone_transform_name)
+            queue_obj_to_bone(obj, rig, bone_name, bone_transform_name)
 
             return None
 
@@ -134,7 +149,7 @@ def custom_create_widget(rig: ArmatureObject, bone_name: str,
 
         # Create a linked duplicate with the mirror widget
         if not reuse_mesh and use_mirror and bone_mid_name != bone_name:
-            reuse_mesh = generator.widget_mirror_mesh.get(bone_mid_name)
+            reuse_mesh = generator.widget_mirror_mesh.get(mirror_mesh_key)
 
     # Create an empty mesh datablock if not linking
     if reuse_mesh:
@@ -144,7 +159,7 @@ def custom_create_widget(rig: ArmatureObject, bone_name: str,
         # When mirroring, untag side from mesh name, and remember it
         mesh = bpy.data.meshes.new(change_name_side(obj_name, Side.MIDDLE))
 
-        generator.widget_mirror_mesh[bone_mid_name] = mesh
+        generator.widget_mirror_mesh[mirror_mesh_key] = mesh
 
     else:
         mesh = bpy.data.meshes.new(obj_name)
@@ -161,6 +176,7 @@ def custom_create_widget(rig: ArmatureObject, bone_name: str,
     # Record the generated widget
     if generator:
         generator.new_widget_table[bone_name] = obj
+        WidgetIndex(generator).add(obj)
 
     # Flip scale for right side if mirroring widgets
     if use_mirror and get_name_side(bone_name) == Side.RIGHT:
@@ -168,7 +184,7 @@ def custom_create_widget(rig: ArmatureObject, bone_name: str,
             bone.custom_shape_scale_xyz.x *= -1
 
     # Move object to bone position and set layers
-    custom_obj_to_bone(obj, rig, bone_name, bone_transform_name)
+    queue_obj_to_bone(obj, rig, bone_name, bone_transform_name)
 
     if reuse_mesh:
         return None
@@ -179,77 +195,56 @@ def custom_create_widget(rig: ArmatureObject, bone_name: str,
 MY FUNCTIONS
 """
 
-def importBoxNode():
+WIDGET_NODES = {'BOX': 'GN-wgt_Box', 'CTRL': 'GN-wgt_Ctrl', 'TEXT': 'GN-wgt_Text'}
+WGT_NODE_NAMES = tuple(WIDGET_NODES.values())
 
-    node_name = 'GN-wgt_Box'
+@functools.cache
+def widgetBlendPath():
 
     gen_path = get_install_path()
     active_modules = [mod for mod in get_enabled_modules_names() if 'gian' in mod][0]
     full_path = gen_path + '/' + active_modules
 
-    path = full_path + '/utils/widget_blend/custom_wgts.blend'
+    return full_path + '/utils/widget_blend/custom_wgts.blend'
 
-    with bpy.data.libraries.load(path) as (data_from, data_to):    
-        data_to.node_groups.append(node_name)
-        
-    node_group = bpy.data.node_groups.get(node_name)
-    
-    return node_group
+@functools.cache
+def widgetPack():
 
-def importControlNode():
-    
-    node_name = 'GN-wgt_Ctrl'
+    # Prebuilt base shapes, if the pack was built for this install
+    path = os.path.join(os.path.dirname(widgetBlendPath()), WIDGET_PACK_NAME)
 
-    gen_path = get_install_path()
-    active_modules = [mod for mod in get_enabled_modules_names() if 'gian' in mod][0]
-    full_path = gen_path + '/' + active_modules
+    return read_widget_pack(path) if os.path.exists(path) else {}
 
-    path = full_path + '/utils/widget_blend/custom_wgts.blend'
+def importWidgetNodes(node_names=WGT_NODE_NAMES):
 
-    with bpy.data.libraries.load(path) as (data_from, data_to):    
-        data_to.node_groups.append(node_name)
-        
-    node_group = bpy.data.node_groups.get(node_name)
-    
-    return node_group
+    # Node groups stay loaded for the session: load the library only for the missing ones
+    missing = [name for name in node_names if name not in bpy.data.node_groups]
 
-def importTextNode():
-    
-    node_name = 'GN-wgt_Text'
+    if missing:
+        with bpy.data.libraries.load(widgetBlendPath()) as (data_from, data_to):    
+            data_to.node_groups = missing
 
-    gen_path = get_install_path()
-    active_modules = [mod for mod in get_enabled_modules_names() if 'gian' in mod][0]
-    full_path = gen_path + '/' + active_modules
+    return [bpy.data.node_groups.get(name) for name in node_names]
 
-    path = full_path + '/utils/widget_blend/custom_wgts.blend'
+def importWidgetNode(kind):
 
-    with bpy.data.libraries.load(path) as (data_from, data_to):    
-        data_to.node_groups.append(node_name)
-        
-    node_group = bpy.data.node_groups.get(node_name)
-    
-    return node_group
+    return importWidgetNodes((WIDGET_NODES[kind],))[0]
 
-def importFrameNode():
-    
-    node_name = 'GN-wgt_Frame'
+def importBoxNode():
 
-    gen_path = get_install_path()
-    active_modules = [mod for mod in get_enabled_modules_names() if 'gian' in mod][0]
-    full_path = gen_path + '/' + active_modules
+    return importWidgetNode('BOX')
 
-    path = full_path + '/utils/widget_blend/custom_wgts.blend'
+def importControlNode():
+    
+    return importWidgetNode('CTRL')
 
-    with bpy.data.libraries.load(path) as (data_from, data_to):    
-        data_to.node_groups.append(node_name)
-        
-    node_group = bpy.data.node_groups.get(node_name)
+def importTextNode():
     
-    return node_group
+    return importWidgetNode('TEXT')
 
-def boxWidget(wgt_name, type, clp, txt, min, fill):
+def nodeWidget(wgt_name, kind, values):
 
-    node = importBoxNode()
+    node = importWidgetNode(kind)
 
     # Create a new mesh
     mesh = bpy.data.meshes.new(wgt_name)
@@ -265,293 +260,303 @@ def boxWidget(wgt_name, type, clp, txt, min, fill):
     mod.node_group = node
     
     #setup variables for updates
-    radius_input = 'Socket_4'
-    box_x_input = 'Socket_5'
-    clamp_input = 'Socket_8'
-    text_input = 'Socket_13'
-    minimal_input = 'Socket_16'
-    fill_input = 'Socket_7'
-    
-    type_value = 1.0 if type == 'LARGE' else 0.0
-    clp_value = {'NONE': 0, 'UP': 1}.get(clp, 2)
-    
-    obj.modifiers[mod.name][box_x_input] = type_value
-    obj.modifiers[mod.name][clamp_input] = clp_value
-    obj.modifiers[mod.name][text_input] = txt
-    obj.modifiers[mod.name][minimal_input] = min
-    obj.modifiers[mod.name][fill_input] = fill
+    for socket, value in values.items():
+        obj.modifiers[mod.name][socket] = value
     
     #Update Node Values on modifier
     mod.node_group.interface_update(bpy.context)
     
     bpy.context.view_layer.objects.active = obj
     bpy.ops.object.modifier_apply(modifier=mod.name)
-    
-    bpy.data.node_groups.remove(bpy.data.node_groups['GN-wgt_Box'])
 
     return obj
 
+def boxWidget(wgt_name, type, clp, txt, min, fill):
+
+    return nodeWidget(wgt_name, 'BOX', box_socket_values(type, clp, txt, min, fill))
+
 def ctrlWidget(wgt_name, fill, offset):
 
-    node = importControlNode()
+    return nodeWidget(wgt_name, 'CTRL', ctrl_socket_values(fill, offset))
 
-    # Create a new mesh
-    mesh = bpy.data.meshes.new(wgt_name)
+def textWidget(wgt_name, txt):
 
-    # Create a new object using the mesh
-    obj = bpy.data.objects.new(wgt_name, mesh)
+    return nodeWidget(wgt_name, 'TEXT', text_socket_values(txt))
 
-    # Add the object to the scene
-    scene = bpy.context.scene
-    scene.collection.objects.link(obj)
-    
-    mod = obj.modifiers.new(node.name, type='NODES')
-    mod.node_group = node
+def frameArrays(rect, tlt, csm_text, start_pos):
 
-    #setup variables for updates    
-    radius_input = 'Socket_4'
-    fill_control = 'Socket_7'
-    offset_input = 'Socket_14'
+    # The rectangle comes from the frame layout, moved relative to the bone head
+    frame = build_widget('FRAME', rect, start_pos.x, start_pos.z)
 
-    obj.modifiers[mod.name][fill_control] = fill
-    obj.modifiers[mod.name][offset_input] = offset_input
-    
-    #Update Node Values on modifier
-    mod.node_group.interface_update(bpy.context)
-    
-    bpy.context.view_layer.objects.active = obj
-    bpy.ops.object.modifier_apply(modifier=mod.name)
+    if not (tlt and csm_text):
+        return frame
 
-    bpy.data.node_groups.remove(bpy.data.node_groups['GN-wgt_Ctrl'])
+    # Title overlay centered in the title band on top of the frame
+    left, right, bottom, height = frame_title_band(rect, start_pos.x, start_pos.z, TITLE_TEXT_FILL)
+    title = placeOverlay(textOverlayArrays(csm_text), left, right, bottom, height)
 
-    return obj
+    return concat_arrays([frame, title])
 
-def textWidget(wgt_name, txt):
+def tagWidget(obj, kind):
 
-    node = importTextNode()
+    if obj != None:
+        obj[WGT_KIND_PROP] = kind
 
-    # Create a new mesh
-    mesh = bpy.data.meshes.new(wgt_name)
+"""
+WIDGET BACKENDS
 
-    # Create a new object using the mesh
-    obj = bpy.data.objects.new(wgt_name, mesh)
+The bundled sources of widget geometry, registered in utils.widget_engine:
+the prebuilt pack first, then Python shapes, then Geometry Nodes.
+"""
 
-    # Add the object to the scene
-    scene = bpy.context.scene
-    scene.collection.objects.link(obj)
-    
-    mod = obj.modifiers.new(node.name, type='NODES')
-    mod.node_group = node
-    
-    #setup variables for updates
-    text_input = 'Socket_3'
-    
-    obj.modifiers[mod.name][text_input] = txt
-    
-    #Update Node Values on modifier
-    mod.node_group.interface_update(bpy.context)
-    
-    bpy.context.view_layer.objects.active = obj
-    bpy.ops.object.modifier_apply(modifier=mod.name)
-    
-    bpy.data.node_groups.remove(bpy.data.node_groups['GN-wgt_Text'])
+GN_BACKEND = register_backend(WidgetBackend('GN', priority=0))
+PROCEDURAL_BACKEND = register_backend(WidgetBackend('PROCEDURAL', priority=10))
+PACK_BACKEND = register_backend(WidgetBackend('PACK', priority=20, is_available=lambda: bool(widgetPack())))
 
-    return obj
+@GN_BACKEND.builder('BOX')
+def nodeBoxArrays(design, clp, minimal, fill):
 
-def frameWidget(wgt_name, meta, children, tlt, csm_text, start_pos):
+    return builtArrays(boxWidget('WGT-box_base', design, clp, '', minimal, fill))
 
-    output_obj = []
+@GN_BACKEND.builder('CTRL')
+def nodeCtrlArrays(fill, offset):
 
-    if len(children) > 1:
+    return builtArrays(ctrlWidget('WGT-ctrl_base', fill, offset))
 
-        og_mode = meta.mode
+@GN_BACKEND.builder('TEXT')
+def nodeTextArrays(txt):
 
-        if meta.mode != 'EDIT':
-            bpy.ops.object.mode_set(mode='EDIT')
+    return builtArrays(textWidget('WGT-text_overlay', txt))
 
-        vectors = []
+@PACK_BACKEND.builder('BOX')
+def packBoxArrays(design, clp, minimal, fill):
 
-        for b in children:
-            vectors.append(b.head)
-            vectors.append(b.tail)
-            print('vector' + b.name)
+    return widgetPack().get(pack_key(box_key(design, clp, minimal, fill)))
 
-        min_x = min(v.x for v in vectors)
-        max_x = max(v.x for v in vectors)
+@PACK_BACKEND.builder('CTRL')
+def packCtrlArrays(fill, offset):
 
-        min_z = min(v.z for v in vectors)
-        max_z = max(v.z for v in vectors)
+    return widgetPack().get(pack_key(ctrl_key(fill, offset)))
 
-        if meta.mode != 'OBJECT':
-            bpy.ops.object.mode_set(mode='OBJECT')
+@PROCEDURAL_BACKEND.builder('FRAME')
+def outlineFrameArrays(rect, head_x, head_z):
 
-        # Create a new mesh and object
-        mesh = bpy.data.meshes.new(wgt_name)
-        obj = bpy.data.objects.new(wgt_name, mesh)
+    # Create vertices and edges of the frame
+    verts = np.array(frame_outline(rect, head_x, head_z), dtype=np.float32)
+    edges = np.array([(0, 1), (1, 2), (2, 3), (3, 0)], dtype=np.int32)
 
-        # Create vertices, edges, and faces for the mesh
-        # Add offset to min and max values
+    return empty_arrays()._replace(verts=verts, edges=edges)
 
-        start_x = start_pos.x
-        start_z = start_pos.z
+"""
+COMPOSITIONAL WIDGETS
 
-        print(start_x, start_z)
+Box and frame widgets are assembled from two separately cached parts: the untitled
+base shape, keyed only by its design, and the title overlay, keyed only by its
+string. Parts are evaluated once per session and concatenated as arrays, so a
+unique title only costs one GN-wgt_Text evaluation.
+"""
 
-        offset_x = (max_x - min_x) *0.1
-        offset_z = (max_z - min_z) *0.1
+base_shape_cache = {}       # Untitled GN-wgt_Box and GN-wgt_Ctrl shapes, keyed by design (from the pack or GN)
+text_overlay_cache = {}     # GN-wgt_Text shapes, keyed by (string, font)
+subdivided_box_cache = {}   # Titled boxes with the BOX subdivision applied, keyed by (design, title)
 
-        min_x_offset = (min_x - offset_x) - start_x
-        max_x_offset = (max_x + offset_x) - start_x
-        min_y_offset = (min_z - offset_z) - start_z
-        max_y_offset = (max_z + offset_z) - start_z
+def builtArrays(dref_obj):
 
-        verts = [(min_x_offset, min_y_offset, 0), (max_x_offset, min_y_offset, 0), 
-                (max_x_offset, max_y_offset, 0), (min_x_offset, max_y_offset, 0)]
-        edges = [(0, 1), (1, 2), (2, 3), (3, 0)]
-        faces = []
+    mesh = dref_obj.data
+    arrays = read_mesh_arrays(mesh)
 
-        # Create the mesh from the vertices, edges, and faces
-        mesh.from_pydata(verts, edges, faces)
-        mesh.update()
+    bpy.data.objects.remove(dref_obj)
+    bpy.data.meshes.remove(mesh)
 
-        # Add the object to the scene
-        scene = bpy.context.scene
-        scene.collection.objects.link(obj)        
+    return arrays
 
-        if meta.mode != og_mode:
-            bpy.ops.object.mode_set(mode=og_mode)
+def cachedArrays(cache, key, kind, args, backend=None):
 
-        output_obj.append(obj)
-    else:
-        
-        og_mode = meta.mode
-
-        if meta.mode != 'OBJECT':
-            bpy.ops.object.mode_set(mode='OBJECT')
-
-        # Create a new mesh and object
-        mesh = bpy.data.meshes.new(wgt_name)
-        obj = bpy.data.objects.new(wgt_name, mesh)
-
-        # Create vertices, edges, and faces for the mesh
-        min_x_offset = -1
-        max_x_offset = 1
-        min_y_offset = -1
-        max_y_offset = 1
-
-        verts = [(min_x_offset, min_y_offset, 0), (max_x_offset, min_y_offset, 0), 
-                (max_x_offset, max_y_offset, 0), (min_x_offset, max_y_offset, 0)]
-        edges = [(0, 1), (1, 2), (2, 3), (3, 0)]
-        faces = []
-
-        # Create the mesh from the vertices, edges, and faces
-        mesh.from_pydata(verts, edges, faces)
-        mesh.update()
-
-        # Add the object to the scene
-        scene = bpy.context.scene
-        scene.collection.objects.link(obj)
-
-        if meta.mode != og_mode:
-            bpy.ops.object.mode_set(mode=og_mode)
-
-        output_obj.append(obj)
-
-    new_obj = output_obj[0]
-
-    if tlt:
-
-        node = importFrameNode()
-        
-        mod = new_obj.modifiers.new(node.name, type='NODES')
-        mod.node_group = node
-        
-        #setup variables for updates
-        custom_title_input = 'Socket_2'
-        
-        new_obj.modifiers[mod.name][custom_title_input] = csm_text
-        
-        #Update Node Values on modifier
-        mod.node_group.interface_update(bpy.context)
-        
-        bpy.context.view_layer.objects.active = new_obj
-        bpy.ops.object.modifier_apply(modifier=mod.name)
-        
-        bpy.data.node_groups.remove(bpy.data.node_groups['GN-wgt_Frame'])
-
-        return new_obj
+    # A forced backend always builds, and leaves the session cache alone
+    if backend is not None:
+        return build_widget(kind, *args, backend=backend)
 
-    else:
-        return new_obj
+    if key not in cache:
+        cache[key] = build_widget(kind, *args)
+
+    return cache[key]
+
+def boxBaseArrays(design, clp, minimal, fill, backend=None):
+
+    return cachedArrays(base_shape_cache, box_key(design, clp, minimal, fill), 'BOX',
+                        (design, clp, minimal, fill), backend)
+
+def ctrlArrays(fill, offset, backend=None):
+
+    return cachedArrays(base_shape_cache, ctrl_key(fill, offset), 'CTRL', (fill, offset), backend)
+
+def textOverlayArrays(txt, backend=None):
+
+    return cachedArrays(text_overlay_cache, (txt, TEXT_FONT), 'TEXT', (txt,), backend)
+
+def buildWidgetPack(path=None):
+
+    # Evaluate every discrete base shape with Geometry Nodes and store them in the pack
+    path = path or os.path.join(os.path.dirname(widgetBlendPath()), WIDGET_PACK_NAME)
+
+    shapes = {}
+    for variant in BOX_VARIANTS:
+        shapes[box_key(*variant)] = build_widget('BOX', *variant, backend='GN')
+    for variant in CTRL_VARIANTS:
+        shapes[ctrl_key(*variant)] = build_widget('CTRL', *variant, backend='GN')
+
+    # Unmap the current pack first: a mapped file cannot be replaced on Windows
+    widgetPack.cache_clear()
+    base_shape_cache.clear()
+    subdivided_box_cache.clear()
+
+    write_widget_pack(path, shapes)
+    base_shape_cache.update(shapes)
+
+    return path
+
+def placeOverlay(overlay, left, right, bottom, height):
+
+    # Scale the overlay to the height, centered between left and right, above bottom
+    if not len(overlay.verts):
+        return overlay
+
+    low = overlay.verts.min(axis=0)
+    high = overlay.verts.max(axis=0)
+    size = max(high[1] - low[1], 1e-6)
+
+    scale = height / size
+    offset = np.array(((left + right) / 2 - (low[0] + high[0]) / 2 * scale,
+                       bottom - low[1] * scale, 0), dtype=np.float32)
+
+    return overlay._replace(verts=(overlay.verts * scale + offset).astype(np.float32))
+
+def boxArrays(design, clp, txt, minimal, fill):
+
+    base = boxBaseArrays(design, clp, minimal, fill)
+
+    if not txt or not len(base.verts):
+        return base
+
+    # Title overlay in the band utils.layout reserves on top of the panel, in bone length units
+    low = base.verts.min(axis=0)
+    high = base.verts.max(axis=0)
+    band = title_band(low[0], high[0], high[1], SLIDER_TITLE_HEIGHT, TITLE_TEXT_FILL)
+    title = placeOverlay(textOverlayArrays(txt), *band)
+
+    return concat_arrays([base, title])
+
+def subdividedArrays(arrays, levels):
+
+    if levels <= 0 or not len(arrays.verts):
+        return arrays
+
+    # Evaluate a throwaway object with the same modifier the widget objects get
+    mesh = bpy.data.meshes.new('WGT-subdivide')
+    write_mesh_arrays(mesh, arrays)
+    obj = bpy.data.objects.new(mesh.name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+
+    mod = obj.modifiers.new("subsurf", 'SUBSURF')
+    mod.levels = levels
+
+    try:
+        evaluated = obj.evaluated_get(bpy.context.evaluated_depsgraph_get())
+        result = bpy.data.meshes.new_from_object(evaluated)
+    finally:
+        bpy.data.objects.remove(obj)
+        bpy.data.meshes.remove(mesh)
+
+    arrays = read_mesh_arrays(result)
+    bpy.data.meshes.remove(result)
 
-def createBoxWidget(rig, bone_name, bone_transform_name=None):
+    return arrays
 
-    obj = custom_create_widget(rig, bone_name, bone_transform_name, mir=False, subsurf=1)
+def subdividedBoxArrays(design, clp, txt, minimal, fill):
+
+    key = (box_key(design, clp, minimal, fill), txt)
+
+    if key not in subdivided_box_cache:
+        subdivided_box_cache[key] = subdividedArrays(boxArrays(design, clp, txt, minimal, fill),
+                                                     WIDGET_SUBSURF['BOX'])
+
+    return subdivided_box_cache[key]
+
+def sharedPanelArrays(rig, frame_bone, panels):
+
+    # Boxes of shared panel sliders, moved from each slider bone to the frame bone space.
+    # The frame mesh has no subdivision, so the boxes are subdivided like their own widgets would be
+    data_bones = rig.data.bones
+    to_frame = data_bones[frame_bone].matrix_local.inverted()
+
+    parts = []
+    for bone_name, size, design in panels:
+        matrix = to_frame @ data_bones[bone_name].matrix_local @ Matrix.Scale(size, 4)
+        parts.append(transform_arrays(subdividedBoxArrays(**design), matrix))
+
+    return parts
+
+def fillWidget(obj, arrays):
+
+    write_mesh_arrays(obj.data, arrays)
+    obj.data.name = obj.name
 
     return obj
 
-def createControlWidget(rig, bone_name, bone_transform_name=None):
-  
-    obj = custom_create_widget(rig, bone_name, bone_transform_name, mir=False, subsurf=1)
+def mergeWidgetArrays(obj, parts):
+
+    arrays = concat_arrays([read_mesh_arrays(obj.data)] + parts)
+    write_mesh_arrays(obj.data, arrays)
 
     return obj
-    
-def createTextWidget(rig, bone_name, bone_transform_name=None):
 
-    obj = custom_create_widget(rig, bone_name, bone_transform_name, mir=False, subsurf=1)
+WIDGET_SUBSURF = {'BOX': 1, 'CTRL': 1, 'TEXT': 1, 'FRAME': 0}
+
+def createGianWidget(rig, bone_name, kind, bone_transform_name=None, mirror_key=None):
+
+    # Only widgets given a mirror key are shared with the opposite side
+    obj = custom_create_widget(rig, bone_name, bone_transform_name, mir=mirror_key is not None,
+                               subsurf=WIDGET_SUBSURF[kind], mirror_key=mirror_key)
+
+    # Widgets sharing the mirror mesh are not returned, but are recorded by the generator
+    generator = BaseGenerator.instance
+    tagWidget(obj or (generator and generator.new_widget_table.get(bone_name)), kind)
 
     return obj
+
+def createBoxWidget(rig, bone_name, bone_transform_name=None, mirror_key=None):
+
+    # Only untitled boxes are mirrored, a shared title would read backwards on one side
+    return createGianWidget(rig, bone_name, 'BOX', bone_transform_name, mirror_key)
+
+def createControlWidget(rig, bone_name, bone_transform_name=None, mirror_key=None):
+  
+    return createGianWidget(rig, bone_name, 'CTRL', bone_transform_name, mirror_key)
     
-def createFrameWidget(rig, bone_name, bone_transform_name=None):
+def createTextWidget(rig, bone_name, bone_transform_name=None):
 
-    obj = custom_create_widget(rig, bone_name, bone_transform_name, mir=False, subsurf=0)
+    return createGianWidget(rig, bone_name, 'TEXT', bone_transform_name)
+    
+def createFrameWidget(rig, bone_name, bone_transform_name=None):
 
-    return obj
+    return createGianWidget(rig, bone_name, 'FRAME', bone_transform_name)
     
 def fixBoxWidget(obj, design, clp, txt, minimal, fill):
 
     if obj != None:
-        dref_obj = boxWidget(obj.name, design, clp, txt, minimal, fill)
-
-        obj.data = dref_obj.data
-        bpy.data.objects.remove(dref_obj)
-
-        obj.data.name = obj.name
-    
-        return obj
+        return fillWidget(obj, boxArrays(design, clp, txt, minimal, fill))
     
 def fixControlWidget(obj, fill_it, off):
 
     if obj != None:
-        dref_obj = ctrlWidget(obj.name, fill=fill_it, offset=off)
-
-        obj.data = dref_obj.data
-        bpy.data.objects.remove(dref_obj)
-
-        obj.data.name = obj.name 
-    
-        return obj
+        return fillWidget(obj, ctrlArrays(fill_it, off))
     
 def fixTextWidget(obj, txt):
 
     if obj != None:
-        dref_obj = textWidget(obj.name, txt)
-
-        obj.data = dref_obj.data
-        bpy.data.objects.remove(dref_obj)
-
-        obj.data.name = obj.name
+        return fillWidget(obj, textOverlayArrays(txt))
     
-        return obj
-    
-def fixFrameWidget(obj, metarig, list, title, custom_tlt, head_b):
+def fixFrameWidget(obj, rect, title, custom_tlt, head_b):
 
     if obj != None:
-        dref_obj = frameWidget(obj.name, metarig, list, title, custom_tlt, head_b)
-
-        obj.data = dref_obj.data
-        bpy.data.objects.remove(dref_obj)
-
-        obj.data.name = obj.name
-    
-        return obj
\ No newline at end of file
+        return fillWidget(obj, frameArrays(rect, title, custom_tlt, head_b))
@@ -0,0 +1,207 @@
+import time
+
+from typing import Callable, Optional
+
+"""
+WIDGET ENGINE
+
+Widget geometry is produced by interchangeable backends, each able to build some
+widget kinds ('BOX', 'CTRL', 'TEXT', 'FRAME') as mesh arrays (see utils.mesh_data):
+
+    PACK         base shapes read from the prebuilt widget pack
+    PROCEDURAL   shapes computed in Python
+    GN           Geometry Nodes evaluated and applied (always available, slowest)
+
+For each kind, the available backends are tried by decreasing priority, and a
+builder returning None passes the input to the next one (e.g. a design missing
+from the pack). Callers may force one backend per call. Every build is timed and
+reported to the timing hooks, so backends can be compared on identical inputs.
+
+utils/wgt.py registers the bundled backends; nothing in here imports bpy.
+"""
+
+
+class WidgetBackend:
+
+    """
+    A source of widget geometry.
+
+    Attributes:
+        name: The backend name, used for overrides and timings.
+        priority: Backends with a higher priority are tried first.
+        builders: The builder of each supported widget kind.
+    """
+
+    name: str
+    priority: int
+    builders: dict[str, Callable]
+
+    def __init__(self, name: str, priority: int = 0, is_available: Optional[Callable[[], bool]] = None):
+        self.name = name
+        self.priority = priority
+        self.builders = {}
+        self._is_available = is_available
+
+    def builder(self, kind: str):
+
+        """
+        Decorator registering the builder of a widget kind.
+
+        The builder returns mesh arrays, or None when it cannot build the input.
+        """
+
+        def register(func):
+            self.builders[kind] = func
+            return func
+
+        return register
+
+    def is_available(self) -> bool:
+
+        """
+        Checks the backend can run in this session (e.g. its data exists).
+        """
+
+        return self._is_available is None or self._is_available()
+
+
+_backends: dict[str, WidgetBackend] = {}
+_timing_hooks: list[Callable[[str, str, float, bool], None]] = []
+
+widget_timings: dict[tuple[str, str], list] = {}    # (kind, backend) -> [builds, seconds]
+
+
+def register_backend(backend: WidgetBackend) -> WidgetBackend:
+
+    """
+    Adds a backend to the registry, replacing any backend of the same name.
+    """
+
+    _backends[backend.name] = backend
+
+    return backend
+
+
+def get_backends(kind: str) -> list[WidgetBackend]:
+
+    """
+    Returns the available backends able to build a widget kind, by decreasing priority.
+    """
+
+    backends = [backend for backend in _backends.values()
+                if kind in backend.builders and backend.is_available()]
+
+    return sorted(backends, key=lambda backend: -backend.priority)
+
+
+def add_timing_hook(hook: Callable[[str, str, float, bool], None]):
+
+    """
+    Registers a function called after every build with (kind, backend, seconds, built).
+    """
+
+    _timing_hooks.append(hook)
+
+
+def remove_timing_hook(hook: Callable[[str, str, float, bool], None]):
+
+    """
+    Unregisters a timing hook.
+    """
+
+    if hook in _timing_hooks:
+        _timing_hooks.remove(hook)
+
+
+def _timed_build(backend: WidgetBackend, kind: str, args: tuple):
+
+    """
+    Runs one builder, recording its time.
+    """
+
+    start = time.perf_counter()
+    arrays = backend.builders[kind](*args)
+    seconds = time.perf_counter() - start
+
+    stats = widget_timings.setdefault((kind, backend.name), [0, 0.0])
+    stats[0] += 1
+    stats[1] += seconds
+
+    for hook in _timing_hooks:
+        hook(kind, backend.name, seconds, arrays is not None)
+
+    return arrays
+
+
+def build_widget(kind: str, *args, backend: Optional[str] = None):
+
+    """
+    Builds the geometry of a widget with the best backend able to.
+
+    Args:
+        kind: The widget kind.
+        args: The design inputs of the kind, as taken by its builders.
+        backend: The name of the backend to use, skipping the automatic selection.
+
+    Returns:
+        The mesh arrays of the widget.
+
+    Raises:
+        LookupError: If no (or not the requested) backend can build the input.
+    """
+
+    if backend is not None:
+        candidates = [_backends[backend]] if backend in _backends and kind in _backends[backend].builders else []
+    else:
+        candidates = get_backends(kind)
+
+    for candidate in candidates:
+        arrays = _timed_build(candidate, kind, args)
+        if arrays is not None:
+            return arrays
+
+    raise LookupError(f"No widget backend can build {kind} {args}" + (f" with {backend}" if backend else ""))
+
+
+def benchmark_backends(kind: str, *args, repeat: int = 3) -> dict[str, Optional[float]]:
+
+    """
+    Times every available backend of a kind on the same input.
+
+    Args:
+        kind: The widget kind.
+        args: The design inputs of the kind.
+        repeat: The number of builds per backend; the best time is kept.
+
+    Returns:
+        The best seconds of each backend, None for those that cannot build the input.
+    """
+
+    results = {}
+
+    for backend in get_backends(kind):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            arrays = backend.builders[kind](*args)
+            seconds = time.perf_counter() - start
+            if arrays is None:
+                best = None
+                break
+            best = seconds if best is None else min(best, seconds)
+        results[backend.name] = best
+
+    return results
+
+
+def timing_summary() -> str:
+
+    """
+    Returns the build count and time of every (kind, backend) pair, one per line.
+    """
+
+    lines = []
+    for (kind, backend), (builds, seconds) in sorted(widget_timings.items()):
+        lines.append(f"{kind:<6} {backend:<11} {builds:5d} builds {seconds * 1000:9.1f} ms")
+
+    return "\n".join(lines)
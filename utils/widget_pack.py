@@ -0,0 +1,138 @@
+import os
+import json
+import tempfile
+import numpy as np
+
+from itertools import product
+
+from .mesh_data import MeshArrays
+from .core import box_key, ctrl_key
+
+"""
+PREBUILT WIDGET PACK
+
+Every discrete base shape (untitled boxes and controls) evaluated ahead of time and
+stored in one binary file next to custom_wgts.blend:
+
+    magic (8 bytes) | header length (uint32) | JSON header | padding | raw arrays
+
+The header maps each shape key to the offset, dtype and shape of its four mesh
+arrays. The file is memory-mapped, so reading a shape only touches its own pages.
+"""
+
+WIDGET_PACK_MAGIC = b'GUIWPK01'
+WIDGET_PACK_ALIGN = 16
+WIDGET_PACK_NAME = "custom_wgts.pack"
+
+BOX_VARIANTS = list(product(('SMALL', 'LARGE'), ('NONE', 'UP', 'DOWN'), (False, True), (False, True)))
+CTRL_VARIANTS = list(product((False, True), (False, True)))
+
+MESH_FIELDS = ('verts', 'edges', 'loop_starts', 'loop_verts')
+
+WIDGET_BLEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "widget_blend")
+
+
+def pack_key(key: tuple) -> str:
+
+    """
+    Returns the string form of a shape key, as stored in the pack header.
+    """
+
+    return "|".join(str(part) for part in key)
+
+
+def widget_pack_path() -> str:
+
+    """
+    Returns the path of the widget pack of this install, next to custom_wgts.blend.
+    """
+
+    return os.path.join(WIDGET_BLEND_DIR, WIDGET_PACK_NAME)
+
+
+def write_widget_pack(path: str, shapes: dict[tuple, MeshArrays]):
+
+    """
+    Writes shapes to a widget pack file.
+
+    Args:
+        path: The pack file path.
+        shapes: The mesh arrays keyed by shape key.
+    """
+
+    entries = {}
+    blobs = []
+    offset = 0
+
+    for key, arrays in shapes.items():
+        entry = {}
+        for field in MESH_FIELDS:
+            array = np.ascontiguousarray(getattr(arrays, field))
+            array = array.astype(array.dtype.newbyteorder('<'), copy=False)
+            padding = -offset % WIDGET_PACK_ALIGN
+            blobs.append(b'\0' * padding)
+            offset += padding
+
+            entry[field] = [offset, array.dtype.str, list(array.shape)]
+            blobs.append(array.tobytes())
+            offset += array.nbytes
+        entries[pack_key(key)] = entry
+
+    header = json.dumps({"entries": entries}).encode()
+    start = len(WIDGET_PACK_MAGIC) + 4 + len(header)
+    padding = -start % WIDGET_PACK_ALIGN
+
+    # Readers may still map the old file, so it is replaced rather than truncated
+    handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+    try:
+        with os.fdopen(handle, 'wb') as file:
+            file.write(WIDGET_PACK_MAGIC)
+            file.write(np.uint32(len(header)).tobytes())
+            file.write(header)
+            file.write(b'\0' * padding)
+            for blob in blobs:
+                file.write(blob)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def read_widget_pack(path: str) -> dict[str, MeshArrays]:
+
+    """
+    Memory-maps a widget pack file.
+
+    Args:
+        path: The pack file path.
+
+    Returns:
+        The mesh arrays keyed by pack_key, as read-only views of the file.
+    """
+
+    with open(path, 'rb') as file:
+        if file.read(len(WIDGET_PACK_MAGIC)) != WIDGET_PACK_MAGIC:
+            raise ValueError(f"{path} is not a gian.ui widget pack")
+
+        length = int(np.frombuffer(file.read(4), dtype=np.uint32)[0])
+        header = json.loads(file.read(length))
+
+    start = len(WIDGET_PACK_MAGIC) + 4 + length
+    start += -start % WIDGET_PACK_ALIGN
+
+    if os.path.getsize(path) > start:
+        data = np.memmap(path, dtype=np.uint8, mode='r', offset=start)
+    else:
+        data = np.zeros(0, dtype=np.uint8)
+    shapes = {}
+
+    for key, entry in header["entries"].items():
+        fields = []
+        for field in MESH_FIELDS:
+            offset, dtype, shape = entry[field]
+            dtype = np.dtype(dtype)
+            count = int(np.prod(shape))
+            fields.append(data[offset:offset + count * dtype.itemsize].view(dtype).reshape(shape))
+        shapes[key] = MeshArrays(*fields)
+
+    return shapes
@@ -0,0 +1,206 @@
+import bpy
+import numpy as np
+
+from typing import Optional
+
+from rigify.base_generate import GeneratorPlugin
+
+"""
+BULK PLACEMENT OF WIDGET OBJECTS
+
+Every widget object sits at its bone, offset by the custom shape transform of the
+pose bone (see custom_obj_to_bone in utils/wgt.py). Instead of building one Matrix
+per widget, custom_create_widget queues the widgets of a generation and
+WidgetPlacement places them all at the end of the widget stage: bone matrices and
+custom shape transforms are read with foreach_get, the placements are composed
+with NumPy, and the current placements of the widget collection are read with one
+foreach_get, so only the queued widgets that actually moved are written.
+
+RNA matrices are flat column-major arrays, hence the transposes.
+
+WidgetIndex answers the other per-widget cost, finding the widget left by a previous
+generation: the local objects of the scene are indexed by name once, instead of a
+scene search (and a full scan when the name resolves to a linked object) per widget.
+"""
+
+
+def shape_matrices(loc: np.ndarray, rot: np.ndarray, scale: np.ndarray) -> np.ndarray:
+
+    """
+    Builds custom shape offset matrices, like Matrix.LocRotScale with XYZ Euler angles.
+
+    Args:
+        loc: The (N, 3) translations.
+        rot: The (N, 3) XYZ Euler rotations, in radians.
+        scale: The (N, 3) scales.
+
+    Returns:
+        The (N, 4, 4) row-major matrices.
+    """
+
+    cx, cy, cz = np.cos(rot).T
+    sx, sy, sz = np.sin(rot).T
+
+    # Rz @ Ry @ Rx
+    matrices = np.zeros((len(loc), 4, 4))
+    matrices[:, 0, 0] = cy * cz
+    matrices[:, 0, 1] = sx * sy * cz - cx * sz
+    matrices[:, 0, 2] = cx * sy * cz + sx * sz
+    matrices[:, 1, 0] = cy * sz
+    matrices[:, 1, 1] = sx * sy * sz + cx * cz
+    matrices[:, 1, 2] = cx * sy * sz - sx * cz
+    matrices[:, 2, 0] = -sy
+    matrices[:, 2, 1] = sx * cy
+    matrices[:, 2, 2] = cx * cy
+    matrices[:, :3, :3] *= scale[:, None, :]
+    matrices[:, :3, 3] = loc
+    matrices[:, 3, 3] = 1.0
+
+    return matrices
+
+
+def _read(collection, prop: str, count: int, width: int, dtype=np.float64) -> np.ndarray:
+
+    """
+    Reads a property of every item of a collection with one foreach_get.
+    """
+
+    array = np.empty(count * width, dtype=dtype)
+    collection.foreach_get(prop, array)
+
+    return array.reshape(count, width) if width > 1 else array
+
+
+def place_widgets(rig, entries: list[tuple], collection=None):
+
+    """
+    Places widget objects at their bones, like custom_obj_to_bone for each of them.
+
+    Args:
+        rig: The armature object.
+        entries: The (widget object, bone name, transform bone name or None) to place.
+        collection: The collection holding the widgets, read in one pass when given to skip
+            the widgets already in place.
+    """
+
+    if not entries:
+        return
+
+    pose_bones = rig.pose.bones
+    count = len(pose_bones)
+    index = {pbone.name: i for i, pbone in enumerate(pose_bones)}
+
+    loc = _read(pose_bones, 'custom_shape_translation', count, 3)
+    rot = _read(pose_bones, 'custom_shape_rotation_euler', count, 3)
+    scale = _read(pose_bones, 'custom_shape_scale_xyz', count, 3)
+    bone_size = _read(pose_bones, 'use_custom_shape_bone_size', count, 1, bool)
+    length = _read(pose_bones, 'length', count, 1)
+
+    # Pose channels are not guaranteed to follow the order of the armature bones
+    bones = rig.data.bones
+    bone_index = {bone.name: i for i, bone in enumerate(bones)}
+    rest = _read(bones, 'matrix_local', len(bones), 16).reshape(-1, 4, 4).transpose(0, 2, 1)
+
+    rows = np.array([index[bone_name] for _, bone_name, _ in entries], dtype=np.int64)
+    targets = []
+    for _, bone_name, transform_name in entries:
+        if transform_name is None:
+            transform = pose_bones[bone_name].custom_shape_transform
+            transform_name = transform.name if transform else bone_name
+        targets.append(bone_index[transform_name])
+
+    scale = scale[rows] * np.where(bone_size[rows], length[rows], 1.0)[:, None]
+    world = np.array(rig.matrix_world)
+    matrices = world @ rest[targets] @ shape_matrices(loc[rows], rot[rows], scale)
+
+    objects = [obj for obj, _, _ in entries]
+    for obj in objects:
+        if obj.rotation_mode != 'XYZ':
+            obj.rotation_mode = 'XYZ'
+
+    # Writing a matrix tags the object for update even when unchanged: compare first.
+    # Only the queued widgets are written, other objects of the collection are left alone
+    moved = np.ones(len(objects), dtype=bool)
+    if collection is not None:
+        slots = {obj.as_pointer(): i for i, obj in enumerate(collection.objects)}
+        inside = np.array([obj.as_pointer() in slots for obj in objects], dtype=bool)
+        if inside.any():
+            current = _read(collection.objects, 'matrix_basis', len(slots), 16).reshape(-1, 4, 4)
+            placed = [slots[objects[i].as_pointer()] for i in np.nonzero(inside)[0]]
+            same = np.isclose(current[placed].transpose(0, 2, 1), matrices[inside], rtol=0.0, atol=1e-6)
+            moved[inside] = ~same.all(axis=(1, 2))
+
+    for i in np.nonzero(moved)[0]:
+        objects[i].matrix_basis = matrices[i].tolist()
+
+
+class WidgetPlacement(GeneratorPlugin):
+
+    """
+    Queues the widget objects of a generation and places them all at once.
+
+    The plugin stage runs after the generate_widgets of every rig, so the custom
+    shape transforms it reads are final.
+
+    Attributes:
+        entries: The (widget object, bone name, transform bone name) to place.
+    """
+
+    entries: list[tuple]
+
+    def __init__(self, generator):
+        super().__init__(generator)
+
+        self.entries = []
+
+    def add(self, obj, bone_name: str, bone_transform_name: Optional[str] = None):
+
+        """
+        Queues a widget object for placement.
+        """
+
+        self.entries.append((obj, bone_name, bone_transform_name))
+
+    def generate_widgets(self):
+        place_widgets(self.obj, self.entries, self.generator.widget_collection)
+        self.entries.clear()
+
+
+class WidgetIndex(GeneratorPlugin):
+
+    """
+    Name index of the local objects of the scene, built once per generation.
+
+    Widgets are only ever reused from local objects, so library objects are left
+    out of the index whatever their name.
+
+    Attributes:
+        local: The local objects of the scene, by name.
+        created: The widget objects created by this generation, in creation order.
+    """
+
+    local: dict[str, bpy.types.Object]
+    created: list[bpy.types.Object]
+
+    def __init__(self, generator):
+        super().__init__(generator)
+
+        self.local = {obj.name: obj for obj in bpy.context.scene.objects if obj.library is None}
+        self.created = []
+
+    def find(self, name: str) -> Optional[bpy.types.Object]:
+
+        """
+        Returns the local scene object with this name, or None.
+        """
+
+        return self.local.get(name)
+
+    def add(self, obj):
+
+        """
+        Indexes an object created during the generation.
+        """
+
+        self.local[obj.name] = obj
+        self.created.append(obj)